@@ -0,0 +1,70 @@
+"""콘솔 블록 조립기 벤치마크.
+
+채널에 쌓인 메시지 수가 늘어나도 메시지당 처리 비용이 일정한지 확인한다.
+비교 대상으로 메시지가 도착할 때마다 최근 50개 메시지를 다시 분리하던 기존 방식을 함께 측정한다.
+
+    python -m benchmarks.bench_console_assembler
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.utils import ConsoleBlockAssembler, extract_console_blocks  # noqa: E402
+
+SEPARATOR = "-" * 50
+VOLUMES = (1_000, 10_000, 100_000)
+LEGACY_WINDOW = 50
+
+
+def _generate_messages(count: int, seed: int = 1245) -> List[str]:
+    """cmi info 블록과 일반 로그가 섞인 가상의 콘솔 메시지 생성."""
+    rng = random.Random(seed)
+    messages: List[str] = []
+    while len(messages) < count:
+        if rng.random() < 0.3:
+            name = f"player{rng.randrange(10_000)}"
+            messages.append(f"[일 10:57:46 INFO] {SEPARATOR}\n[일 10:57:46 INFO] {name} Prefix: Suffix:")
+            messages.append(f"[일 10:57:46 INFO] UUID: {rng.getrandbits(128):032x}")
+            messages.append(f"[일 10:57:46 INFO] Ip: 10.0.{rng.randrange(256)}.{rng.randrange(256)}\n[일 10:57:46 INFO] {SEPARATOR}")
+        else:
+            messages.append("\n".join(
+                f"[일 10:57:46 INFO] player{rng.randrange(10_000)} issued server command: /spawn"
+                for _ in range(rng.randint(1, 5))
+            ))
+    return messages[:count]
+
+
+def bench_assembler(messages: List[str]) -> float:
+    """조립기의 메시지당 평균 처리 시간 (마이크로초)."""
+    assembler = ConsoleBlockAssembler()
+    start = time.perf_counter()
+    for message_id, content in enumerate(messages, start=1):
+        assembler.feed(message_id, content.split("\n"))
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+def bench_legacy(messages: List[str]) -> float:
+    """도착할 때마다 최근 50개 메시지를 다시 분리하는 기존 방식의 메시지당 평균 처리 시간."""
+    start = time.perf_counter()
+    for index in range(1, len(messages) + 1):
+        extract_console_blocks(messages[max(0, index - LEGACY_WINDOW):index])
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+def main() -> None:
+    print(f"{'messages':>10} {'assembler us/msg':>18} {'legacy us/msg':>15}")
+    for volume in VOLUMES:
+        messages = _generate_messages(volume)
+        assembler_cost = bench_assembler(messages)
+        legacy_cost = bench_legacy(messages[:10_000])
+        print(f"{volume:>10} {assembler_cost:>18.2f} {legacy_cost:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""콘솔 파서 벤치마크.
+
+`benchmarks/corpus`의 기록된 `cmi info`/`list` 출력과 이를 변형한 입력으로
+현재 파서와 기존 파서(`benchmarks.legacy_parsers`)의 결과가 같은지 확인한 뒤
+호출당 평균 처리 시간을 비교한다. 결과가 하나라도 다르면 종료 코드 1로 끝난다.
+
+    python -m benchmarks.bench_console_parser
+"""
+from __future__ import annotations
+
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.legacy_parsers import (  # noqa: E402
+    LegacyConsoleResponseParser,
+    legacy_parse_player_info,
+)
+from utils.utils import ConsoleResponseParser, parse_player_info  # noqa: E402
+
+CORPUS_DIR = Path(__file__).resolve().parent / "corpus"
+ITERATIONS = 2_000
+VARIANTS = 500
+
+
+def load_corpus(kind: str, pattern: str = "*.txt") -> List[Tuple[str, str]]:
+    """corpus/<kind>/의 파일을 (파일명, 내용) 목록으로 로드."""
+    return [
+        (path.name, path.read_text(encoding="utf-8"))
+        for path in sorted((CORPUS_DIR / kind).glob(pattern))
+    ]
+
+
+def _player_of(output: str) -> str:
+    for line in output.split("\n"):
+        words = line.split("] ", 1)[-1].split()
+        if words and "Prefix:" in line:
+            return words[0]
+    return "Steve"
+
+
+def _variants(samples: List[Tuple[str, str]], count: int, seed: int = 1245) -> List[Tuple[str, str]]:
+    """기록된 출력의 줄 순서를 섞고 잡음 줄을 끼워 넣은 변형 입력."""
+    rng = random.Random(seed)
+    noise = [
+        "[일 10:57:46 INFO ] Balance: 10",
+        "[일 10:57:46 INFO ] UUID: not-a-uuid",
+        "[일 10:57:46 INFO ] Ip: 999.1.1.1",
+        "[일 10:57:46 INFO ] Balance: 10 UUID: 0f1e2d3c4b5a49788695a4b3c2d1e0f9 Ip: 10.0.0.1",
+        "[일 10:57:46 INFO ] (UUID: 5c1a9e2b-7d3f-4a61-9b0e-2f4c8d6a1e37) Ip:",
+        "[일 10:57:46 INFO ] UUID: Ip: 172.16.0.9",
+        "[일 10:57:46 INFO ] ==========",
+        "[일 10:57:46 INFO ] mod :Steve",
+        "[일 10:57:46 INFO ] Admin:   ",
+        "lite: 녹차,, 아자",
+        "",
+        "   ",
+    ]
+    variants: List[Tuple[str, str]] = []
+    for index in range(count):
+        name, output = rng.choice(samples)
+        lines = output.split("\n")
+        body = lines[1:]
+        rng.shuffle(body)
+        for _ in range(rng.randint(0, 3)):
+            body.insert(rng.randint(0, len(body)), rng.choice(noise))
+        variants.append((f"{name}#{index}", "\n".join(lines[:1] + body)))
+    return variants
+
+
+def _as_dict(record: Any) -> Optional[Dict[str, Any]]:
+    """PlayerInfo/OnlineSnapshot을 기존 파서의 dict 형식으로 (기존 파서에 없는 playtime 제외)."""
+    if record is None:
+        return None
+    data = record.to_dict()
+    data.pop("playtime", None)
+    return data
+
+
+def check_equivalence() -> List[str]:
+    """현재 파서와 기존 파서의 결과가 다른 입력 목록."""
+    mismatches: List[str] = []
+    info_samples = load_corpus("cmi_info")
+    for name, output in info_samples + _variants(info_samples, VARIANTS):
+        player = _player_of(output)
+        if _as_dict(parse_player_info(output, player)) != legacy_parse_player_info(output, player):
+            mismatches.append(f"parse_player_info: {name}")
+        if ConsoleResponseParser.parse_player_info(output) != LegacyConsoleResponseParser.parse_player_info(output):
+            mismatches.append(f"ConsoleResponseParser.parse_player_info: {name}")
+
+    list_samples = load_corpus("list")
+    for name, output in list_samples + _variants(list_samples, VARIANTS):
+        if _as_dict(ConsoleResponseParser.parse_player_list(output)) != LegacyConsoleResponseParser.parse_player_list(output):
+            mismatches.append(f"parse_player_list: {name}")
+    return mismatches
+
+
+def bench(func: Callable[..., Any], inputs: List[Tuple[Any, ...]], iterations: int = ITERATIONS) -> float:
+    """입력 하나당 평균 처리 시간 (마이크로초)."""
+    start = time.perf_counter()
+    for _ in range(iterations // len(inputs) + 1):
+        for args in inputs:
+            func(*args)
+    calls = (iterations // len(inputs) + 1) * len(inputs)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> int:
+    # 운영 환경처럼 INFO 로그는 출력되지 않는 상태에서 측정
+    logging.disable(logging.ERROR)
+
+    mismatches = check_equivalence()
+    for mismatch in mismatches:
+        print(f"결과 불일치: {mismatch}")
+
+    info_inputs = [(output, _player_of(output)) for _, output in load_corpus("cmi_info")]
+    list_inputs = [(output,) for _, output in load_corpus("list")]
+    rows = [
+        ("parse_player_info", bench(parse_player_info, info_inputs), bench(legacy_parse_player_info, info_inputs)),
+        (
+            "parse_player_list",
+            bench(ConsoleResponseParser.parse_player_list, list_inputs),
+            bench(LegacyConsoleResponseParser.parse_player_list, list_inputs),
+        ),
+    ]
+
+    print(f"{'parser':<20} {'current us':>12} {'legacy us':>12} {'speedup':>8}")
+    for name, current, legacy in rows:
+        print(f"{name:<20} {current:>12.2f} {legacy:>12.2f} {legacy / current:>7.2f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
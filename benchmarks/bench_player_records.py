@@ -0,0 +1,84 @@
+"""플레이어 레코드 메모리 벤치마크.
+
+같은 플레이어 정보를 기존 dict, PlayerInfo, `PlayerInfo.pack()` 튜플로 N명 만들어
+한 명당 메모리 사용량(tracemalloc 기준)을 비교한다. total은 문자열을 포함한 전체,
+container는 문자열을 미리 만들어 둔 뒤 레코드 객체만 측정한 값이다.
+
+    python -m benchmarks.bench_player_records [N]
+"""
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.models import STATUS_ONLINE, PlayerInfo  # noqa: E402
+
+Fields = Tuple[str, str, str, str]
+DEFAULT_COUNT = 5_000
+
+
+def _fields(index: int) -> Fields:
+    # 실제 파싱 결과처럼 매번 새로 만든 문자열 (상태는 공유 상수)
+    return (
+        f"Player{index:05d}",
+        f"{index:08x}-0000-4000-8000-{index:012x}",
+        f"10.{index % 256}.{index // 256 % 256}.*",
+        STATUS_ONLINE,
+    )
+
+
+def _as_dict(fields: Fields) -> Any:
+    username, uuid, ip, status = fields
+    return {"username": username, "display_name": None, "status": status, "uuid": uuid, "ip": ip}
+
+
+def _as_record(fields: Fields) -> Any:
+    return PlayerInfo(*fields)
+
+
+def _as_packed(fields: Fields) -> Any:
+    return PlayerInfo(*fields).pack()
+
+
+def _measure(build: Callable[[], List[Any]], count: int) -> float:
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        records = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del records
+    return (after - before) / count
+
+
+def bytes_per_player(make: Callable[[Fields], Any], count: int) -> Tuple[float, float]:
+    """(문자열 포함 전체, 레코드 객체만) 한 명당 바이트."""
+    total = _measure(lambda: [make(_fields(index)) for index in range(count)], count)
+    prebuilt = [_fields(index) for index in range(count)]
+    container = _measure(lambda: [make(fields) for fields in prebuilt], count)
+    return total, container
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    rows = [
+        (name, *bytes_per_player(make, count))
+        for name, make in (("dict", _as_dict), ("PlayerInfo", _as_record), ("PlayerInfo.pack()", _as_packed))
+    ]
+    base_total, base_container = rows[0][1], rows[0][2]
+    print(f"{'record':<20} {'total B':>9} {'vs dict':>8} {'container B':>12} {'vs dict':>8}")
+    for name, total, container in rows:
+        print(
+            f"{name:<20} {total:>9.0f} {total / base_total:>7.0%} "
+            f"{container:>12.0f} {container / base_container:>7.0%}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
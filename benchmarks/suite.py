@@ -0,0 +1,234 @@
+"""파서 벤치마크 모음.
+
+`benchmarks/corpus`의 기록된 콘솔 출력과 마인리스트 추천 페이지, 차단 로그 메시지로 각 파서의
+초당 처리 횟수, 호출당 p50/p99 시간, 호출당 최대 할당량을 측정한다. 차단 로그 닉네임 검색은
+고정 시드로 만든 이름 NAME_INDEX_SIZE개의 색인에서 측정한다.
+네트워크나 디스코드 연결 없이 실행되며, JSON으로 저장한 결과를 다른 커밋의
+결과와 비교할 수 있다.
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --json bench.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.15
+
+--compare를 지정하면 p50이 기준보다 threshold 이상 느려진 항목이 있을 때 종료 코드 1로 끝난다.
+beautifulsoup4가 없으면 추천 페이지 항목은 건너뛴다.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.bench_console_parser import _player_of, load_corpus  # noqa: E402
+from core.ban_log import KIND_BAN, KIND_UPLOAD, KIND_YAKTAL, BanLogRecord, read_ban_log  # noqa: E402
+from core.models import PlayerInfo  # noqa: E402
+from core.name_search import NameSearchIndex  # noqa: E402
+from utils.utils import ConsoleResponseParser, extract_console_blocks, parse_player_info  # noqa: E402
+
+SCHEMA_VERSION = 1
+MIN_CALLS = 2_000
+MIN_SECONDS = 0.5
+ALLOC_CALLS = 200
+NAME_INDEX_SIZE = 30_000
+
+
+@dataclass
+class Case:
+    """벤치마크 항목: 같은 함수를 여러 입력에 돌아가며 호출한다."""
+
+    name: str
+    func: Callable[..., Any]
+    inputs: Sequence[Tuple[Any, ...]]
+
+
+@dataclass
+class Result:
+    name: str
+    calls: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    peak_alloc_bytes: int
+
+
+def _ban_log_messages(with_payload: bool) -> List[Tuple[Any, ...]]:
+    """세 가지 차단 로그 형식의 메시지 (꼬리말 레코드 유무 선택)."""
+    messages = []
+    for kind in (KIND_BAN, KIND_UPLOAD, KIND_YAKTAL):
+        for player in (PlayerInfo("Player01", "0f3c2a1b-0000-4000-8000-00000000abcd", "10.0.1.*"), PlayerInfo("Player02")):
+            record = BanLogRecord.from_player(kind, player, "핵 사용 (킬오라)")
+            footer = SimpleNamespace(text=record.encode())
+            embeds = [SimpleNamespace(footer=footer)] if with_payload else []
+            messages.append((SimpleNamespace(content=record.render(), embeds=embeds),))
+    return messages
+
+
+def _name_search_inputs() -> List[Tuple[Any, ...]]:
+    """합성 닉네임 색인과 검색어 (정확히 일치, 대소문자, 접두사, 오타, 숫자 치환, 없는 이름)."""
+    rng = random.Random(25)
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789_"
+    names = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 16)))
+        for _ in range(NAME_INDEX_SIZE)
+    ]
+    names += ["Steve", "St3ve_", "SteveKR", "Steev"]
+    index = NameSearchIndex(names)
+    queries = ["Steve", "STEVE", "stev", "steev", "st3ve", names[0], names[1][:3], "NoSuchPlayer99"]
+    return [(index, query) for query in queries]
+
+
+def build_cases() -> List[Case]:
+    """코퍼스에서 벤치마크 항목 생성."""
+    info_outputs = [output for _, output in load_corpus("cmi_info")]
+    list_outputs = [output for _, output in load_corpus("list")]
+    messages = info_outputs + list_outputs
+
+    cases = [
+        Case("parse_player_info", parse_player_info, [(o, _player_of(o)) for o in info_outputs]),
+        Case("ConsoleResponseParser.parse_player_info", ConsoleResponseParser.parse_player_info, [(o,) for o in info_outputs]),
+        Case("ConsoleResponseParser.parse_player_list", ConsoleResponseParser.parse_player_list, [(o,) for o in list_outputs]),
+        Case("extract_console_blocks", extract_console_blocks, [(messages,)]),
+        Case("read_ban_log (payload)", read_ban_log, _ban_log_messages(with_payload=True)),
+        Case("read_ban_log (legacy)", read_ban_log, _ban_log_messages(with_payload=False)),
+        Case("NameSearchIndex.search", NameSearchIndex.search, _name_search_inputs()),
+    ]
+
+    try:
+        from utils.vote_parser import parse_vote_page
+    except ImportError:
+        print("beautifulsoup4 미설치: parse_vote_page 건너뜀", file=sys.stderr)
+    else:
+        pages = [page for _, page in load_corpus("minelist", "*.html")]
+        cases.append(Case("parse_vote_page", parse_vote_page, [(page,) for page in pages]))
+
+    return cases
+
+
+def measure(case: Case) -> Result:
+    """호출마다 시간을 재서 분위수를 구하고, 별도 구간에서 tracemalloc으로 할당량을 측정."""
+    for args in case.inputs:
+        case.func(*args)
+
+    timings: List[int] = []
+    started = time.perf_counter()
+    while len(timings) < MIN_CALLS or time.perf_counter() - started < MIN_SECONDS:
+        for args in case.inputs:
+            begin = time.perf_counter_ns()
+            case.func(*args)
+            timings.append(time.perf_counter_ns() - begin)
+    total_ns = sum(timings)
+
+    # 측정 구간과 분리해야 tracemalloc의 오버헤드가 시간에 섞이지 않는다
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for index in range(ALLOC_CALLS):
+            args = case.inputs[index % len(case.inputs)]
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            case.func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    quantiles = statistics.quantiles(timings, n=100, method="inclusive")
+    return Result(
+        name=case.name,
+        calls=len(timings),
+        ops_per_sec=len(timings) / (total_ns / 1e9),
+        p50_us=quantiles[49] / 1e3,
+        p99_us=quantiles[98] / 1e3,
+        peak_alloc_bytes=int(statistics.median(peaks)),
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def to_json(results: List[Result]) -> Dict[str, Any]:
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare(results: List[Result], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """기준 결과 대비 p50 변화 출력, threshold 이상 느려진 항목 반환."""
+    regressions: List[str] = []
+    base_results = baseline.get("results", {})
+    print(f"\n기준: {baseline.get('meta', {}).get('commit') or '알 수 없음'}")
+    print(f"{'case':<42} {'base p50':>10} {'p50':>10} {'change':>8}")
+    for result in results:
+        base = base_results.get(result.name)
+        if not base:
+            print(f"{result.name:<42} {'-':>10} {result.p50_us:>10.2f} {'new':>8}")
+            continue
+        change = result.p50_us / base["p50_us"] - 1
+        flag = " !" if change > threshold else ""
+        print(f"{result.name:<42} {base['p50_us']:>10.2f} {result.p50_us:>10.2f} {change:>+7.1%}{flag}")
+        if change > threshold:
+            regressions.append(result.name)
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="파서 벤치마크")
+    parser.add_argument("--json", type=Path, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", type=Path, help="비교할 기준 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 볼 p50 증가율 (기본 0.10)")
+    parser.add_argument("-k", "--filter", default="", help="이름에 이 문자열이 포함된 항목만 실행")
+    args = parser.parse_args(argv)
+
+    # 운영 환경처럼 INFO 로그는 출력되지 않는 상태에서 측정
+    logging.disable(logging.ERROR)
+
+    results = [measure(case) for case in build_cases() if args.filter in case.name]
+
+    print(f"{'case':<42} {'ops/sec':>12} {'p50 us':>10} {'p99 us':>10} {'peak alloc':>11}")
+    for result in results:
+        print(
+            f"{result.name:<42} {result.ops_per_sec:>12,.0f} {result.p50_us:>10.2f} "
+            f"{result.p99_us:>10.2f} {result.peak_alloc_bytes:>10,}B"
+        )
+
+    if args.json:
+        args.json.write_text(json.dumps(to_json(results), indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
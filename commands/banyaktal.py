@@ -1,13 +1,12 @@
 """약탈 및 테러 차단 명령어."""
-import asyncio
 import logging
-from typing import Dict, Tuple
 
 import discord
 
-from core.command_bridge import send_console_command, send_proxy_command
-from core.config import get_config
-from utils.constants import INFO_DELAY
+from core.base import CommandResult
+from core.command_bridge import send_proxy_command
+from core.models import PlayerInfo
+from core.player_info import PlayerInfoService
 from utils.decorators import check_staff_permission
 from utils.utils import CommandLogger, create_embed
 
@@ -16,169 +15,30 @@ MIN_NAME_LEN = 3
 
 
 async def execute_banyaktal_action(
-    player: str, reason: str, bot, ctx: discord.ApplicationContext
-) -> Tuple[bool, Dict[str, str]]:
+    player: str, reason: str, bot, ctx: discord.ApplicationContext, refresh: bool = False
+) -> CommandResult[PlayerInfo]:
     """약탈 및 테러 차단 실행 및 플레이어 정보 수집."""
-    config = get_config()
-    
     try:
         # .s ilunar .s ilunar banyaktal 닉네임 (세부사유) 형식으로 전송
         formatted_reason = f"({reason})" if reason and reason != "사유 없음" else ""
         command = f".s ilunar .s ilunar banyaktal {player} {formatted_reason}".strip()
         
         if not await send_proxy_command(bot, command, ctx):
-            return False, {"error": "차단 명령어 전송 실패"}
+            return CommandResult.failure("차단 명령어 전송 실패")
         
-        player_info = await _collect_player_info(player, bot, ctx, config)
+        lookup = await PlayerInfoService().lookup(bot, player, ctx.user.mention, refresh)
         
-        return True, player_info
+        return CommandResult.success_with(lookup.info)
     except Exception as e:
         logger.error(f"약탈 및 테러 차단 오류: {e}")
-        return False, {"error": str(e)}
-
-
-async def _collect_player_info(
-    player: str,
-    bot,
-    ctx: discord.ApplicationContext,
-    config,
-    max_retries: int = 2
-) -> Dict[str, str]:
-    """플레이어 정보 수집 (재시도 로직 포함)."""
-    from utils.utils import ConsoleResponseHandler, parse_player_info
-    
-    for attempt in range(max_retries):
-        try:
-            if not await send_console_command(
-                bot, 
-                f"cmi info {player}", 
-                ctx.user.mention, 
-                silent=True
-            ):
-                if attempt == max_retries - 1:
-                    logger.error(f"플레이어 정보 조회 실패: {player}")
-                    continue
-                await asyncio.sleep(1)
-                continue
-            
-            wait_time = INFO_DELAY + 2.0 + (attempt * 2.0)
-            await asyncio.sleep(INFO_DELAY)
-            
-            response_handler = ConsoleResponseHandler(
-                bot, 
-                config.ILUNAR_CONSOLE_CHANNEL_ID
-            )
-            
-            keywords = [player, "UUID:", "Ip:", "Prefix:", "PlayTime:"]
-            console_response = await response_handler.wait_for_response(
-                ctx.user.mention, 
-                timeout=wait_time,
-                keywords=keywords
-            )
-            
-            if console_response:
-                logger.info(f"콘솔 응답 수신 (시도 {attempt + 1}, 길이: {len(console_response)}자)")
-                logger.debug(f"응답 내용 (첫 200자): {console_response[:200]}")
-                
-                player_info = parse_player_info(console_response, player)
-                
-                if player_info:
-                    has_uuid = player_info.get("uuid") is not None
-                    has_ip = player_info.get("ip") is not None
-                    
-                    logger.info(
-                        f"파싱 결과: {player} | "
-                        f"UUID: {'✓ ' + player_info.get('uuid', '')[:8] + '...' if has_uuid else '✗'} | "
-                        f"IP: {'✓ ' + player_info.get('ip', '') if has_ip else '✗'}"
-                    )
-                    
-                    # UUID나 IP 중 하나라도 있으면 성공
-                    if has_uuid or has_ip:
-                        if not has_uuid:
-                            player_info["uuid"] = "알 수 없음"
-                        if not has_ip:
-                            player_info["ip"] = "알 수 없음"
-                        return player_info
-                    else:
-                        logger.warning(f"UUID/IP 모두 누락: {player}")
-                else:
-                    logger.warning(f"파싱 실패 (시도 {attempt + 1}): {player}")
-            else:
-                logger.warning(f"콘솔 응답 없음 (시도 {attempt + 1}): {player}")
-            
-            # 마지막 시도가 아니면 잠시 대기 후 재시도
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2)
-        
-        except Exception as e:
-            logger.error(f"플레이어 정보 수집 중 오류 (시도 {attempt + 1}): {e}")
-            if attempt == max_retries - 1:
-                break
-    
-    # 모든 시도 실패 시 기본값 반환
-    logger.warning(f"플레이어 정보 수집 최종 실패, 기본값 사용: {player}")
-    return {
-        "username": player,
-        "uuid": "알 수 없음",
-        "ip": "알 수 없음"
-    }
-
-
-async def _upload_ban_log(
-    config, 
-    bot, 
-    player_info: Dict[str, str], 
-    reason: str
-) -> str:
-    if not config.BAN_LOG_CHANNEL_ID:
-        return None
-    
-    try:
-        guild = bot.get_guild(config.TARGET_GUILD_ID)
-        if not guild:
-            logger.warning(f"길드를 찾을 수 없음 (ID: {config.TARGET_GUILD_ID})")
-            return None
-        
-        ban_log_channel = guild.get_channel(config.BAN_LOG_CHANNEL_ID)
-        if not ban_log_channel:
-            logger.warning(
-                f"차단 로그 채널을 찾을 수 없음 "
-                f"(ID: {config.BAN_LOG_CHANNEL_ID})"
-            )
-            return None
-        
-        # UUID와 IP 표시 형식 (알 수 없는 경우 처리)
-        uuid_display = player_info.get('uuid', '알 수 없음')
-        if uuid_display == "알 수 없음":
-            uuid_display = "`알 수 없음` ⚠️"
-        else:
-            uuid_display = uuid_display
-        
-        ip_display = player_info.get('ip', '알 수 없음')
-        if ip_display == "알 수 없음":
-            ip_display = "`알 수 없음` ⚠️"
-        else:
-            ip_display = ip_display
-        
-        log_message = f"""## <:hr_ban:1350451179683057764> 약탈 및 테러 차단 로그
-
-`Username` `{player_info['username']}`
-`UUID` {uuid_display}
-`IP` {ip_display}
-`차단 사유` 약탈 및 테러({reason})"""
-        
-        sent_message = await ban_log_channel.send(log_message)
-        return sent_message.jump_url
-        
-    except Exception as e:
-        logger.error(f"차단 로그 업로드 실패: {e}")
-        return None
+        return CommandResult.failure(str(e))
 
 
 async def handle_banyaktal_command(
     ctx: discord.ApplicationContext, 
     player: str, 
-    reason: str = "사유 없음"
+    reason: str = "사유 없음",
+    refresh: bool = False
 ) -> None:
     """약탈 및 테러 차단 명령어 처리."""
     command_logger = CommandLogger()
@@ -212,11 +72,12 @@ async def handle_banyaktal_command(
     await ctx.defer(ephemeral=False)
     await ctx.edit(embed=processing_embed)
     
-    success, player_info = await execute_banyaktal_action(
+    result = await execute_banyaktal_action(
         player, 
         reason, 
         ctx.bot, 
-        ctx
+        ctx,
+        refresh
     )
     
     await command_logger.log_command_usage(
@@ -225,13 +86,13 @@ async def handle_banyaktal_command(
         {
             "player": player,
             "reason": reason,
-            "player_info": player_info if success else None
+            "player_info": result.data.to_dict() if result else None
         },
-        success=success
+        success=result.success
     )
     
     result_embed = _create_result_embed(
-        player, reason, success, player_info, ctx
+        player, reason, result, ctx
     )
     await ctx.edit(embed=result_embed)
 
@@ -239,11 +100,11 @@ async def handle_banyaktal_command(
 def _create_result_embed(
     player: str,
     reason: str,
-    success: bool,
-    player_info: Dict[str, str],
+    result: CommandResult[PlayerInfo],
     ctx: discord.ApplicationContext
 ) -> discord.Embed:
-    if success:
+    if result:
+        player_info = result.data
         embed = create_embed(
             title="약탈 및 테러 차단 완료",
             description=(
@@ -259,20 +120,16 @@ def _create_result_embed(
         )
         embed.add_field(
             name="🆔 UUID", 
-            value=f"`{player_info['uuid']}`", 
+            value=f"`{player_info.uuid_display}`", 
             inline=False
         )
         embed.add_field(
             name="🌐 IP", 
-            value=f"`{player_info['ip']}`", 
+            value=f"`{player_info.ip_display}`", 
             inline=False
         )
     else:
-        error_detail = (
-            player_info.get('error', '알 수 없는 오류') 
-            if player_info 
-            else '알 수 없는 오류'
-        )
+        error_detail = result.error_message or '알 수 없는 오류'
         embed = create_embed(
             title="약탈 및 테러 차단 실패",
             description=(
@@ -297,6 +154,7 @@ def setup(bot) -> None:
     async def banyaktal_func(
         ctx: discord.ApplicationContext,
         player: str = discord.Option(str, description="차단할 플레이어 이름"),
-        reason: str = discord.Option(str, description="세부 사유 (선택)", default="사유 없음")
+        reason: str = discord.Option(str, description="세부 사유 (선택)", default="사유 없음"),
+        refresh: bool = discord.Option(bool, description="캐시를 무시하고 콘솔에서 다시 조회", default=False)
     ) -> None:
-        await handle_banyaktal_command(ctx, player, reason)
+        await handle_banyaktal_command(ctx, player, reason, refresh)
@@ -6,11 +6,11 @@ import discord
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 import time
 
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
+from utils.vote_parser import parse_vote_page
 
 logger = logging.getLogger(__name__)
 
@@ -80,82 +80,7 @@ def _fetch_vote_info(url: str, chrome_options: Options) -> Dict[str, str]:
         
         time.sleep(3)
         
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
-        
-        # 404 페이지 체크
-        title = soup.find('title')
-        if title:
-            title_text = title.get_text(strip=True)
-            if '404' in title_text or '찾을 수 없' in title_text:
-                return {
-                    "status": "not_found",
-                    "error": "해당 추천 고유번호를 찾을 수 없습니다."
-                }
-        
-        # 추천 성공 여부 확인
-        success = '추천이 성공하였습니다' in page_source or '추천 성공' in page_source
-        
-        # 정보 추출
-        game_id = "N/A"
-        vote_time = "N/A"
-        server_name = "N/A"
-        
-        # 방법 1: tbody > tr > td 구조
-        tbody = soup.find('tbody')
-        if tbody:
-            rows = tbody.find_all('tr')
-            for row in rows:
-                cells = row.find_all('td')
-                if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
-                    
-                    if '게임 아이디' in label or '계임 아이디' in label or '아이디' in label:
-                        game_id = value
-                    elif '추천 시간' in label or '시간' in label:
-                        vote_time = value
-                    elif '추천한 서비' in label or '서버' in label:
-                        server_name = value
-        
-        # 방법 2: 모든 테이블 행 검색
-        if game_id == "N/A" or vote_time == "N/A" or server_name == "N/A":
-            all_rows = soup.find_all('tr')
-            for row in all_rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
-                    
-                    if '게임 아이디' in label or '계임 아이디' in label or '아이디' in label:
-                        game_id = value
-                    elif '추천 시간' in label or '시간' in label:
-                        vote_time = value
-                    elif '추천한 서비' in label or '서버' in label:
-                        server_name = value
-        
-        # 방법 3: 텍스트에서 직접 검색
-        if game_id == "N/A" or vote_time == "N/A" or server_name == "N/A":
-            all_text = soup.get_text()
-            lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-            
-            for i, line in enumerate(lines):
-                if ('게임 아이디' in line or '계임 아이디' in line) and i + 1 < len(lines):
-                    if game_id == "N/A":
-                        game_id = lines[i + 1]
-                elif '추천 시간' in line and i + 1 < len(lines):
-                    if vote_time == "N/A":
-                        vote_time = lines[i + 1]
-                elif '추천한 서비' in line and i + 1 < len(lines):
-                    if server_name == "N/A":
-                        server_name = lines[i + 1]
-        
-        return {
-            "status": "success" if success else "unknown",
-            "game_id": game_id,
-            "vote_time": vote_time,
-            "server_name": server_name
-        }
+        return parse_vote_page(driver.page_source)
         
     finally:
         if driver:
@@ -1,20 +1,19 @@
 """중복 차단 로그 제거 명령어."""
-import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Callable, Dict, Any, Hashable, Optional, Set, Tuple
 from datetime import datetime
 import discord
 
+from core.ban_log import log_category
+from core.ban_log_store import BanLogEntry, BanLogStore
+from core.ban_log_sync import BanLogSync
+from core.message_delete import StreamingDeleter
+from core.player_cache import normalize_player_name
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
 
 logger = logging.getLogger(__name__)
 
-MAX_SEARCH_LIMIT = 2000
-DELETE_DELAY = 0.5
-
-BAN_LOG_PATTERN = "## <:hr_ban:1350451179683057764> 차단 로그"
-
 
 async def execute_cleanduplicates_action(
     player: Optional[str], 
@@ -38,160 +37,152 @@ async def execute_cleanduplicates_action(
             logger.error(f"차단 로그 채널을 찾을 수 없습니다: {config.BAN_LOG_CHANNEL_ID}")
             return {}
         
+        # 채널 전체 기록의 차단 로그 (색인이 백필까지 끝났으면 색인에서 읽음)
+        sync = bot.ban_log_sync
         if player:
             # 특정 플레이어의 중복 로그만 제거
-            deleted_count = await _clean_player_duplicates(ban_log_channel, player)
+            deleted_count = await _clean_player_duplicates(ban_log_channel, sync, player)
             return {player: deleted_count} if deleted_count > 0 else {}
         else:
             # 모든 플레이어의 중복 로그 제거
-            return await _clean_all_duplicates(ban_log_channel)
+            return await _clean_all_duplicates(ban_log_channel, sync)
         
     except Exception as e:
         logger.error(f"중복 제거 중 오류 발생: {e}")
         return {}
 
 
-async def _clean_player_duplicates(channel, player: str) -> int:
-    """특정 플레이어의 중복 로그 제거."""
-    uuid_groups = {}  # key: uuid, value: list of messages
-    
-    async for message in channel.history(limit=MAX_SEARCH_LIMIT):
-        player_info = _extract_player_info(message)
-        if player_info:
-            nickname, uuid = player_info
-            # 닉네임이 일치하는 경우만 수집
-            if nickname.lower() == player.lower():
-                if uuid not in uuid_groups:
-                    uuid_groups[uuid] = []
-                uuid_groups[uuid].append(message)
-    
-    # 각 UUID별로 중복 제거
-    total_deleted = 0
-    for uuid, messages in uuid_groups.items():
-        if len(messages) > 1:
-            duplicate_messages = _identify_duplicate_logs(messages)
-            deleted_count = await _delete_duplicate_messages(duplicate_messages)
-            total_deleted += deleted_count
-    
-    return total_deleted
+async def _clean_player_duplicates(channel, sync: BanLogSync, player: str) -> int:
+    """특정 플레이어의 중복 로그 제거 (닉네임 대소문자 무시, 로그 종류와 UUID별 최초 로그 보존)."""
+    deleted = await _delete_duplicates(channel, sync, sync.logs(channel, player), _player_key)
+    return len(deleted)
 
 
-async def _clean_all_duplicates(channel) -> Dict[str, int]:
-    """모든 플레이어의 중복 로그 제거."""
-    player_messages = {}  # key: (nickname, uuid), value: list of messages
-    async for message in channel.history(limit=MAX_SEARCH_LIMIT):
-        player_info = _extract_player_info(message)
-        if player_info:
-            nickname, uuid = player_info
-            key = f"{nickname}:{uuid}"
-            if key not in player_messages:
-                player_messages[key] = []
-            player_messages[key].append(message)
+async def _clean_all_duplicates(channel, sync: BanLogSync) -> Dict[str, int]:
+    """모든 플레이어의 중복 로그 제거 ((닉네임, UUID, 로그 종류) 조합별 최초 로그 보존)."""
+    deleted = await _delete_duplicates(channel, sync, sync.logs(channel), _extract_player_info)
     
-    # 각 (닉네임, UUID) 조합별로 중복 제거
-    deletion_results = {}
-    for player_key, messages in player_messages.items():
-        if len(messages) > 1:
-            duplicate_messages = _identify_duplicate_logs(messages)
-            deleted_count = await _delete_duplicate_messages(duplicate_messages)
-            if deleted_count > 0:
-                # 표시용으로 닉네임만 사용
-                nickname = player_key.split(':')[0]
-                if nickname in deletion_results:
-                    deletion_results[nickname] += deleted_count
-                else:
-                    deletion_results[nickname] = deleted_count
+    deletion_results: Dict[str, int] = {}
+    for nickname in deleted.values():
+        deletion_results[nickname] = deletion_results.get(nickname, 0) + 1
     
     return deletion_results
 
 
-def _extract_player_info(message: discord.Message) -> Optional[tuple[str, str]]:
+async def _delete_duplicates(
+    channel,
+    sync: BanLogSync,
+    logs: AsyncIterator[BanLogEntry],
+    key_of: Callable[[BanLogEntry], Optional[Hashable]]
+) -> Dict[int, str]:
     """
-    메시지에서 플레이어 닉네임과 UUID를 추출합니다.
+    같은 키의 로그 중 최초 로그만 남기고 삭제합니다.
+    
+    색인에서 읽은 로그(오래된 순)는 봇이 꺼져 있던 동안 수정되거나 삭제되었을 수 있으므로
+    지우기 전에 그 로그와 보존할 최초 로그를 다시 읽어 지금도 같은 키인지 확인합니다.
+    보존할 로그가 사라졌으면 다음 로그가 최초 로그가 됩니다.
     
-    Args:
-        message: Discord 메시지
-        
     Returns:
-        Optional[tuple[str, str]]: (닉네임, UUID) 튜플, 추출 실패 시 None
+        Dict[int, str]: 삭제된 메시지 ID -> 표시용 닉네임
     """
-    import re
+    planner = _DuplicatePlanner()
+    owners: Dict[int, str] = {}  # 삭제 대상 메시지 ID -> 표시용 닉네임
+    confirmed: Set[int] = set()  # 지금도 같은 키로 확인된 보존 로그
     
-    if not message.content:
-        return None
-        
-    # 차단 로그 패턴 확인
-    if BAN_LOG_PATTERN not in message.content:
-        return None
-    
-    # 닉네임 추출 (백틱으로 감싸진 첫 번째 값)
-    nickname_match = re.search(r'`([^`]+)`', message.content)
-    if not nickname_match:
-        return None
-    nickname = nickname_match.group(1)
+    async with StreamingDeleter(channel) as deleter:
+        async for entry in logs:
+            key = key_of(entry)
+            if key is None:
+                continue
+            victim = planner.offer(key, entry.message_id)
+            if victim is None:
+                continue
+            if not entry.fetched:
+                current = await sync.refresh(channel, entry.message_id)
+                if current is None or key_of(current) != key:
+                    continue
+                kept = planner.kept(key)
+                if kept not in confirmed:
+                    current_kept = await sync.refresh(channel, kept)
+                    if current_kept is None or key_of(current_kept) != key:
+                        planner.replace(key, entry.message_id)
+                        confirmed.add(entry.message_id)
+                        continue
+                    confirmed.add(kept)
+            owners[victim] = entry.username
+            deleter.add(victim)
     
-    # UUID 추출 (UUID 형식: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx)
-    uuid_match = re.search(r'([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', message.content, re.IGNORECASE)
-    if not uuid_match:
-        return None
-    uuid = uuid_match.group(1)
-    
-    return (nickname, uuid)
+    BanLogStore().delete(deleter.deleted)
+    return {message_id: owners[message_id] for message_id in deleter.deleted}
 
 
-def _is_target_ban_log(message: discord.Message, player: str) -> bool:
-    if not message.content:
-        return False
-        
-    # 차단 로그 패턴 확인
-    if BAN_LOG_PATTERN not in message.content:
-        return False
+class _DuplicatePlanner:
+    """
+    메시지를 한 번 훑으면서 중복 로그를 바로 골라내는 계획기.
     
-    # 플레이어명 확인 (백틱으로 감싸진 형태)
-    return f"`{player}`" in message.content
-
-
-def _identify_duplicate_logs(messages: List[discord.Message]) -> List[discord.Message]:
+    키별로 지금까지 본 가장 오래된 메시지 ID만 기억합니다. 메시지 ID(snowflake)는 작성 시각
+    순서이므로 ID가 더 작은 쪽을 최초 로그로 보존하며, 메시지를 읽는 순서와 관계없이
+    메시지를 보관하지 않고 삭제 대상을 정할 수 있습니다.
     """
-    중복 로그를 식별합니다. 최초 로그는 보존하고 나머지를 중복으로 간주합니다.
     
-    Args:
-        messages: 차단 로그 메시지 목록
+    __slots__ = ("_oldest",)
+    
+    def __init__(self) -> None:
+        self._oldest: Dict[Hashable, int] = {}
+    
+    def offer(self, key: Hashable, message_id: int) -> Optional[int]:
+        """
+        메시지를 확인하고 삭제할 중복 메시지 ID를 반환합니다.
         
-    Returns:
-        List[discord.Message]: 삭제할 중복 메시지 목록
-    """
-    # 생성일시 기준 오름차순 정렬 (가장 오래된 것이 첫 번째)
-    sorted_messages = sorted(messages, key=lambda x: x.created_at)
+        Args:
+            key: 같은 플레이어로 볼 키
+            message_id: 확인할 메시지 ID
+            
+        Returns:
+            Optional[int]: 삭제 대상 메시지 ID (중복이 아니면 None)
+        """
+        kept = self._oldest.setdefault(key, message_id)
+        if kept == message_id:
+            return None
+        if message_id < kept:
+            # 더 오래된 로그가 나타나면 기존에 보존하던 로그가 중복이 됨
+            self._oldest[key] = message_id
+            return kept
+        return message_id
     
-    # 첫 번째(최초) 로그는 보존하고 나머지는 중복으로 간주
-    return sorted_messages[1:] if len(sorted_messages) > 1 else []
+    def kept(self, key: Hashable) -> Optional[int]:
+        """키의 보존 중인 메시지 ID."""
+        return self._oldest.get(key)
+    
+    def replace(self, key: Hashable, message_id: int) -> None:
+        """보존 중인 로그가 사라졌을 때 다른 메시지를 보존 대상으로 지정합니다."""
+        self._oldest[key] = message_id
+
+
+def _player_key(entry: BanLogEntry) -> Optional[Tuple[str, str, str]]:
+    """특정 플레이어 정리용 키 (닉네임 대소문자 무시, UUID, 로그 종류)."""
+    player_info = _extract_player_info(entry)
+    if player_info is None:
+        return None
+    nickname, uuid, category = player_info
+    return (normalize_player_name(nickname), uuid, category)
 
 
-async def _delete_duplicate_messages(duplicate_messages: List[discord.Message]) -> int:
+def _extract_player_info(entry: BanLogEntry) -> Optional[Tuple[str, str, str]]:
     """
-    중복 메시지들을 삭제합니다.
+    차단 로그에서 플레이어 닉네임과 UUID, 로그 종류를 추출합니다.
+    
+    약탈 및 테러 차단 로그와 일반 차단 로그는 같은 플레이어여도 서로의 중복으로 보지 않습니다.
     
     Args:
-        duplicate_messages: 삭제할 중복 메시지 목록
+        entry: 차단 로그 항목
         
     Returns:
-        int: 삭제된 메시지 개수
+        Optional[Tuple[str, str, str]]: (닉네임, UUID, 로그 종류) 튜플, UUID가 없으면 None
     """
-    deleted_count = 0
-    
-    for message in duplicate_messages:
-        try:
-            await message.delete()
-            deleted_count += 1
-            await asyncio.sleep(DELETE_DELAY)  # API 제한 방지
-        except discord.NotFound:
-            continue
-        except Exception as e:
-            logger.error(f"메시지 삭제 실패 (ID: {message.id}): {e}")
-            continue
-    
-    return deleted_count
+    if not entry.uuid:
+        return None
+    return (entry.username, entry.uuid, log_category(entry.kind))
 
 
 async def handle_cleanduplicates_command(
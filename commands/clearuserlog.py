@@ -1,19 +1,17 @@
 """사용자 차단 로그 삭제 명령어."""
-import asyncio
 import logging
 from typing import Dict, Any, Optional
 import discord
 
+from core.ban_log_store import BanLogStore
+from core.message_delete import StreamingDeleter
+from core.player_cache import normalize_player_name
+from utils.constants import banned_player_autocomplete
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
 
 logger = logging.getLogger(__name__)
 
-MAX_SEARCH_LIMIT = 2000
-DELETE_DELAY = 0.5
-
-BAN_LOG_PATTERN = "## <:hr_ban:1350451179683057764> 차단 로그"
-
 
 async def execute_clearuserlog_action(
     player: str, 
@@ -37,45 +35,27 @@ async def execute_clearuserlog_action(
             logger.error(f"차단 로그 채널을 찾을 수 없습니다: {config.BAN_LOG_CHANNEL_ID}")
             return 0
         
-        deleted_count = 0
-        
-        # 대상 메시지 수집
-        target_messages = []
-        async for message in ban_log_channel.history(limit=MAX_SEARCH_LIMIT):
-            if _is_target_ban_log(message, player):
-                target_messages.append(message)
-        
-        # 메시지 삭제 (역순으로 삭제하여 안정성 확보)
-        for message in reversed(target_messages):
-            try:
-                await message.delete()
-                deleted_count += 1
-                await asyncio.sleep(DELETE_DELAY)
-            except discord.NotFound:
-                continue
-            except Exception as e:
-                logger.error(f"메시지 삭제 실패 (ID: {message.id}): {e}")
-                continue
+        # 채널 전체 기록에서 닉네임이 정확히 일치하는 로그를 찾는 대로 삭제
+        # (대소문자 무시, 비슷한 이름은 삭제하지 않음, 14일 이내 메시지는 100개씩 일괄 삭제)
+        sync = bot.ban_log_sync
+        player_key = normalize_player_name(player)
+        async with StreamingDeleter(ban_log_channel) as deleter:
+            async for entry in sync.logs(ban_log_channel, player):
+                if not entry.fetched:
+                    # 색인에서 읽은 로그는 지금도 같은 플레이어의 차단 로그인지 확인 (삭제된 메시지는 건너뜀)
+                    entry = await sync.refresh(ban_log_channel, entry.message_id)
+                    if entry is None or normalize_player_name(entry.username) != player_key:
+                        continue
+                deleter.add(entry.message_id)
         
-        return deleted_count
+        BanLogStore().delete(deleter.deleted)
+        return len(deleter.deleted)
         
     except Exception as e:
         logger.error(f"로그 삭제 중 오류 발생: {e}")
         return 0
 
 
-def _is_target_ban_log(message: discord.Message, player: str) -> bool:
-    if not message.content:
-        return False
-        
-    # 차단 로그 패턴 확인
-    if BAN_LOG_PATTERN not in message.content:
-        return False
-    
-    # 플레이어명 확인 (백틱으로 감싸진 형태)
-    return f"`{player}`" in message.content
-
-
 async def handle_clearuserlog_command(
     ctx: discord.ApplicationContext, 
     player: str
@@ -160,7 +140,7 @@ def setup(bot):
     @bot.slash_command(name="로그삭제", description="플레이어의 차단 로그를 삭제합니다.")
     async def clearuserlog_func(
         ctx: discord.ApplicationContext,
-        player: str = discord.Option(str, description="로그를 삭제할 플레이어 이름")
+        player: str = discord.Option(str, description="로그를 삭제할 플레이어 이름", autocomplete=banned_player_autocomplete)
     ):
         """플레이어의 차단 로그 삭제."""
         await handle_clearuserlog_command(ctx, player)
\ No newline at end of file
@@ -12,6 +12,7 @@ from utils.decorators import check_staff_permission
 from utils.constants import (
     mute_duration_autocomplete,
     mute_reason_autocomplete,
+    player_name_autocomplete,
     COMMAND_DELAY
 )
 
@@ -161,7 +162,7 @@ def setup(bot) -> None:
     @bot.slash_command(name="mute", description="플레이어를 뮤트합니다.")
     async def mute_func(
         ctx: discord.ApplicationContext,
-        player: str = discord.Option(str, description="뮤트할 플레이어 이름"),
+        player: str = discord.Option(str, description="뮤트할 플레이어 이름", autocomplete=player_name_autocomplete),
         duration: str = discord.Option(str, description="뮤트 기간 (예: 30s, 5m, 1h, 1d, permanent)", default="permanent", autocomplete=mute_duration_autocomplete),
         reason: str = discord.Option(str, description="뮤트 사유", default=DEFAULT_REASON, autocomplete=mute_reason_autocomplete)
     ) -> None:
@@ -5,7 +5,7 @@ import discord
 
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
-from utils.constants import PROCESSING_DELAY
+from utils.constants import PROCESSING_DELAY, player_name_autocomplete
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +153,7 @@ def setup(bot):
     @bot.slash_command(name="rank", description="플레이어의 등급을 변경합니다.")
     async def rank_func(
         ctx: discord.ApplicationContext,
-        player: str = discord.Option(str, description="등급을 변경할 플레이어 이름"),
+        player: str = discord.Option(str, description="등급을 변경할 플레이어 이름", autocomplete=player_name_autocomplete),
         rank: str = discord.Option(str, description="변경할 등급")
     ):
         """플레이어의 등급 변경."""
@@ -1,83 +1,111 @@
 """차단 로그 검색 명령어."""
-import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 import discord
 
+from core.ban_log import ip_prefix, reason_code
+from core.ban_log_store import BanLogEntry, BanLogStore
+from core.name_search import MATCH_EXACT
+from core.player_cache import normalize_player_name
+from utils.constants import ban_reason_autocomplete, banned_player_autocomplete
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
 
 logger = logging.getLogger(__name__)
 
-MAX_SEARCH_LIMIT = 1000
 MAX_DISPLAY_LOGS = 5
-
-BAN_LOG_PATTERN = "## <:hr_ban:1350451179683057764> 차단 로그"
-
-LogEntry = Dict[str, Any]
+MAX_SIMILAR_NAMES = 5
+DATE_FORMAT = "%Y-%m-%d"
 
 
 async def execute_searchbanlog_action(
-    player: str, 
+    player: Optional[str], 
     bot, 
-    ctx: discord.ApplicationContext
-) -> List[LogEntry]:
-    """차단 로그 검색 실행."""
-    from core.config import get_config
-    
-    config = get_config()
+    ctx: discord.ApplicationContext,
+    **filters: Any
+) -> List[BanLogEntry]:
+    """차단 로그 검색 실행 (채널은 BanLogSync가 색인에 동기화, 최신순).
     
+    filters는 `BanLogStore.query`의 uuid/ip/reason/since/until 조건.
+    """
     try:
-        # 길드 및 채널 확인
-        guild = bot.get_guild(config.TARGET_GUILD_ID)
-        if not guild:
-            logger.error(f"길드를 찾을 수 없습니다: {config.TARGET_GUILD_ID}")
-            return []
-        
-        ban_log_channel = guild.get_channel(config.BAN_LOG_CHANNEL_ID)
-        if not ban_log_channel:
-            logger.error(f"차단 로그 채널을 찾을 수 없습니다: {config.BAN_LOG_CHANNEL_ID}")
-            return []
-        
-        found_messages = []
-        
-        # 메시지 검색
-        async for message in ban_log_channel.history(limit=MAX_SEARCH_LIMIT):
-            if _is_target_ban_log(message, player):
-                log_entry = _create_log_entry(message)
-                found_messages.append(log_entry)
-        
-        # 생성일시 기준 내림차순 정렬 (최신순)
-        found_messages.sort(key=lambda x: x["created_at"], reverse=True)
-        
-        return found_messages
-        
+        return BanLogStore().query(player=player, **filters)
     except Exception as e:
         logger.error(f"차단 로그 검색 중 오류 발생: {e}")
         return []
 
 
-def _is_target_ban_log(message: discord.Message, player: str) -> bool:
-    if not message.content:
-        return False
-        
-    # 차단 로그 패턴 확인
-    if BAN_LOG_PATTERN not in message.content:
-        return False
-    
-    # 플레이어명 확인 (백틱으로 감싸진 형태)
-    return f"`{player}`" in message.content
+def _find_similar_names(player: str) -> List[Tuple[str, int]]:
+    """검색한 플레이어와 비슷한 닉네임과 각 이름의 차단 로그 수 (대소문자만 다른 같은 이름 제외)."""
+    try:
+        store = BanLogStore()
+        names = [
+            match.username for match in store.find_names(player, MAX_SIMILAR_NAMES + 1)
+            if match.kind != MATCH_EXACT
+        ][:MAX_SIMILAR_NAMES]
+        counts = store.count_by_name(names)
+    except Exception as e:
+        logger.error(f"비슷한 닉네임 검색 중 오류 발생: {e}")
+        return []
+    return [(name, counts[normalize_player_name(name)]) for name in names if counts.get(normalize_player_name(name))]
+
 
+def _parse_date(value: str) -> float:
+    """YYYY-MM-DD (UTC) 날짜의 시작 시각 (형식이 틀리면 ValueError)."""
+    return datetime.strptime(value.strip(), DATE_FORMAT).replace(tzinfo=timezone.utc).timestamp()
 
-def _create_log_entry(message: discord.Message) -> LogEntry:
-    return {
-        "content": message.content,
-        "jump_url": message.jump_url,
-        "created_at": message.created_at,
-        "message_id": message.id,
-        "author": message.author.display_name if message.author else "Unknown"
-    }
+
+def _build_filters(
+    uuid: Optional[str],
+    ip: Optional[str],
+    reason: Optional[str],
+    days: Optional[int],
+    since: Optional[str],
+    until: Optional[str]
+) -> Dict[str, Any]:
+    """명령어 옵션을 검색 조건으로 변환 (잘못된 값이면 ValueError)."""
+    filters: Dict[str, Any] = {}
+    if uuid:
+        filters["uuid"] = uuid.strip()
+    if ip:
+        if ip_prefix(ip) is None:
+            raise ValueError("IP는 `1.2.3` 또는 `1.2.*`처럼 숫자 옥텟으로 입력해주세요.")
+        filters["ip"] = ip
+    if reason:
+        filters["reason"] = reason
+    if days:
+        filters["since"] = time.time() - days * 86400
+    try:
+        if since:
+            filters["since"] = max(filters.get("since", 0.0), _parse_date(since))
+        if until:
+            # 종료 날짜 당일까지 포함
+            filters["until"] = _parse_date(until) + 86400
+    except ValueError:
+        raise ValueError("날짜는 `YYYY-MM-DD` 형식으로 입력해주세요.") from None
+    return filters
+
+
+def _describe_search(player: Optional[str], options: Dict[str, Any]) -> str:
+    """검색 조건 표시 문자열."""
+    parts = []
+    if player:
+        parts.append(f"플레이어 `{player}`")
+    if options.get("uuid"):
+        parts.append(f"UUID `{options['uuid']}`")
+    if options.get("ip"):
+        parts.append(f"IP `{ip_prefix(options['ip'])}.*`")
+    if options.get("reason"):
+        parts.append(f"사유 `{reason_code(options['reason']) or options['reason']}`")
+    if options.get("days"):
+        parts.append(f"최근 {options['days']}일")
+    if options.get("since"):
+        parts.append(f"{options['since']}부터")
+    if options.get("until"):
+        parts.append(f"{options['until']}까지")
+    return " · ".join(parts)
 
 
 def _create_permission_error_embed(ctx: discord.ApplicationContext) -> discord.Embed:
@@ -99,20 +127,20 @@ def _create_permission_error_embed(ctx: discord.ApplicationContext) -> discord.E
     )
 
 
-def _create_processing_embed(ctx: discord.ApplicationContext, player: str) -> discord.Embed:
+def _create_processing_embed(ctx: discord.ApplicationContext, criteria: str) -> discord.Embed:
     """
     처리 중 상태 임베드를 생성합니다.
     
     Args:
         ctx: Discord 상호작용 객체
-        player: 검색할 플레이어명
+        criteria: 검색 조건 표시 문자열
         
     Returns:
         discord.Embed: 처리 중 임베드
     """
     return create_embed(
         title="🔍 로그 검색 중...",
-        description=f"**`{player}`**님의 차단 로그를 검색하고 있습니다...",
+        description=f"**{criteria}** 조건으로 차단 로그를 검색하고 있습니다...",
         color=0xF39C12,
         ctx=ctx
     )
@@ -120,33 +148,40 @@ def _create_processing_embed(ctx: discord.ApplicationContext, player: str) -> di
 
 def _create_search_result_embed(
     ctx: discord.ApplicationContext,
-    player: str,
-    ban_logs: List[LogEntry]
+    criteria: str,
+    ban_logs: List[BanLogEntry],
+    similar_names: Optional[List[Tuple[str, int]]] = None,
+    index_complete: bool = True
 ) -> discord.Embed:
     """
     검색 결과 임베드를 생성합니다.
     
     Args:
         ctx: Discord 상호작용 객체
-        player: 검색한 플레이어명
+        criteria: 검색 조건 표시 문자열
         ban_logs: 찾은 차단 로그 목록
+        similar_names: 비슷한 닉네임과 차단 로그 수
+        index_complete: 색인이 채널 전체 기록을 담고 있는지 (아니면 결과가 불완전할 수 있다고 안내)
         
     Returns:
         discord.Embed: 검색 결과 임베드
     """
     if not ban_logs:
-        return create_embed(
+        empty_embed = create_embed(
             title="🔍 차단 로그 검색 결과",
-            description=f"**`{player}`**님의 차단 로그를 찾을 수 없습니다.",
+            description=f"**{criteria}** 조건에 맞는 차단 로그를 찾을 수 없습니다.",
             color=0x95A5A6,
             ctx=ctx,
             success=True
         )
+        _add_similar_names_field(empty_embed, similar_names)
+        _add_index_notice_field(empty_embed, index_complete)
+        return empty_embed
     
     # 결과가 있는 경우
     result_embed = create_embed(
         title="🔍 차단 로그 검색 결과",
-        description=f"**`{player}`**님의 차단 로그 **{len(ban_logs)}건**을 찾았습니다.",
+        description=f"**{criteria}** 조건으로 차단 로그 **{len(ban_logs)}건**을 찾았습니다.",
         color=0x3498DB,
         ctx=ctx,
         success=True
@@ -155,12 +190,14 @@ def _create_search_result_embed(
     # 최대 표시 개수만큼 로그 추가
     display_logs = ban_logs[:MAX_DISPLAY_LOGS]
     for i, log in enumerate(display_logs):
-        log_date = log['created_at'].strftime('%Y-%m-%d %H:%M:%S')
+        log_date = log.created_datetime.strftime('%Y-%m-%d %H:%M:%S')
         result_embed.add_field(
             name=f"📋 로그 {i+1}",
-            value=f"[메시지 링크]({log['jump_url']})\n"
+            value=f"[메시지 링크]({log.jump_url})\n"
+                  f"🎮 플레이어: `{log.username}`\n"
+                  f"📝 사유: {log.reason or '없음'}\n"
                   f"📅 생성일: {log_date}\n"
-                  f"👤 기록자: {log['author']}",
+                  f"👤 기록자: {log.author or 'Unknown'}",
             inline=False
         )
     
@@ -173,49 +210,106 @@ def _create_search_result_embed(
             inline=False
         )
     
+    _add_similar_names_field(result_embed, similar_names)
+    _add_index_notice_field(result_embed, index_complete)
     return result_embed
 
 
+def _add_similar_names_field(embed: discord.Embed, similar_names: Optional[List[Tuple[str, int]]]) -> None:
+    """오타나 숫자 치환 부계정으로 보이는 닉네임 안내."""
+    if not similar_names:
+        return
+    embed.add_field(
+        name="🔎 비슷한 닉네임",
+        value="\n".join(f"• `{name}`: **{count}건**" for name, count in similar_names),
+        inline=False
+    )
+
+
+def _add_index_notice_field(embed: discord.Embed, index_complete: bool) -> None:
+    """색인 따라잡기나 백필이 끝나지 않았을 때 결과가 불완전할 수 있음을 안내."""
+    if index_complete:
+        return
+    embed.add_field(
+        name="⏳ 색인 진행 중",
+        value="차단 로그 색인이 아직 채널 전체 기록을 담고 있지 않아 결과가 불완전할 수 있습니다.\n"
+              "오래된 기록은 차단 로그 채널에서 직접 확인해주세요.",
+        inline=False
+    )
+
+
 async def handle_searchbanlog_command(
     ctx: discord.ApplicationContext, 
-    player: str
+    player: Optional[str],
+    uuid: Optional[str] = None,
+    ip: Optional[str] = None,
+    reason: Optional[str] = None,
+    days: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None
 ) -> None:
     """
-    로그 검색 명령어 처리 로직
+    로그 검색 명령어 처리 로직 (주어진 조건을 모두 만족하는 로그 검색)
     
     Args:
         ctx: Discord 상호작용 객체
         player: 검색할 플레이어명
+        uuid: 검색할 UUID
+        ip: 검색할 IP 대역
+        reason: 검색할 사유 조항
+        days: 최근 며칠 이내
+        since: 시작 날짜 (YYYY-MM-DD)
+        until: 종료 날짜 (YYYY-MM-DD)
     """
     command_logger = CommandLogger()
+    options = {"uuid": uuid, "ip": ip, "reason": reason, "days": days, "since": since, "until": until}
+    log_details = {"player": player, **{key: value for key, value in options.items() if value}}
     
     # 권한 체크
     if not await check_staff_permission(ctx):
         await command_logger.log_command_usage(
             ctx, 
             "searchbanlog", 
-            {"player": player, "error": "권한 부족"}, 
+            {**log_details, "error": "권한 부족"}, 
             success=False
         )
         return
     
+    # 검색 조건 확인
+    player = player.strip() if player else None
+    try:
+        filters = _build_filters(uuid, ip, reason, days, since, until)
+    except ValueError as e:
+        error_message = str(e)
+    else:
+        error_message = None if player or filters else "검색 조건을 하나 이상 입력해주세요."
+    if error_message:
+        await ctx.respond(
+            embed=create_embed(title="입력 오류", description=error_message, ctx=ctx, success=False),
+            ephemeral=True
+        )
+        return
+    
     # 처리 중 메시지 표시
-    processing_embed = _create_processing_embed(ctx, player)
+    criteria = _describe_search(player, options)
+    processing_embed = _create_processing_embed(ctx, criteria)
     await ctx.defer(ephemeral=False)
     await ctx.edit(embed=processing_embed)
     
     # 로그 검색 실행
-    ban_logs = await execute_searchbanlog_action(player, ctx.bot, ctx)
+    ban_logs = await execute_searchbanlog_action(player, ctx.bot, ctx, **filters)
+    similar_names = _find_similar_names(player) if player else None
+    index_complete = ctx.bot.ban_log_sync.covers_history
     
     # 결과 임베드 생성 및 전송
-    result_embed = _create_search_result_embed(ctx, player, ban_logs)
+    result_embed = _create_search_result_embed(ctx, criteria, ban_logs, similar_names, index_complete)
     await ctx.edit(embed=result_embed)
     
     # 결과 로깅
     await command_logger.log_command_usage(
         ctx, 
         "searchbanlog", 
-        {"player": player, "found_count": len(ban_logs)}, 
+        {**log_details, "found_count": len(ban_logs)}, 
         success=True
     )
 
@@ -223,10 +317,16 @@ async def handle_searchbanlog_command(
 def setup(bot):
     """명령어 등록."""
     
-    @bot.slash_command(name="로그검색", description="플레이어의 차단 로그를 검색합니다.")
+    @bot.slash_command(name="로그검색", description="플레이어, UUID, IP 대역, 사유, 기간으로 차단 로그를 검색합니다.")
     async def searchbanlog_func(
         ctx: discord.ApplicationContext,
-        player: str = discord.Option(str, description="검색할 플레이어 이름")
+        player: Optional[str] = discord.Option(str, description="검색할 플레이어 이름 (같은 UUID의 다른 닉네임 포함)", autocomplete=banned_player_autocomplete, default=None, required=False),
+        uuid: Optional[str] = discord.Option(str, description="검색할 UUID", default=None, required=False),
+        ip: Optional[str] = discord.Option(str, description="검색할 IP 대역 (예: 1.2.3 또는 1.2.*)", default=None, required=False),
+        reason: Optional[str] = discord.Option(str, description="검색할 사유 조항 (예: 2-1)", autocomplete=ban_reason_autocomplete, default=None, required=False),
+        days: Optional[int] = discord.Option(int, description="최근 며칠 이내", min_value=1, default=None, required=False),
+        since: Optional[str] = discord.Option(str, description="시작 날짜 (YYYY-MM-DD, UTC)", default=None, required=False),
+        until: Optional[str] = discord.Option(str, description="종료 날짜 (YYYY-MM-DD, UTC)", default=None, required=False)
     ):
-        """플레이어의 차단 로그 검색."""
-        await handle_searchbanlog_command(ctx, player)
\ No newline at end of file
+        """조건을 모두 만족하는 차단 로그 검색."""
+        await handle_searchbanlog_command(ctx, player, uuid, ip, reason, days, since, until)
\ No newline at end of file
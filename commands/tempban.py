@@ -11,6 +11,7 @@ from utils.decorators import check_staff_permission
 from utils.constants import (
     tempban_duration_autocomplete,
     tempban_reason_autocomplete,
+    player_name_autocomplete,
     COMMAND_DELAY
 )
 
@@ -92,7 +93,7 @@ def setup(bot) -> None:
     @bot.slash_command(name="tempban", description="플레이어를 임시 차단합니다.")
     async def tempban_func(
         ctx: discord.ApplicationContext,
-        player: str = discord.Option(str, description="임시 차단할 플레이어 이름"),
+        player: str = discord.Option(str, description="임시 차단할 플레이어 이름", autocomplete=player_name_autocomplete),
         duration: str = discord.Option(str, description="차단 기간 (예: 1h, 1d, 30m)", autocomplete=tempban_duration_autocomplete),
         reason: str = discord.Option(str, description="차단 사유", default=DEFAULT_REASON, autocomplete=tempban_reason_autocomplete)
     ) -> None:
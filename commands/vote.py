@@ -6,7 +6,7 @@ import discord
 
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
-from utils.constants import PROCESSING_DELAY
+from core.latency import ConsoleLatencyTracker
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +25,7 @@ async def execute_vote_action(player: str, bot, ctx: discord.ApplicationContext)
         if not vote_success:
             return False
             
-        await asyncio.sleep(PROCESSING_DELAY)
+        await asyncio.sleep(ConsoleLatencyTracker().expected())
         return True
         
     except Exception as e:
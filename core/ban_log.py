@@ -0,0 +1,206 @@
+"""차단 로그 메시지 형식과 업로드.
+
+차단 로그는 사람이 읽는 본문과 함께, 임베드 꼬리말에 버전이 붙은 JSON 레코드를 싣는다.
+색인/중복 제거/삭제는 꼬리말만 읽으므로 본문을 정규식으로 다시 훑지 않는다. 꼬리말이 없는
+이전 메시지는 본문에서 읽는다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import discord
+
+from .config import get_config
+from .models import UNKNOWN_VALUE, PlayerInfo
+
+logger = logging.getLogger(__name__)
+
+BAN_LOG_FORMAT_VERSION = 1
+
+KIND_BAN = "ban"
+KIND_UPLOAD = "upload"
+KIND_YAKTAL = "yaktal"
+
+_BAN_EMOJI = "<:hr_ban:1350451179683057764>"
+_HEADERS = {
+    KIND_BAN: f"## {_BAN_EMOJI} 차단 로그",
+    KIND_UPLOAD: f"## {_BAN_EMOJI} 차단 로그",
+    KIND_YAKTAL: f"## {_BAN_EMOJI} 약탈 및 테러 차단 로그",
+}
+YAKTAL_REASON_PREFIX = "약탈 및 테러"
+# 약탈 및 테러 차단의 약관 조항
+YAKTAL_REASON_CODE = "2-8"
+
+# 꼬리말 JSON은 항상 이 접두어로 시작 (키 순서 고정)
+_PAYLOAD_PREFIX = '{"v":'
+# 꼬리말은 앞뒤 공백 없는 JSON이므로 json.loads의 공백/BOM 처리 없이 바로 읽음
+_PAYLOAD_DECODER = json.JSONDecoder()
+_FOOTER_MAX_LENGTH = 2048
+
+# 꼬리말이 없는 이전 메시지용
+_LEGACY_HEADER_PATTERN = re.compile(rf"^## {re.escape(_BAN_EMOJI)} (약탈 및 테러 )?차단 로그", re.MULTILINE)
+_LEGACY_FIELD_PATTERN = re.compile(r'^`(Username|UUID|IP|차단 사유)` ?(.*)$', re.MULTILINE)
+_LEGACY_YAKTAL_REASON = re.compile(rf"^{YAKTAL_REASON_PREFIX}\((.*)\)$", re.DOTALL)
+
+# "2-1: 비인가 프로그램 및 모드 사용" 같은 사유의 조항 번호
+_REASON_CODE_PATTERN = re.compile(r"^\s*(\d+-\d+)\b")
+
+
+@dataclass(frozen=True)
+class BanLogRecord:
+    """차단 로그 한 건 (UUID/IP는 확인되지 않았으면 None, reason은 입력한 사유 그대로)."""
+
+    kind: str
+    username: str
+    uuid: Optional[str]
+    ip: Optional[str]
+    reason: Optional[str]
+
+    @classmethod
+    def from_player(cls, kind: str, player_info: PlayerInfo, reason: str) -> "BanLogRecord":
+        return cls(kind, player_info.username, player_info.uuid, player_info.ip, reason)
+
+    @property
+    def display_reason(self) -> Optional[str]:
+        """본문에 표시되는 사유 (약탈 및 테러 차단은 "약탈 및 테러(사유)")."""
+        if self.kind == KIND_YAKTAL:
+            return f"{YAKTAL_REASON_PREFIX}({self.reason or ''})"
+        return self.reason
+
+    def render(self) -> str:
+        """사람이 읽는 본문."""
+        uuid_display = self.uuid or f"`{UNKNOWN_VALUE}` ⚠️"
+        ip_display = self.ip or f"`{UNKNOWN_VALUE}` ⚠️"
+        return f"""{_HEADERS.get(self.kind, _HEADERS[KIND_BAN])}
+
+`Username` `{self.username}`
+`UUID` {uuid_display}
+`IP` {ip_display}
+`차단 사유` {self.display_reason or ''}"""
+
+    def encode(self) -> str:
+        """꼬리말에 넣을 JSON (길이 제한을 넘으면 사유를 줄임)."""
+        data: Dict[str, Any] = {
+            "v": BAN_LOG_FORMAT_VERSION,
+            "k": self.kind,
+            "n": self.username,
+            "u": self.uuid,
+            "i": self.ip,
+            "r": self.reason,
+        }
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        overflow = len(payload) - _FOOTER_MAX_LENGTH
+        if overflow > 0 and self.reason:
+            data["r"] = self.reason[:max(0, len(self.reason) - overflow - 1)] + "…"
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return payload
+
+
+def log_category(kind: str) -> str:
+    """중복 판단에 쓰는 로그 종류 (업로드 로그는 일반 차단 로그와 형식이 같아 같은 종류로 봄)."""
+    return KIND_YAKTAL if kind == KIND_YAKTAL else KIND_BAN
+
+
+def reason_code(reason: Optional[str]) -> Optional[str]:
+    """표시 사유의 약관 조항 번호 (예: "2-1", 없으면 None)."""
+    if not reason:
+        return None
+    if reason.startswith(YAKTAL_REASON_PREFIX):
+        return YAKTAL_REASON_CODE
+    match = _REASON_CODE_PATTERN.match(reason)
+    return match.group(1) if match else None
+
+
+def ip_prefix(ip: Optional[str]) -> Optional[str]:
+    """마스킹된 IP의 앞부분 ("1.2.3.*" -> "1.2.3", 검색어 "1.2.*"나 "1.2.3.4"도 옥텟 단위로 자름).
+
+    네 옥텟이 모두 있으면 저장되는 형식(/24)에 맞춰 마지막 옥텟을 버린다.
+    """
+    if not ip:
+        return None
+    octets = [octet for octet in ip.strip().rstrip("*").split(".") if octet]
+    if not octets or not all(octet.isdigit() for octet in octets):
+        return None
+    return ".".join(octets[:3])
+
+
+def decode_ban_log(message: discord.Message) -> Optional[BanLogRecord]:
+    """임베드 꼬리말의 레코드 읽기 (레코드가 없거나 읽을 수 없는 버전이면 None)."""
+    for embed in message.embeds:
+        text = getattr(embed.footer, "text", None)
+        if not isinstance(text, str) or not text.startswith(_PAYLOAD_PREFIX):
+            continue
+        try:
+            data, end = _PAYLOAD_DECODER.raw_decode(text)
+        except ValueError:
+            return None
+        if end != len(text) or data.get("v") != BAN_LOG_FORMAT_VERSION or not data.get("n"):
+            return None
+        return BanLogRecord(data.get("k", KIND_BAN), data["n"], data.get("u"), data.get("i"), data.get("r"))
+    return None
+
+
+def _legacy_value(raw: str) -> Optional[str]:
+    """"`알 수 없음` ⚠️" 같은 표시용 꾸밈을 걷어낸 값 (알 수 없으면 None)."""
+    value = raw.replace("⚠️", "").strip().strip("`").strip()
+    return value if value and value != UNKNOWN_VALUE else None
+
+
+def _parse_legacy(content: str) -> Optional[BanLogRecord]:
+    header = _LEGACY_HEADER_PATTERN.search(content)
+    if header is None:
+        return None
+
+    fields = dict(_LEGACY_FIELD_PATTERN.findall(content))
+    username = _legacy_value(fields.get("Username", ""))
+    if not username:
+        return None
+
+    kind = KIND_YAKTAL if header.group(1) else KIND_BAN
+    reason = fields.get("차단 사유", "").strip() or None
+    if kind == KIND_YAKTAL and reason:
+        match = _LEGACY_YAKTAL_REASON.match(reason)
+        reason = match.group(1) if match else reason
+    return BanLogRecord(kind, username, _legacy_value(fields.get("UUID", "")), _legacy_value(fields.get("IP", "")), reason)
+
+
+def read_ban_log(message: discord.Message) -> Optional[BanLogRecord]:
+    """차단 로그 메시지를 레코드로 변환 (꼬리말 우선, 없으면 본문, 차단 로그가 아니면 None)."""
+    if message.embeds:
+        record = decode_ban_log(message)
+        if record is not None:
+            return record
+    content = message.content
+    return _parse_legacy(content) if content else None
+
+
+async def upload_ban_log(bot, kind: str, player_info: PlayerInfo, reason: str) -> Optional[str]:
+    """차단 로그 채널에 로그를 올리고 메시지 링크 반환 (채널이 없거나 실패하면 None)."""
+    config = get_config()
+    if not config.BAN_LOG_CHANNEL_ID:
+        return None
+
+    try:
+        guild = bot.get_guild(config.TARGET_GUILD_ID)
+        if not guild:
+            logger.warning("길드를 찾을 수 없음 (ID: %s)", config.TARGET_GUILD_ID)
+            return None
+
+        ban_log_channel = guild.get_channel(config.BAN_LOG_CHANNEL_ID)
+        if not ban_log_channel:
+            logger.warning("차단 로그 채널을 찾을 수 없음 (ID: %s)", config.BAN_LOG_CHANNEL_ID)
+            return None
+
+        record = BanLogRecord.from_player(kind, player_info, reason)
+        embed = discord.Embed()
+        embed.set_footer(text=record.encode())
+        sent_message = await ban_log_channel.send(record.render(), embed=embed)
+        return sent_message.jump_url
+
+    except Exception as e:
+        logger.error("차단 로그 업로드 실패: %s", e)
+        return None
@@ -0,0 +1,424 @@
+"""차단 로그 색인 저장소."""
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+from .ban_log import KIND_BAN, KIND_YAKTAL, YAKTAL_REASON_PREFIX, ip_prefix, read_ban_log, reason_code
+from .base import Singleton
+from .name_search import NAME_SEARCH_LIMIT, NameMatch, NameSearchIndex
+from .player_cache import normalize_player_name
+from utils.constants import BAN_LOG_STORE_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ban_logs (
+    message_id INTEGER PRIMARY KEY,
+    channel_id INTEGER NOT NULL,
+    name_key TEXT NOT NULL,
+    username TEXT NOT NULL,
+    uuid TEXT,
+    ip TEXT,
+    reason TEXT,
+    author TEXT,
+    jump_url TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    ip_prefix TEXT,
+    reason_code TEXT,
+    kind TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    channel_id INTEGER PRIMARY KEY,
+    last_message_id INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS backfill_state (
+    channel_id INTEGER PRIMARY KEY,
+    before_message_id INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0,
+    scanned INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+"""
+
+# 검색 조건별 보조 색인 (모두 최신순으로 읽을 수 있도록 created_at 포함)
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_ban_logs_name
+    ON ban_logs (name_key, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ban_logs_uuid
+    ON ban_logs (uuid COLLATE NOCASE, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ban_logs_ip_prefix
+    ON ban_logs (ip_prefix, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ban_logs_reason_code
+    ON ban_logs (reason_code, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ban_logs_created
+    ON ban_logs (created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_ban_logs_channel
+    ON ban_logs (channel_id, message_id);
+"""
+
+
+def _kind_from_reason(reason: Optional[str]) -> str:
+    # 종류 열이 없던 색인의 항목은 표시용 사유로 약탈 및 테러 로그를 구분
+    if reason and reason.startswith(f"{YAKTAL_REASON_PREFIX}("):
+        return KIND_YAKTAL
+    return KIND_BAN
+
+
+
+# 이전 버전 색인 파일에 없는 열 (열 이름, 원본 열, 계산 함수)
+_DERIVED_COLUMNS = (
+    ("ip_prefix", "ip", ip_prefix),
+    ("reason_code", "reason", reason_code),
+    ("kind", "reason", _kind_from_reason),
+)
+
+_UPSERT_SQL = """
+INSERT OR REPLACE INTO ban_logs
+    (message_id, channel_id, name_key, username, uuid, ip, reason, author, jump_url, created_at,
+     ip_prefix, reason_code, kind)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+@dataclass
+class BanLogEntry:
+    """차단 로그 메시지 하나의 색인 항목 (created_at은 UNIX 시간, kind는 BanLogRecord.kind).
+
+    fetched는 방금 읽은 메시지에서 만든 항목인지 여부 (색인에서 읽은 항목은 False이며 그 사이
+    메시지가 수정되거나 삭제되었을 수 있음). 색인에는 저장하지 않는다.
+    """
+
+    message_id: int
+    channel_id: int
+    username: str
+    uuid: Optional[str]
+    ip: Optional[str]
+    reason: Optional[str]
+    author: Optional[str]
+    jump_url: str
+    created_at: float
+    kind: str = KIND_BAN
+    fetched: bool = field(default=False, compare=False)
+
+    @property
+    def created_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at, timezone.utc)
+
+
+def _entry_row(entry: BanLogEntry) -> tuple:
+    return (
+        entry.message_id, entry.channel_id, normalize_player_name(entry.username),
+        entry.username, entry.uuid, entry.ip, entry.reason, entry.author,
+        entry.jump_url, entry.created_at, ip_prefix(entry.ip), reason_code(entry.reason), entry.kind
+    )
+
+
+def parse_ban_log(message: discord.Message) -> Optional[BanLogEntry]:
+    """차단 로그 메시지를 색인 항목으로 변환 (차단 로그가 아니면 None)."""
+    record = read_ban_log(message)
+    if record is None:
+        return None
+
+    return BanLogEntry(
+        message_id=message.id,
+        channel_id=message.channel.id,
+        username=record.username,
+        uuid=record.uuid,
+        ip=record.ip,
+        reason=record.display_reason,
+        author=message.author.display_name if message.author else None,
+        jump_url=message.jump_url,
+        created_at=message.created_at.timestamp(),
+        kind=record.kind,
+        fetched=True,
+    )
+
+
+class BanLogStore(metaclass=Singleton):
+    """차단 로그 채널의 메시지를 플레이어명/UUID/IP 대역/사유 조항/시각으로 색인하는 SQLite 저장소.
+
+    검색은 채널 기록을 읽지 않고 색인만 조회하므로 채널 크기와 관계없이 즉시 끝난다.
+    WAL 모드를 사용하므로 검색이 색인 갱신을 막지 않는다. 비슷한 닉네임 검색용 이름 색인은
+    처음 사용할 때 메모리에 만들고 이후 저장되는 항목으로 갱신한다.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path or BAN_LOG_STORE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._add_derived_columns()
+        self._conn.executescript(_INDEXES)
+        self._conn.commit()
+        self._names: Optional[NameSearchIndex] = None
+
+    def _add_derived_columns(self) -> None:
+        """이전 버전에서 만든 색인 파일에 검색용 열을 추가하고 기존 항목의 값을 채움."""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(ban_logs)")}
+        for column, source, derive in _DERIVED_COLUMNS:
+            if column in columns:
+                continue
+            with self._conn:
+                self._conn.execute(f"ALTER TABLE ban_logs ADD COLUMN {column} TEXT")
+                rows = self._conn.execute(
+                    f"SELECT message_id, {source} FROM ban_logs WHERE {source} IS NOT NULL"
+                ).fetchall()
+                self._conn.executemany(
+                    f"UPDATE ban_logs SET {column} = ? WHERE message_id = ?",
+                    [(derive(row[source]), row["message_id"]) for row in rows]
+                )
+            logger.info("차단 로그 색인에 %s 열 추가 (기존 항목 %d개)", column, len(rows))
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM ban_logs").fetchone()[0]
+
+    def upsert(self, entries: List[BanLogEntry]) -> None:
+        """색인 항목 저장 (같은 메시지는 덮어씀)."""
+        if not entries:
+            return
+        try:
+            with self._conn:
+                self._conn.executemany(_UPSERT_SQL, [_entry_row(entry) for entry in entries])
+        except sqlite3.Error as e:
+            logger.error("차단 로그 색인 저장 실패: %s", e)
+            return
+        self._add_names(entries)
+
+    def index_message(self, message: discord.Message) -> bool:
+        """메시지가 차단 로그이면 색인에 추가하고 True 반환."""
+        entry = parse_ban_log(message)
+        if entry is None:
+            return False
+        self.upsert([entry])
+        return True
+
+    def delete(self, message_ids: Iterable[int]) -> int:
+        """삭제된 메시지의 색인 항목 제거, 제거된 항목 수 반환."""
+        ids = [(message_id,) for message_id in message_ids]
+        if not ids:
+            return 0
+        try:
+            with self._conn:
+                cursor = self._conn.executemany("DELETE FROM ban_logs WHERE message_id = ?", ids)
+            if cursor.rowcount:
+                # 로그가 모두 삭제된 이름을 빼기 위해 다음 검색 때 다시 만듦
+                self._names = None
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error("차단 로그 색인 삭제 실패: %s", e)
+            return 0
+
+    def search(self, player: str) -> List[BanLogEntry]:
+        """플레이어의 차단 로그 (대소문자 무시, 최신순)."""
+        return self.query(player=player)
+
+    def query(
+        self,
+        player: Optional[str] = None,
+        uuid: Optional[str] = None,
+        ip: Optional[str] = None,
+        reason: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> List[BanLogEntry]:
+        """주어진 조건을 모두 만족하는 차단 로그 (최신순).
+
+        Args:
+            player: 플레이어명 (대소문자 무시, 같은 UUID로 기록된 이전/이후 닉네임의 로그 포함)
+            uuid: UUID (대소문자 무시)
+            ip: IP 대역 ("1.2.3", "1.2.*", "1.2.3.*" 등 옥텟 단위 앞부분)
+            reason: 약관 조항 번호 (예: "2-1")
+            since: 이 시각(UNIX 시간) 이후
+            until: 이 시각(UNIX 시간) 이전
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+        if player:
+            name_key = normalize_player_name(player)
+            conditions.append(
+                "(name_key = ? OR uuid COLLATE NOCASE IN "
+                "(SELECT uuid FROM ban_logs WHERE name_key = ? AND uuid IS NOT NULL))"
+            )
+            params += [name_key, name_key]
+        if uuid:
+            conditions.append("uuid = ? COLLATE NOCASE")
+            params.append(uuid.strip())
+        if ip:
+            prefix = ip_prefix(ip)
+            if prefix is None:
+                return []
+            # "1.2"는 "1.2"와 "1.2.*"만 포함하고 "1.20"은 제외 ("/"는 "." 바로 다음 문자)
+            conditions.append("ip_prefix >= ? AND ip_prefix < ?")
+            params += [prefix, prefix + "/"]
+        if reason:
+            conditions.append("reason_code = ?")
+            params.append(reason_code(reason) or reason.strip())
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self._select(f"{where}ORDER BY created_at DESC", tuple(params))
+
+    def channel_logs(self, channel_id: int, player: Optional[str] = None) -> List[BanLogEntry]:
+        """채널의 차단 로그 (오래된 순).
+
+        `query`와 달리 player는 닉네임이 정확히 일치(대소문자 무시)하는 로그만 포함하고
+        같은 UUID로 기록된 다른 닉네임의 로그는 포함하지 않는다.
+        """
+        if player:
+            return self._select(
+                "WHERE channel_id = ? AND name_key = ? ORDER BY message_id",
+                (channel_id, normalize_player_name(player))
+            )
+        return self._select("WHERE channel_id = ? ORDER BY message_id", (channel_id,))
+
+    def find_names(self, query: str, limit: int = NAME_SEARCH_LIMIT) -> List[NameMatch]:
+        """차단 로그가 있는 닉네임 중 검색어와 비슷한 이름 (대소문자 무시, 접두사, 오타/숫자 치환)."""
+        return self._name_index().search(query, limit)
+
+    def count_by_name(self, names: Iterable[str]) -> Dict[str, int]:
+        """닉네임별 차단 로그 수 (정규화된 이름 기준, 로그가 없는 이름은 제외)."""
+        keys = list({normalize_player_name(name) for name in names})
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        try:
+            rows = self._conn.execute(
+                f"SELECT name_key, COUNT(*) FROM ban_logs WHERE name_key IN ({placeholders}) GROUP BY name_key",
+                keys
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("차단 로그 색인 조회 실패: %s", e)
+            return {}
+        return {row[0]: row[1] for row in rows}
+
+    def latest_message_id(self, channel_id: int) -> Optional[int]:
+        """채널에서 색인된 가장 최근 메시지 ID."""
+        row = self._conn.execute(
+            "SELECT MAX(message_id) FROM ban_logs WHERE channel_id = ?", (channel_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def oldest_message_id(self, channel_id: int) -> Optional[int]:
+        """채널에서 색인된 가장 오래된 메시지 ID."""
+        row = self._conn.execute(
+            "SELECT MIN(message_id) FROM ban_logs WHERE channel_id = ?", (channel_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def checkpoint(self, channel_id: int) -> Optional[int]:
+        """채널에서 마지막으로 반영한 메시지 ID (차단 로그가 아닌 메시지 포함)."""
+        row = self._conn.execute(
+            "SELECT last_message_id FROM sync_state WHERE channel_id = ?", (channel_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_checkpoint(self, channel_id: int, message_id: int) -> None:
+        """마지막으로 반영한 메시지 ID 저장 (더 오래된 ID로는 되돌리지 않음)."""
+        try:
+            with self._conn:
+                self._conn.execute(
+                    """
+                    INSERT INTO sync_state (channel_id, last_message_id, updated_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT (channel_id) DO UPDATE SET
+                        last_message_id = MAX(last_message_id, excluded.last_message_id),
+                        updated_at = excluded.updated_at
+                    """,
+                    (channel_id, message_id, time.time())
+                )
+        except sqlite3.Error as e:
+            logger.error("차단 로그 동기화 위치 저장 실패: %s", e)
+
+    def backfill_state(self, channel_id: int) -> Tuple[Optional[int], bool, int]:
+        """백필 진행 상태 (다음에 읽을 위치: 이 ID 이전, 완료 여부, 누적 확인 메시지 수)."""
+        row = self._conn.execute(
+            "SELECT before_message_id, completed, scanned FROM backfill_state WHERE channel_id = ?",
+            (channel_id,)
+        ).fetchone()
+        if row is None:
+            return None, False, 0
+        return row["before_message_id"], bool(row["completed"]), row["scanned"]
+
+    def save_backfill(
+        self,
+        channel_id: int,
+        entries: List[BanLogEntry],
+        before_message_id: Optional[int],
+        completed: bool,
+        scanned: int
+    ) -> None:
+        """백필 한 페이지의 색인 항목과 진행 상태를 한 트랜잭션으로 저장."""
+        try:
+            with self._conn:
+                self._conn.executemany(_UPSERT_SQL, [_entry_row(entry) for entry in entries])
+                self._conn.execute(
+                    """
+                    INSERT INTO backfill_state
+                        (channel_id, before_message_id, completed, scanned, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (channel_id) DO UPDATE SET
+                        before_message_id = excluded.before_message_id,
+                        completed = excluded.completed,
+                        scanned = excluded.scanned,
+                        updated_at = excluded.updated_at
+                    """,
+                    (channel_id, before_message_id, int(completed), scanned, time.time())
+                )
+        except sqlite3.Error as e:
+            logger.error("차단 로그 백필 저장 실패: %s", e)
+            return
+        self._add_names(entries)
+
+    def _name_index(self) -> NameSearchIndex:
+        if self._names is None:
+            started = time.monotonic()
+            # 이름별 가장 최근 로그의 표기를 사용
+            rows = self._conn.execute(
+                "SELECT username, MAX(created_at) FROM ban_logs GROUP BY name_key"
+            ).fetchall()
+            self._names = NameSearchIndex(row[0] for row in rows)
+            logger.debug(
+                "차단 로그 이름 색인 생성: %d명",
+                len(self._names),
+                extra={"names": len(self._names), "latency": round(time.monotonic() - started, 3)}
+            )
+        return self._names
+
+    def _add_names(self, entries: List[BanLogEntry]) -> None:
+        if self._names is not None:
+            for entry in entries:
+                self._names.add(entry.username)
+
+    def _select(self, clause: str, params: tuple) -> List[BanLogEntry]:
+        try:
+            rows = self._conn.execute(
+                f"""
+                SELECT message_id, channel_id, username, uuid, ip, reason, author, jump_url, created_at,
+                       COALESCE(kind, '{KIND_BAN}') AS kind
+                FROM ban_logs
+                {clause}
+                """,
+                params
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error("차단 로그 색인 조회 실패: %s", e)
+            return []
+        return [BanLogEntry(**dict(row)) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
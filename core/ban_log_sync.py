@@ -0,0 +1,298 @@
+"""차단 로그 채널과 로컬 색인 동기화."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional
+
+import discord
+from discord.ext import commands
+
+from .ban_log_store import BanLogEntry, BanLogStore, parse_ban_log
+from .config import get_config
+from .player_cache import normalize_player_name
+from utils.constants import (
+    BAN_LOG_BACKFILL_MAX_RETRIES,
+    BAN_LOG_BACKFILL_PAGE_DELAY,
+    BAN_LOG_BACKFILL_PAGE_SIZE,
+    BAN_LOG_BACKFILL_REPORT_PAGES,
+    BAN_LOG_SEED_LIMIT,
+    BAN_LOG_SYNC_BATCH,
+    BAN_LOG_SYNC_MAX_RETRIES,
+    BAN_LOG_SYNC_RETRY_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BackfillProgress:
+    """이번 실행에서 진행된 백필 (scanned는 확인한 메시지, indexed는 색인된 차단 로그 수)."""
+
+    scanned: int = 0
+    indexed: int = 0
+    pages: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    completed: bool = False
+
+    @property
+    def rate(self) -> float:
+        """초당 확인한 메시지 수."""
+        elapsed = time.monotonic() - self.started_at
+        return self.scanned / elapsed if elapsed > 0 else 0.0
+
+
+class BanLogSync:
+    """차단 로그 채널의 변경을 BanLogStore에 반영하는 동기화기.
+
+    마지막으로 반영한 메시지 ID(동기화 위치)를 색인과 함께 저장해 두고, 시작할 때는
+    그 이후의 메시지만 읽는다. 이후에는 메시지 생성/수정/삭제 이벤트로 색인을 갱신한다.
+    동기화 위치가 없으면 최근 BAN_LOG_SEED_LIMIT개 메시지를 먼저 색인하고, 따라잡기가
+    끝나면 그보다 오래된 전체 기록을 백그라운드에서 거슬러 올라가며 색인한다(백필).
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.channel_id = get_config().BAN_LOG_CHANNEL_ID
+        self._task: Optional[asyncio.Task] = None
+        self._caught_up = False
+        self.backfill: Optional[BackfillProgress] = None
+
+    @property
+    def caught_up(self) -> bool:
+        return self._caught_up
+
+    @property
+    def covers_history(self) -> bool:
+        """색인이 채널 전체 기록을 담고 있는지 (따라잡기와 백필이 모두 끝남)."""
+        return self._caught_up and BanLogStore().backfill_state(self.channel_id)[1]
+
+    def start(self) -> None:
+        """따라잡기 후 백필 작업 실행."""
+        if not self.channel_id:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def logs(self, channel: discord.TextChannel, player: Optional[str] = None) -> AsyncIterator[BanLogEntry]:
+        """채널의 모든 차단 로그 (player가 있으면 닉네임이 정확히 일치하는 로그만, 대소문자 무시).
+
+        색인이 전체 기록을 담고 있으면 색인에서 읽고, 따라잡기나 백필이 끝나지 않았으면
+        채널 전체 기록을 직접 읽는다. 색인에서 읽을 때는 오래된 순, 채널에서 읽을 때는 최신순.
+        색인에서 읽은 항목(fetched가 False)은 봇이 꺼져 있던 동안의 수정/삭제가 반영되지
+        않았을 수 있으므로 메시지를 지우기 전에 `refresh`로 확인해야 한다.
+        """
+        if channel.id == self.channel_id and self.covers_history:
+            for entry in BanLogStore().channel_logs(channel.id, player):
+                yield entry
+            return
+
+        logger.info("차단 로그 색인이 전체 기록을 담고 있지 않아 채널 기록을 직접 확인: %s", channel.id)
+        player_key = normalize_player_name(player) if player else None
+        async for message in channel.history(limit=None):
+            entry = parse_ban_log(message)
+            if entry is not None and (player_key is None or normalize_player_name(entry.username) == player_key):
+                yield entry
+
+    async def refresh(self, channel: discord.TextChannel, message_id: int) -> Optional[BanLogEntry]:
+        """메시지를 다시 읽어 색인을 갱신하고 지금 내용의 항목 반환.
+
+        메시지가 삭제되었거나 더 이상 차단 로그가 아니면 색인에서 빼고 None, 읽기에
+        실패하면 색인은 그대로 두고 None.
+        """
+        try:
+            message = await channel.fetch_message(message_id)
+        except discord.NotFound:
+            BanLogStore().delete([message_id])
+            return None
+        except discord.HTTPException as e:
+            logger.warning("차단 로그 메시지 조회 실패: %s | %s", message_id, e)
+            return None
+
+        entry = parse_ban_log(message)
+        if entry is None:
+            BanLogStore().delete([message_id])
+        else:
+            BanLogStore().upsert([entry])
+        return entry
+
+    def on_message(self, message: discord.Message) -> None:
+        """새 메시지 색인 (따라잡기가 끝난 뒤에만 동기화 위치를 옮김)."""
+        if not self.channel_id or message.channel.id != self.channel_id:
+            return
+        store = BanLogStore()
+        store.index_message(message)
+        if self._caught_up:
+            store.set_checkpoint(self.channel_id, message.id)
+
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """수정된 메시지를 다시 읽어 색인 갱신 (더 이상 차단 로그가 아니면 제거)."""
+        if not self.channel_id or payload.channel_id != self.channel_id:
+            return
+        if "content" not in payload.data:
+            return
+
+        channel = self._channel()
+        if channel is not None:
+            await self.refresh(channel, payload.message_id)
+
+    def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        if self.channel_id and payload.channel_id == self.channel_id:
+            BanLogStore().delete([payload.message_id])
+
+    def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        if self.channel_id and payload.channel_id == self.channel_id:
+            BanLogStore().delete(payload.message_ids)
+
+    def _channel(self) -> Optional[discord.TextChannel]:
+        guild = self.bot.get_guild(get_config().TARGET_GUILD_ID)
+        return guild.get_channel(self.channel_id) if guild else None
+
+    async def _run(self) -> None:
+        channel = self._channel()
+        if channel is None:
+            logger.warning("차단 로그 채널을 찾을 수 없어 동기화하지 않음: %s", self.channel_id)
+            return
+
+        # 따라잡기가 실패하면 저장된 동기화 위치부터 대기 시간을 늘려 가며 다시 시도
+        failures = 0
+        while not await self._catch_up(channel):
+            failures += 1
+            if failures > BAN_LOG_SYNC_MAX_RETRIES:
+                logger.error("차단 로그 동기화 중단: %d번 재시도 실패 (다음 시작 때 다시 시도)", BAN_LOG_SYNC_MAX_RETRIES)
+                return
+            delay = BAN_LOG_SYNC_RETRY_DELAY * 2 ** (failures - 1)
+            logger.warning("차단 로그 동기화 %.0f초 후 재시도 (%d/%d)", delay, failures, BAN_LOG_SYNC_MAX_RETRIES)
+            await asyncio.sleep(delay)
+        await self._backfill(channel)
+
+    async def _catch_up(self, channel: discord.TextChannel) -> bool:
+        """동기화 위치 이후의 메시지를 오래된 순으로 읽어 색인하고 끝까지 읽었으면 True 반환.
+
+        BAN_LOG_SYNC_BATCH개마다 색인과 동기화 위치를 함께 저장하므로 중간에 실패하거나
+        종료되어도 다음 시도 때 그 지점부터 이어서 읽는다.
+        """
+        store = BanLogStore()
+        checkpoint = store.checkpoint(channel.id)
+        if checkpoint is None:
+            history = channel.history(limit=BAN_LOG_SEED_LIMIT)
+        else:
+            history = channel.history(limit=None, after=discord.Object(id=checkpoint), oldest_first=True)
+
+        entries: List[BanLogEntry] = []
+        newest = checkpoint or 0
+        oldest: Optional[int] = None
+        scanned = 0
+        try:
+            async for message in history:
+                scanned += 1
+                newest = max(newest, message.id)
+                oldest = message.id if oldest is None else min(oldest, message.id)
+                entry = parse_ban_log(message)
+                if entry is not None:
+                    entries.append(entry)
+                # 최근 메시지부터 읽는 첫 색인은 끝까지 읽은 뒤에만 위치를 저장
+                if checkpoint is not None and scanned % BAN_LOG_SYNC_BATCH == 0:
+                    store.upsert(entries)
+                    store.set_checkpoint(channel.id, newest)
+                    entries = []
+        except discord.HTTPException as e:
+            logger.warning("차단 로그 동기화 실패: %s", e)
+            store.upsert(entries)
+            if checkpoint is not None and newest:
+                store.set_checkpoint(channel.id, newest)
+            return False
+
+        store.upsert(entries)
+        if newest:
+            store.set_checkpoint(channel.id, newest)
+        # 첫 색인이 읽은 가장 오래된 메시지부터 백필을 이어감
+        if checkpoint is None:
+            store.save_backfill(channel.id, [], oldest, oldest is None, 0)
+        self._caught_up = True
+        logger.info(
+            "차단 로그 동기화 완료: 메시지 %d개 확인",
+            scanned,
+            extra={"channel_id": channel.id, "scanned": scanned, "checkpoint": newest}
+        )
+        return True
+
+    async def _backfill(self, channel: discord.TextChannel) -> None:
+        """가장 오래된 색인 항목 이전의 기록을 최신 순으로 한 페이지씩 읽어 색인.
+
+        페이지마다 색인 항목과 다음 위치를 한 트랜잭션으로 저장하므로 재시작하면 멈춘
+        페이지부터 이어서 읽는다. 요청 한도(429)는 discord 클라이언트가 대기 후 재시도하며,
+        그 밖의 오류는 지수적으로 대기 시간을 늘려 BAN_LOG_BACKFILL_MAX_RETRIES번까지 재시도한다.
+        """
+        store = BanLogStore()
+        cursor, completed, scanned_total = store.backfill_state(channel.id)
+        if completed:
+            return
+        if cursor is None:
+            cursor = store.oldest_message_id(channel.id) or store.checkpoint(channel.id)
+        if cursor is None:
+            store.save_backfill(channel.id, [], None, True, scanned_total)
+            return
+
+        progress = self.backfill = BackfillProgress()
+        logger.info("차단 로그 백필 시작: %s 이전", cursor, extra={"channel_id": channel.id, "cursor": cursor})
+        failures = 0
+        while True:
+            try:
+                page = [
+                    message async for message in channel.history(
+                        limit=BAN_LOG_BACKFILL_PAGE_SIZE, before=discord.Object(id=cursor)
+                    )
+                ]
+            except discord.HTTPException as e:
+                failures += 1
+                if failures > BAN_LOG_BACKFILL_MAX_RETRIES:
+                    logger.error("차단 로그 백필 중단 (다음 시작 때 이어서 진행): %s", e)
+                    return
+                delay = BAN_LOG_BACKFILL_PAGE_DELAY * 2 ** failures
+                logger.warning("차단 로그 백필 페이지 조회 실패, %.0f초 후 재시도: %s", delay, e)
+                await asyncio.sleep(delay)
+                continue
+            failures = 0
+
+            if not page:
+                store.save_backfill(channel.id, [], cursor, True, scanned_total)
+                progress.completed = True
+                self._report(progress, channel.id, "차단 로그 백필 완료")
+                return
+
+            entries = [entry for entry in map(parse_ban_log, page) if entry is not None]
+            cursor = min(message.id for message in page)
+            scanned_total += len(page)
+            store.save_backfill(channel.id, entries, cursor, False, scanned_total)
+
+            progress.scanned += len(page)
+            progress.indexed += len(entries)
+            progress.pages += 1
+            if progress.pages % BAN_LOG_BACKFILL_REPORT_PAGES == 0:
+                self._report(progress, channel.id, "차단 로그 백필 진행")
+
+            await asyncio.sleep(BAN_LOG_BACKFILL_PAGE_DELAY)
+
+    @staticmethod
+    def _report(progress: BackfillProgress, channel_id: int, title: str) -> None:
+        logger.info(
+            "%s: 메시지 %d개 확인, 차단 로그 %d개 색인, %.1f msg/s",
+            title, progress.scanned, progress.indexed, progress.rate,
+            extra={
+                "channel_id": channel_id,
+                "scanned": progress.scanned,
+                "indexed": progress.indexed,
+                "msgs_per_sec": round(progress.rate, 1),
+            }
+        )
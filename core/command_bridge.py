@@ -1,15 +1,21 @@
 """Command bridge for sending commands to different channels."""
 import logging
-from typing import Optional
+import time
+from typing import Any, Callable, Optional
 
 import discord
 from discord.ext import commands
 
+from .base import CommandResult
 from .config import get_config
+from .latency import ConsoleLatencyTracker
 
 config = get_config()
 logger = logging.getLogger(__name__)
 
+CONSOLE_SEND_FAILED = "콘솔 명령어 전송 실패"
+CONSOLE_NO_RESPONSE = "콘솔 응답 없음"
+
 
 class CommandBridge:
     """다른 채널로 명령어를 전달하는 브리지 클래스."""
@@ -50,7 +56,7 @@ class CommandBridge:
         except (discord.HTTPException, discord.Forbidden, discord.NotFound):
             return False
         except Exception as e:
-            logger.error(f"명령어 전송 실패: {e}")
+            logger.error("명령어 전송 실패: %s", e, extra={"command": command})
             return False
 
     @staticmethod
@@ -89,6 +95,115 @@ class CommandBridge:
             silent=silent
         )
 
+    @staticmethod
+    async def request_console_response(
+        bot: commands.Bot,
+        command: str,
+        executor: str,
+        timeout: Optional[float] = None,
+        match: Optional[Callable[[str], bool]] = None
+    ) -> CommandResult[str]:
+        """콘솔 명령어를 전송하고 그 명령어가 만든 응답 블록을 반환.
+
+        전송 전에 요청을 등록하고 응답 블록을 요청 순서대로 한 번씩만 배정하므로,
+        여러 조회가 동시에 실행되어도 각자 자신의 응답만 받는다. 응답 형식이 알려지지
+        않은 명령어(`cmi info`, `list` 외)는 match를 지정해야 한다 (없으면 ValueError).
+        timeout을 생략하면 관측된 콘솔 응답 시간으로 정한 상한을 사용한다.
+        """
+        timeout = ConsoleLatencyTracker().deadline() if timeout is None else timeout
+        listener = getattr(bot, "console_listener", None)
+        if listener is None or listener.channel_id != config.ILUNAR_CONSOLE_CHANNEL_ID:
+            return await CommandBridge._request_console_response_legacy(bot, command, executor, timeout)
+
+        request = listener.open_request(command.strip(), match)
+        return await CommandBridge._exchange(bot, listener, request, executor, timeout)
+
+    @staticmethod
+    async def collect_console_lines(
+        bot: commands.Bot,
+        command: str,
+        executor: str,
+        collector: Any,
+        timeout: Optional[float] = None
+    ) -> CommandResult[Any]:
+        """콘솔 명령어를 전송하고 도착하는 줄을 collector에 넘겨 결과 수집.
+
+        collector.feed(line)이 True를 반환한 메시지까지만 받고 완료되므로 블록 종료나
+        고정 대기를 기다리지 않는다.
+        """
+        timeout = ConsoleLatencyTracker().deadline() if timeout is None else timeout
+        listener = getattr(bot, "console_listener", None)
+        if listener is None or listener.channel_id != config.ILUNAR_CONSOLE_CHANNEL_ID:
+            response = await CommandBridge._request_console_response_legacy(bot, command, executor, timeout)
+            if not response:
+                return response
+            for line in response.data.split('\n'):
+                collector.feed(line)
+            return CommandResult.success_with(collector.result())
+
+        request = listener.open_request(command.strip(), collector=collector)
+        return await CommandBridge._exchange(bot, listener, request, executor, timeout)
+
+    @staticmethod
+    async def _exchange(
+        bot: commands.Bot,
+        listener: Any,
+        request: Any,
+        executor: str,
+        timeout: float
+    ) -> CommandResult[Any]:
+        """등록된 요청의 명령어를 전송하고 응답을 기다리며 응답 시간을 기록."""
+        latency = ConsoleLatencyTracker()
+        try:
+            sent_at = time.monotonic()
+            if not await CommandBridge.send_console_command(bot, request.command, executor, silent=True):
+                return CommandResult.failure(CONSOLE_SEND_FAILED)
+
+            result = await listener.wait_request(request, timeout)
+            answered = request.future.done()
+            elapsed = time.monotonic() - sent_at
+            latency.record(elapsed if answered else timeout)
+            logger.debug(
+                "콘솔 명령어 응답: %s | %.2fs | %s", request.command, elapsed,
+                "응답" if answered else "시간 초과",
+                extra={
+                    "command": request.command,
+                    "executor": executor,
+                    "latency": round(elapsed, 3),
+                    "answered": answered,
+                }
+            )
+
+            if result is None:
+                return CommandResult.failure(CONSOLE_NO_RESPONSE)
+            return CommandResult.success_with(result)
+        finally:
+            listener.close_request(request)
+
+    @staticmethod
+    async def _request_console_response_legacy(
+        bot: commands.Bot,
+        command: str,
+        executor: str,
+        timeout: float
+    ) -> CommandResult[str]:
+        """콘솔 리스너가 없을 때 채널 기록 조회 방식으로 응답 수집."""
+        from utils.utils import ConsoleResponseHandler
+
+        if not await CommandBridge.send_console_command(bot, command, executor, silent=True):
+            return CommandResult.failure(CONSOLE_SEND_FAILED)
+
+        handler = ConsoleResponseHandler(bot, config.ILUNAR_CONSOLE_CHANNEL_ID)
+        parts = command.split()
+        if parts and parts[0].lower() == "list":
+            keywords = ["Players online"]
+        else:
+            keywords = parts[2:3] if command.lower().startswith("cmi info") else None
+        response = await handler.wait_for_response(executor, timeout=timeout, keywords=keywords)
+        if response is None:
+            return CommandResult.failure(CONSOLE_NO_RESPONSE)
+        return CommandResult.success_with(response)
+
 
 async def send_proxy_command(bot: commands.Bot, command: str, ctx: discord.ApplicationContext) -> bool:
     """프록시 명령어 전송 (하위 호환성)."""
@@ -103,3 +218,25 @@ async def send_ilunar_command(bot: commands.Bot, command: str, ctx: discord.Appl
 async def send_console_command(bot: commands.Bot, command: str, executor: str, silent: bool = False) -> bool:
     """콘솔 명령어 전송 (하위 호환성)."""
     return await CommandBridge.send_console_command(bot, command, executor, silent)
+
+
+async def request_console_response(
+    bot: commands.Bot,
+    command: str,
+    executor: str,
+    timeout: Optional[float] = None,
+    match: Optional[Callable[[str], bool]] = None
+) -> CommandResult[str]:
+    """콘솔 명령어 전송 후 해당 응답 반환."""
+    return await CommandBridge.request_console_response(bot, command, executor, timeout, match)
+
+
+async def collect_console_lines(
+    bot: commands.Bot,
+    command: str,
+    executor: str,
+    collector: Any,
+    timeout: Optional[float] = None
+) -> CommandResult[Any]:
+    """콘솔 명령어 전송 후 줄 단위로 결과 수집."""
+    return await CommandBridge.collect_console_lines(bot, command, executor, collector, timeout)
@@ -29,6 +29,8 @@ class Config:
     LOG_LEVEL: str = "INFO"
     PROJECT_ROOT: Path = Path(__file__).parent.parent
     EMBED_FOOTER: str = "HiRest Management Bot"
+    PLAYER_CACHE_TTL: float = 120.0
+    PLAYER_CACHE_SIZE: int = 256
     
     def __post_init__(self) -> None:
         """Discord 관련 로거 설정."""
@@ -60,6 +62,15 @@ def get_config() -> Config:
         except ValueError:
             return default
 
+    def get_float(key: str, default: float) -> float:
+        value = os.getenv(key)
+        if not value:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            return default
+
     def get_bool(key: str, default: bool = False) -> bool:
         return os.getenv(key, "").lower() in ("true", "1", "yes", "on")
 
@@ -82,5 +93,7 @@ def get_config() -> Config:
         STAFF_ROLE_ID=get_int("STAFF_ROLE_ID", 0),
         DEBUG_MODE=get_bool("DEBUG_MODE"),
         LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO"),
-        EMBED_FOOTER=os.getenv("EMBED_FOOTER", "HiRest Management Bot")
+        EMBED_FOOTER=os.getenv("EMBED_FOOTER", "HiRest Management Bot"),
+        PLAYER_CACHE_TTL=get_float("PLAYER_CACHE_TTL", 120.0),
+        PLAYER_CACHE_SIZE=get_int("PLAYER_CACHE_SIZE", 256)
     )
\ No newline at end of file
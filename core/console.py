@@ -0,0 +1,244 @@
+"""콘솔 채널 이벤트 기반 응답 수신."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import discord
+
+from utils.utils import CONSOLE_TIMESTAMP_PATTERN, ConsoleBlockAssembler
+
+logger = logging.getLogger(__name__)
+
+CONSOLE_BUFFER_SIZE = 200
+CONSOLE_BLOCK_LIMIT = 100
+
+BlockMatcher = Callable[[str], bool]
+LineHandler = Callable[[str], None]
+
+
+def _first_line(block: str) -> str:
+    """타임스탬프를 제거한 블록의 첫 번째 내용 줄."""
+    for line in block.split('\n'):
+        cleaned = CONSOLE_TIMESTAMP_PATTERN.sub('', line).strip()
+        if cleaned:
+            return cleaned
+    return ""
+
+
+def console_response_matcher(command: str) -> Optional[BlockMatcher]:
+    """명령어로부터 그 명령어가 만든 응답 블록을 식별하는 판별 함수 생성.
+
+    콘솔은 요청 토큰을 되돌려주지 않으므로 응답 내용 자체로 요청을 식별한다.
+    `cmi info <player>`는 첫 줄에 해당 플레이어명이 단어로 있는 블록, `list`는
+    접속자 목록 블록과 일치한다. 그 외 명령어는 응답 형식을 알 수 없어 None을 반환한다
+    (아무 블록이나 점유하면 다른 요청의 응답을 가져가므로).
+    """
+    parts = command.split()
+    if len(parts) >= 3 and parts[0].lower() == "cmi" and parts[1].lower() == "info":
+        name_pattern = re.compile(
+            rf'(?<![A-Za-z0-9_]){re.escape(parts[2])}(?![A-Za-z0-9_])', re.IGNORECASE
+        )
+        return lambda block: name_pattern.search(_first_line(block)) is not None
+    if parts and parts[0].lower() == "list":
+        return lambda block: "Players online" in block
+    return None
+
+
+@dataclass
+class ConsoleEntry:
+    """버퍼에 보관된 콘솔 메시지 (줄 단위로 분리됨)."""
+
+    message_id: int
+    received_at: float
+    lines: List[str]
+
+
+@dataclass
+class ConsoleBlock:
+    """구분선으로 감싸진 완성된 콘솔 블록."""
+
+    key: Tuple[int, int]
+    started_at: float
+    text: str
+    claimed: bool = False
+
+
+@dataclass
+class ConsoleRequest:
+    """전송 전에 등록되어 자신의 응답 블록 하나를 점유하는 콘솔 요청.
+
+    collector가 있으면 블록 대신 도착하는 줄을 하나씩 넘겨주고, collector.feed()가
+    True를 반환한 메시지의 나머지 줄까지 넘긴 뒤 collector.result()로 완료된다
+    (같은 메시지의 줄은 이미 도착해 있으므로 기다리는 시간은 늘지 않는다).
+    """
+
+    command: str
+    match: Optional[BlockMatcher]
+    since: float
+    future: asyncio.Future
+    collector: Optional[Any] = None
+
+
+class ConsoleListener:
+    """게이트웨이 이벤트로 채워지는 콘솔 채널 링 버퍼.
+
+    MESSAGE_CREATE/MESSAGE_UPDATE로 받은 메시지를 줄과 블록으로 미리 분리해
+    보관하므로, 응답 조회는 REST 호출이나 재분리 없이 버퍼에서 처리된다.
+    완성된 블록은 먼저 등록된 요청부터 순서대로 제시되며, 한 블록은 한 요청만
+    점유하므로 동시에 실행된 조회가 서로의 응답을 가져가지 않는다.
+    """
+
+    def __init__(self, channel_id: int) -> None:
+        self.channel_id = channel_id
+        self._entries: Deque[ConsoleEntry] = deque(maxlen=CONSOLE_BUFFER_SIZE)
+        self._blocks: Deque[ConsoleBlock] = deque(maxlen=CONSOLE_BLOCK_LIMIT)
+        self._received: Dict[int, float] = {}
+        self._assembler = ConsoleBlockAssembler()
+        self._requests: List[ConsoleRequest] = []
+        self._line_handlers: List[LineHandler] = []
+
+    def add_line_handler(self, handler: LineHandler) -> None:
+        """새 메시지의 줄을 하나씩 전달받을 처리기 등록 (접속 기록 수집 등)."""
+        self._line_handlers.append(handler)
+
+    def feed(self, message: discord.Message) -> None:
+        """새 메시지(MESSAGE_CREATE) 처리."""
+        if message.channel.id != self.channel_id or not message.content:
+            return
+
+        entry = ConsoleEntry(message.id, time.monotonic(), message.content.split('\n'))
+        if len(self._entries) == self._entries.maxlen:
+            self._received.pop(self._entries[0].message_id, None)
+        self._entries.append(entry)
+        self._received[entry.message_id] = entry.received_at
+        self._feed_lines(entry)
+        self._run_line_handlers(entry)
+        for block in self._consume(entry):
+            self._dispatch(block)
+
+    def update(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """수정된 메시지(MESSAGE_UPDATE) 반영."""
+        if payload.channel_id != self.channel_id:
+            return
+
+        content = payload.data.get("content")
+        if content is None:
+            return
+
+        for entry in self._entries:
+            if entry.message_id == payload.message_id:
+                entry.lines = content.split('\n')
+                self._rebuild()
+                return
+
+    def open_request(
+        self,
+        command: str,
+        match: Optional[BlockMatcher] = None,
+        collector: Optional[Any] = None
+    ) -> ConsoleRequest:
+        """명령어 전송 전에 요청 등록.
+
+        Args:
+            command: 전송할 명령어
+            match: 응답 블록 판별 함수 (없으면 명령어로부터 생성)
+            collector: 줄 단위 수집기 (feed(line) -> bool, result())
+
+        Raises:
+            ValueError: collector가 없고 응답 블록을 식별할 방법도 없는 경우
+        """
+        match = match or console_response_matcher(command)
+        if match is None and collector is None:
+            raise ValueError(f"응답 블록을 식별할 수 없는 명령어: {command}")
+        request = ConsoleRequest(
+            command=command,
+            match=match,
+            since=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+            collector=collector
+        )
+        self._requests.append(request)
+        return request
+
+    def close_request(self, request: ConsoleRequest) -> None:
+        """요청 등록 해제."""
+        if request in self._requests:
+            self._requests.remove(request)
+
+    async def wait_request(self, request: ConsoleRequest, timeout: float) -> Optional[Any]:
+        """요청의 응답 대기.
+
+        시간 초과 시 블록 요청은 None, 줄 단위 요청은 그때까지 수집된 결과를 반환한다.
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(request.future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.debug(
+                "콘솔 요청 응답 시간 초과 (%.1f초): %s", timeout, request.command,
+                extra={"command": request.command, "timeout": timeout}
+            )
+            return request.collector.result() if request.collector is not None else None
+
+    def _feed_lines(self, entry: ConsoleEntry) -> None:
+        """줄 단위 요청에 새 메시지의 줄 전달."""
+        for request in self._requests:
+            if request.collector is None or request.future.done():
+                continue
+            done = False
+            for line in entry.lines:
+                done = request.collector.feed(line) or done
+            if done:
+                request.future.set_result(request.collector.result())
+
+    def _run_line_handlers(self, entry: ConsoleEntry) -> None:
+        for handler in self._line_handlers:
+            try:
+                for line in entry.lines:
+                    handler(line)
+            except Exception as e:
+                logger.error("콘솔 줄 처리기 오류: %s", e)
+
+    def _consume(self, entry: ConsoleEntry) -> List[ConsoleBlock]:
+        """메시지 줄을 조립기에 넣고 새로 완성된 블록 반환."""
+        completed: List[ConsoleBlock] = []
+
+        for assembled in self._assembler.feed(entry.message_id, entry.lines):
+            started_at = self._received.get(assembled.key[0], entry.received_at)
+            block = ConsoleBlock(assembled.key, started_at, assembled.text)
+            self._blocks.append(block)
+            completed.append(block)
+
+        return completed
+
+    def _rebuild(self) -> None:
+        """수정된 메시지를 반영하여 블록 재구성 (점유 상태 유지)."""
+        claimed: Set[Tuple[int, int]] = {block.key for block in self._blocks if block.claimed}
+        self._blocks.clear()
+        self._assembler = ConsoleBlockAssembler()
+        for entry in sorted(self._entries, key=lambda e: e.message_id):
+            self._consume(entry)
+
+        for block in self._blocks:
+            if block.key in claimed:
+                block.claimed = True
+            else:
+                self._dispatch(block)
+
+    def _dispatch(self, block: ConsoleBlock) -> None:
+        """완성된 블록을 먼저 등록된 요청부터 제시하여 하나의 요청에 배정."""
+        if block.claimed:
+            return
+
+        for request in self._requests:
+            if request.collector is not None or request.future.done() or block.started_at < request.since:
+                continue
+            if request.match(block.text):
+                block.claimed = True
+                request.future.set_result(block.text)
+                return
@@ -0,0 +1,66 @@
+"""콘솔 응답 지연 시간 추적."""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Optional
+
+from .base import Singleton
+from utils.constants import (
+    CONSOLE_DEADLINE_FACTOR,
+    CONSOLE_DEADLINE_MAX,
+    CONSOLE_DEADLINE_MIN,
+    CONSOLE_DEADLINE_PERCENTILE,
+    CONSOLE_HEDGE_PERCENTILE,
+    CONSOLE_LATENCY_MIN_SAMPLES,
+    CONSOLE_LATENCY_WINDOW,
+    CONSOLE_RESPONSE_DELAY,
+)
+
+
+class ConsoleLatencyTracker(metaclass=Singleton):
+    """콘솔 명령어 전송부터 응답까지의 지연 시간을 최근 구간으로 기록하고 대기 시간을 계산.
+
+    응답 대기 상한은 관측된 p99 × 1.5, 재시도 간격은 p50으로 정하므로 서버가 빠르면
+    빨리 끝나고, 느려지면 그만큼 더 기다린다. 시간 초과된 요청은 대기한 시간을 그대로
+    표본으로 남겨 지연이 길어질 때 상한이 따라 늘어나도록 한다.
+    """
+
+    def __init__(self) -> None:
+        self._samples: Deque[float] = deque(maxlen=CONSOLE_LATENCY_WINDOW)
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """지연 시간 표본 기록."""
+        if seconds >= 0:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 표본의 백분위수 (표본이 부족하면 None)."""
+        if len(self._samples) < CONSOLE_LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def deadline(self, attempt: int = 0) -> float:
+        """응답 대기 상한 (재시도마다 늘어남)."""
+        tail = self.percentile(CONSOLE_DEADLINE_PERCENTILE)
+        base = CONSOLE_RESPONSE_DELAY if tail is None else tail * CONSOLE_DEADLINE_FACTOR
+        return min(CONSOLE_DEADLINE_MAX, max(CONSOLE_DEADLINE_MIN, base * (attempt + 1)))
+
+    def hedge_delay(self) -> float:
+        """응답이 이보다 늦으면 예상보다 느린 것으로 보고 추가 요청을 보낼 시간 (p95)."""
+        tail = self.percentile(CONSOLE_HEDGE_PERCENTILE)
+        base = CONSOLE_RESPONSE_DELAY / 2 if tail is None else tail
+        return min(CONSOLE_DEADLINE_MAX, max(CONSOLE_DEADLINE_MIN, base))
+
+    def expected(self) -> float:
+        """일반적인 응답 시간 (p50, 재시도 간격 등에 사용)."""
+        median = self.percentile(0.5)
+        if median is None:
+            return CONSOLE_DEADLINE_MIN
+        return min(CONSOLE_DEADLINE_MAX, max(0.1, median))
@@ -0,0 +1,144 @@
+"""채널 메시지 일괄 삭제."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Set, Tuple
+
+import discord
+
+from utils.constants import (
+    BULK_DELETE_BATCH_SIZE,
+    BULK_DELETE_MAX_AGE_DAYS,
+    SINGLE_DELETE_CONCURRENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+# 작성 시각이 경계에 걸친 메시지가 요청 도중 14일을 넘기지 않도록 두는 여유
+_BULK_AGE_MARGIN = timedelta(minutes=5)
+
+
+def split_by_age(message_ids: Iterable[int]) -> Tuple[List[int], List[int]]:
+    """(일괄 삭제 가능한 최근 메시지, 하나씩 지워야 하는 오래된 메시지) ID로 분리.
+
+    Discord의 일괄 삭제는 14일이 지난 메시지가 하나라도 섞이면 요청 전체가 실패하므로
+    메시지 ID(snowflake)에 담긴 작성 시각으로 미리 나눈다.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=BULK_DELETE_MAX_AGE_DAYS) + _BULK_AGE_MARGIN
+    boundary = discord.utils.time_snowflake(cutoff, high=True)
+    recent: List[int] = []
+    old: List[int] = []
+    for message_id in dict.fromkeys(message_ids):  # 중복 ID도 일괄 삭제를 실패시킴
+        (recent if message_id > boundary else old).append(message_id)
+    return recent, old
+
+
+async def delete_messages(channel: discord.TextChannel, message_ids: Iterable[int]) -> Set[int]:
+    """메시지를 가능한 한 적은 요청으로 삭제하고 삭제된 메시지 ID 반환.
+
+    14일 이내 메시지는 BULK_DELETE_BATCH_SIZE개씩 `delete_messages`로 한 번에 지우고,
+    오래된 메시지는 SINGLE_DELETE_CONCURRENCY개까지 동시에 하나씩 지운다. 요청 한도(429)는
+    discord 클라이언트가 버킷별로 대기 후 재시도한다. 이미 삭제된 메시지는 결과에 넣지 않는다.
+    """
+    recent, old = split_by_age(message_ids)
+    started = time.monotonic()
+
+    deleted: Set[int] = set()
+    for start in range(0, len(recent), BULK_DELETE_BATCH_SIZE):
+        deleted.update(await _delete_batch(channel, recent[start:start + BULK_DELETE_BATCH_SIZE]))
+
+    deleted.update(await _delete_each(channel, old))
+
+    if recent or old:
+        logger.info(
+            "메시지 %d개 삭제 (일괄 %d개, 개별 %d개)",
+            len(deleted), len(recent), len(old),
+            extra={
+                "channel_id": channel.id,
+                "deleted": len(deleted),
+                "bulk": len(recent),
+                "single": len(old),
+                "latency": round(time.monotonic() - started, 3),
+            }
+        )
+    return deleted
+
+
+class StreamingDeleter:
+    """스캔하는 동안 삭제 대상 ID를 받아 BULK_DELETE_BATCH_SIZE개가 모일 때마다 백그라운드에서 삭제.
+
+    `async with StreamingDeleter(channel) as deleter:` 안에서 `deleter.add(message_id)`를
+    호출하면 채널을 계속 읽는 동안 앞서 모인 묶음이 삭제된다. 블록을 정상적으로 빠져나가면
+    남은 ID까지 삭제하고, 예외로 빠져나가면 이미 넘긴 묶음만 삭제한다. 삭제된 ID는 `deleted`.
+    """
+
+    def __init__(self, channel: discord.TextChannel) -> None:
+        self.channel = channel
+        self.deleted: Set[int] = set()
+        self._pending: List[int] = []
+        self._queue: "asyncio.Queue[Optional[List[int]]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "StreamingDeleter":
+        self._worker = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self._pending:
+            self._queue.put_nowait(self._pending)
+        self._pending = []
+        self._queue.put_nowait(None)
+        if self._worker is not None:
+            await self._worker
+
+    def add(self, message_id: int) -> None:
+        self._pending.append(message_id)
+        if len(self._pending) >= BULK_DELETE_BATCH_SIZE:
+            self._queue.put_nowait(self._pending)
+            self._pending = []
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._queue.get()
+            if batch is None:
+                return
+            self.deleted.update(await delete_messages(self.channel, batch))
+
+
+async def _delete_batch(channel: discord.TextChannel, batch: List[int]) -> List[int]:
+    """최근 메시지 한 묶음 삭제 (실패하면 그 묶음만 하나씩 다시 시도)."""
+    if len(batch) > 1:
+        try:
+            await channel.delete_messages([discord.Object(id=message_id) for message_id in batch])
+            return batch
+        except discord.HTTPException as e:
+            logger.warning("일괄 삭제 실패, 개별 삭제로 전환: %s", e)
+    return await _delete_each(channel, batch)
+
+
+async def _delete_each(channel: discord.TextChannel, message_ids: List[int]) -> List[int]:
+    """SINGLE_DELETE_CONCURRENCY개까지 동시에 하나씩 삭제."""
+    if not message_ids:
+        return []
+    semaphore = asyncio.Semaphore(SINGLE_DELETE_CONCURRENCY)
+
+    async def delete_one(message_id: int) -> bool:
+        async with semaphore:
+            return await _delete_single(channel, message_id)
+
+    results = await asyncio.gather(*(delete_one(message_id) for message_id in message_ids))
+    return [message_id for message_id, ok in zip(message_ids, results) if ok]
+
+
+async def _delete_single(channel: discord.TextChannel, message_id: int) -> bool:
+    try:
+        await channel.get_partial_message(message_id).delete()
+        return True
+    except discord.NotFound:
+        return False
+    except discord.HTTPException as e:
+        logger.error("메시지 삭제 실패 (ID: %s): %s", message_id, e)
+        return False
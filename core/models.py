@@ -0,0 +1,203 @@
+"""플레이어 정보와 온라인 목록 레코드."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+UNKNOWN_VALUE = "알 수 없음"
+STATUS_ONLINE = "온라인"
+STATUS_OFFLINE = "오프라인"
+
+# `list` 출력의 등급 (표시 순서)
+PLAYER_RANKS: Tuple[str, ...] = (
+    "special", "default", "premium", "lite", "ultra",
+    "booster", "youtuber", "mod", "admin", "owner"
+)
+# 소문자 등급명 -> PLAYER_RANKS의 문자열 객체 (파싱할 때마다 새 키 문자열을 만들지 않도록)
+_RANK_KEYS: Dict[str, str] = {rank: rank for rank in PLAYER_RANKS}
+_STATUSES: Dict[str, str] = {STATUS_ONLINE: STATUS_ONLINE, STATUS_OFFLINE: STATUS_OFFLINE}
+
+PackedPlayerInfo = Tuple[
+    str, Optional[str], Optional[str], Optional[str], Optional[str], Optional[float], Optional[str]
+]
+
+
+def rank_key(rank: str) -> Optional[str]:
+    """등급명에 해당하는 PLAYER_RANKS 키 (알 수 없는 등급이면 None)."""
+    return _RANK_KEYS.get(rank.lower())
+
+
+def _known(value: Optional[str]) -> Optional[str]:
+    return value if value and value != UNKNOWN_VALUE else None
+
+
+class PlayerInfo:
+    """`cmi info`나 플레이어 기록으로 확인된 플레이어 정보.
+
+    확인되지 않은 UUID/IP/상태는 None이며, 표시할 때만 `*_display`로 "알 수 없음"을 쓴다.
+    playtime은 `cmi info`의 PlayTime 값 그대로("12h 30m 5s")이다.
+    캐시와 여러 명령어가 같은 객체를 공유하므로 생성 후 값을 바꾸지 않고 `replace`로 새로 만든다.
+    """
+
+    __slots__ = ("username", "uuid", "ip", "status", "display_name", "last_seen", "playtime")
+
+    def __init__(
+        self,
+        username: str,
+        uuid: Optional[str] = None,
+        ip: Optional[str] = None,
+        status: Optional[str] = None,
+        display_name: Optional[str] = None,
+        last_seen: Optional[float] = None,
+        playtime: Optional[str] = None
+    ) -> None:
+        self.username = username
+        self.uuid = _known(uuid)
+        self.ip = _known(ip)
+        self.status = _STATUSES.get(status) if status else None
+        self.display_name = display_name
+        self.last_seen = last_seen
+        self.playtime = playtime
+
+    def __repr__(self) -> str:
+        return (
+            f"PlayerInfo(username={self.username!r}, uuid={self.uuid!r}, ip={self.ip!r}, "
+            f"status={self.status!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerInfo):
+            return NotImplemented
+        return self.pack() == other.pack()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def has_identity(self) -> bool:
+        """UUID나 IP 중 하나라도 확인되었는지 여부."""
+        return bool(self.uuid or self.ip)
+
+    @property
+    def is_online(self) -> bool:
+        return self.status == STATUS_ONLINE
+
+    @property
+    def uuid_display(self) -> str:
+        return self.uuid or UNKNOWN_VALUE
+
+    @property
+    def ip_display(self) -> str:
+        return self.ip or UNKNOWN_VALUE
+
+    @property
+    def status_display(self) -> str:
+        return self.status or UNKNOWN_VALUE
+
+    def replace(self, **changes: Any) -> "PlayerInfo":
+        """일부 값만 바꾼 새 PlayerInfo."""
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return PlayerInfo(**values)
+
+    def pack(self) -> PackedPlayerInfo:
+        """캐시/저장용 튜플 (JSON 배열로도 그대로 직렬화 가능)."""
+        return (self.username, self.uuid, self.ip, self.status, self.display_name, self.last_seen, self.playtime)
+
+    @classmethod
+    def unpack(cls, packed: Sequence[Any]) -> "PlayerInfo":
+        """`pack` 결과(또는 그 JSON 배열)에서 복원 (playtime이 없는 이전 형식도 허용)."""
+        return cls(*packed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 dict 형식 (로그 기록용, 확인되지 않은 UUID/IP 키는 생략)."""
+        data: Dict[str, Any] = {
+            "username": self.username,
+            "display_name": self.display_name,
+            "status": self.status_display,
+        }
+        if self.uuid:
+            data["uuid"] = self.uuid
+        if self.ip:
+            data["ip"] = self.ip
+        if self.last_seen is not None:
+            data["last_seen"] = self.last_seen
+        if self.playtime:
+            data["playtime"] = self.playtime
+        return data
+
+
+class OnlineSnapshot:
+    """`list` 결과: 접속 인원과 등급별 플레이어.
+
+    플레이어가 있는 등급만 보관하며, 응답이 없거나 파싱에 실패하면 message에 안내 문구가 담긴다.
+    """
+
+    __slots__ = ("total_players", "max_players", "ranks", "message")
+
+    def __init__(
+        self,
+        total_players: int = 0,
+        max_players: int = 999,
+        ranks: Optional[Mapping[str, Sequence[str]]] = None,
+        message: Optional[str] = None
+    ) -> None:
+        self.total_players = total_players
+        self.max_players = max_players
+        self.ranks: Dict[str, Tuple[str, ...]] = {
+            key: tuple(players)
+            for key, players in (ranks or {}).items()
+            if players
+        }
+        self.message = message
+
+    def __repr__(self) -> str:
+        return (
+            f"OnlineSnapshot(total_players={self.total_players}, max_players={self.max_players}, "
+            f"ranks={self.ranks!r}, message={self.message!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OnlineSnapshot):
+            return NotImplemented
+        return self.pack() == other.pack()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @classmethod
+    def unavailable(cls, message: str) -> "OnlineSnapshot":
+        return cls(message=message)
+
+    @property
+    def available(self) -> bool:
+        return self.message is None
+
+    def players(self, rank: str) -> Tuple[str, ...]:
+        return self.ranks.get(rank, ())
+
+    def iter_ranks(self) -> Iterable[Tuple[str, Tuple[str, ...]]]:
+        """플레이어가 있는 등급을 PLAYER_RANKS 순서로."""
+        for rank in PLAYER_RANKS:
+            players = self.ranks.get(rank)
+            if players:
+                yield rank, players
+
+    def all_players(self) -> List[str]:
+        return [player for _, players in self.iter_ranks() for player in players]
+
+    def pack(self) -> Tuple[int, int, Tuple[Tuple[str, Tuple[str, ...]], ...], Optional[str]]:
+        """캐시/저장용 튜플."""
+        return (self.total_players, self.max_players, tuple(self.iter_ranks()), self.message)
+
+    @classmethod
+    def unpack(cls, packed: Sequence[Any]) -> "OnlineSnapshot":
+        total_players, max_players, ranks, message = packed
+        return cls(total_players, max_players, {rank_key(rank) or rank: players for rank, players in ranks}, message)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 dict 형식 (로그 기록용)."""
+        data: Dict[str, Any] = {"total_players": self.total_players, "max_players": self.max_players}
+        if self.message is not None:
+            data["message"] = self.message
+            return data
+        for rank in PLAYER_RANKS:
+            data[rank] = list(self.ranks.get(rank, ()))
+        return data
@@ -0,0 +1,182 @@
+"""닉네임 n-gram 색인 (대소문자 무시, 접두사, 편집 거리 검색)."""
+import bisect
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .player_cache import normalize_player_name
+
+NGRAM = 3
+NAME_SEARCH_LIMIT = 10
+NAME_SEARCH_MAX_DISTANCE = 2
+# 이보다 짧은 검색어는 편집 거리 1까지만 허용 (짧은 이름은 거리 2면 거의 모든 이름과 비슷해짐)
+NAME_SEARCH_SHORT_QUERY = 5
+# 편집 거리를 직접 계산할 최대 후보 수 (공유 n-gram이 많은 순)
+NAME_SEARCH_CANDIDATES = 64
+
+MATCH_EXACT = "exact"
+MATCH_SKELETON = "skeleton"
+MATCH_PREFIX = "prefix"
+MATCH_FUZZY = "fuzzy"
+_MATCH_RANKS = {MATCH_EXACT: 0, MATCH_SKELETON: 1, MATCH_PREFIX: 2, MATCH_FUZZY: 3}
+
+# 부계정에서 흔한 숫자 치환 (St3ve -> steve)
+_LEET_TABLE = str.maketrans("013457", "oieast")
+
+
+def name_skeleton(key: str) -> str:
+    """숫자 치환과 밑줄을 걷어낸 이름 ("st3ve_" -> "steve")."""
+    return key.translate(_LEET_TABLE).replace("_", "")
+
+
+def name_ngrams(key: str) -> Set[str]:
+    """앞뒤 경계를 붙인 이름의 n-gram ("abc" -> {"^ab", "abc", "bc$"})."""
+    padded = f"^{key}$"
+    return {padded[index:index + NGRAM] for index in range(len(padded) - NGRAM + 1)}
+
+
+def bounded_edit_distance(source: str, target: str, limit: int) -> Optional[int]:
+    """두 문자열의 편집 거리 (limit을 넘으면 None).
+
+    거리가 limit 이하인 경로는 대각선에서 limit칸 이상 벗어나지 않으므로 그 띠 안만 계산하고,
+    한 줄 전체가 limit을 넘으면 바로 멈춘다.
+    """
+    if abs(len(source) - len(target)) > limit:
+        return None
+    over = limit + 1
+    width = len(target)
+    previous = [column if column <= limit else over for column in range(width + 1)]
+    for row, source_char in enumerate(source, 1):
+        low = max(1, row - limit)
+        high = min(width, row + limit)
+        current = [over] * (width + 1)
+        current[0] = row if row <= limit else over
+        best = current[low - 1]
+        for column in range(low, high + 1):
+            # min() 호출 대신 직접 비교 (이 반복이 검색 시간의 대부분)
+            value = previous[column - 1] + (source_char != target[column - 1])
+            if previous[column] < value:
+                value = previous[column] + 1
+            if current[column - 1] < value:
+                value = current[column - 1] + 1
+            current[column] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return None
+        previous = current
+    return previous[width] if previous[width] <= limit else None
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """검색된 이름 (kind는 exact/skeleton/prefix/fuzzy, distance는 검색어와의 편집 거리)."""
+
+    username: str
+    kind: str
+    distance: int
+
+
+class NameSearchIndex:
+    """이름 n-gram 역색인과 정렬된 소문자 이름 배열로 비슷한 이름을 찾는 색인.
+
+    접두사 검색은 이분 탐색, 오타/부계정 검색은 공유 n-gram이 많은 후보만 골라 편집 거리를
+    계산하므로 이름이 수만 개여도 전체를 훑지 않는다. 결과는 정확히 일치, 숫자 치환/밑줄만
+    다름, 접두사 일치, 편집 거리 순으로 정렬된다.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._keys: List[str] = []
+        self._names: Dict[str, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._skeletons: Dict[str, Set[str]] = {}
+        for name in names:
+            key = self._insert(name)
+            if key:
+                self._keys.append(key)
+        self._keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_player_name(name) in self._names
+
+    def add(self, name: str) -> None:
+        """이름 추가 (이미 있으면 표시 이름만 갱신)."""
+        key = self._insert(name)
+        if key:
+            bisect.insort(self._keys, key)
+
+    def search(
+        self,
+        query: str,
+        limit: int = NAME_SEARCH_LIMIT,
+        max_distance: int = NAME_SEARCH_MAX_DISTANCE
+    ) -> List[NameMatch]:
+        """검색어와 비슷한 이름 (순위순)."""
+        key = normalize_player_name(query)
+        if not key:
+            return []
+        if len(key) < NAME_SEARCH_SHORT_QUERY:
+            max_distance = min(max_distance, 1)
+
+        found: Dict[str, Tuple[str, int]] = {}
+        if key in self._names:
+            found[key] = (MATCH_EXACT, 0)
+        for candidate in self._skeletons.get(name_skeleton(key), ()):
+            distance = bounded_edit_distance(key, candidate, max(len(key), len(candidate)))
+            found.setdefault(candidate, (MATCH_SKELETON, distance or 0))
+
+        start = bisect.bisect_left(self._keys, key)
+        for index in range(start, min(start + limit, len(self._keys))):
+            candidate = self._keys[index]
+            if not candidate.startswith(key):
+                break
+            found.setdefault(candidate, (MATCH_PREFIX, len(candidate) - len(key)))
+
+        for candidate in self._fuzzy_candidates(key, max_distance, found):
+            distance = bounded_edit_distance(key, candidate, max_distance)
+            if distance is not None:
+                found[candidate] = (MATCH_FUZZY, distance)
+
+        ranked = sorted(
+            found.items(),
+            key=lambda item: (_MATCH_RANKS[item[1][0]], item[1][1], len(item[0]), item[0])
+        )
+        return [NameMatch(self._names[candidate], kind, distance) for candidate, (kind, distance) in ranked[:limit]]
+
+    def _fuzzy_candidates(self, key: str, max_distance: int, exclude: Dict[str, Tuple[str, int]]) -> List[str]:
+        """편집 거리를 계산할 후보 (길이 차가 허용 범위 안이고 공유 n-gram이 많은 순)."""
+        grams = name_ngrams(key)
+        shared: Counter = Counter()
+        for gram in grams:
+            posting = self._grams.get(gram)
+            if posting:
+                shared.update(posting)
+
+        # 편집 한 번은 n-gram을 최대 NGRAM개 바꾸므로 이보다 적게 공유하면 거리 제한을 넘음
+        min_shared = max(1, len(grams) - NGRAM * max_distance)
+        length = len(key)
+        candidates = [
+            (count, candidate) for candidate, count in shared.items()
+            if count >= min_shared and abs(len(candidate) - length) <= max_distance and candidate not in exclude
+        ]
+        candidates.sort(reverse=True)
+        return [candidate for _, candidate in candidates[:NAME_SEARCH_CANDIDATES]]
+
+    def _insert(self, name: str) -> str:
+        """이름을 색인에 넣고, 새 이름이면 정규화된 키 반환 (정렬 배열은 호출자가 갱신)."""
+        name = name.strip()
+        key = normalize_player_name(name)
+        if not key:
+            return ""
+        is_new = key not in self._names
+        self._names[key] = name
+        if not is_new:
+            return ""
+
+        for gram in name_ngrams(key):
+            self._grams.setdefault(gram, set()).add(key)
+        self._skeletons.setdefault(name_skeleton(key), set()).add(key)
+        return key
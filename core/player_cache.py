@@ -0,0 +1,75 @@
+"""플레이어 정보 캐시."""
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from .base import Singleton
+from .config import get_config
+from .models import PlayerInfo
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_player_name(player: str) -> str:
+    """캐시 키로 쓰는 정규화된 플레이어명 (마인크래프트 닉네임은 대소문자 구분 없음)."""
+    return player.strip().lower()
+
+
+@dataclass
+class _CacheEntry:
+    __slots__ = ("info", "stored_at")
+
+    info: PlayerInfo
+    stored_at: float
+
+
+class PlayerInfoCache(metaclass=Singleton):
+    """`parse_player_info` 결과를 TTL 동안 보관하는 LRU 캐시.
+
+    /info → /ban → /로그업로드처럼 같은 플레이어를 연달아 조회할 때 콘솔 왕복을
+    반복하지 않도록 한다. 보관 기간과 크기는 PLAYER_CACHE_TTL, PLAYER_CACHE_SIZE로 설정한다.
+    PlayerInfo는 생성 후 바뀌지 않으므로 사본 없이 같은 객체를 보관하고 반환한다.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_size: Optional[int] = None) -> None:
+        config = get_config()
+        self.ttl = config.PLAYER_CACHE_TTL if ttl is None else ttl
+        self.max_size = max(1, config.PLAYER_CACHE_SIZE if max_size is None else max_size)
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, player: str) -> Optional[PlayerInfo]:
+        """유효한 캐시 항목 반환 (없거나 만료되면 None)."""
+        key = normalize_player_name(player)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() - entry.stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry.info
+
+    def put(self, player: str, info: PlayerInfo) -> None:
+        """플레이어 정보 저장 (가장 오래 사용되지 않은 항목부터 제거)."""
+        if self.ttl <= 0:
+            return
+
+        key = normalize_player_name(player)
+        self._entries[key] = _CacheEntry(info, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, player: str) -> None:
+        """플레이어의 캐시 항목 삭제."""
+        self._entries.pop(normalize_player_name(player), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,132 @@
+"""접속 중/최근 확인된 플레이어 이름 색인 (자동완성용)."""
+import bisect
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set
+
+from .base import Singleton
+from .player_cache import normalize_player_name
+from utils.constants import AUTOCOMPLETE_LIMIT, PLAYER_INDEX_RECENT_LIMIT
+from utils.utils import CONSOLE_TIMESTAMP_PATTERN
+
+logger = logging.getLogger(__name__)
+
+_NAME = r'([^\s\[\]<>:]+)'
+JOIN_LINE_PATTERN = re.compile(rf'^{_NAME} joined the game')
+LEAVE_LINE_PATTERN = re.compile(rf'^{_NAME} left the game')
+
+
+class PlayerNameIndex(metaclass=Singleton):
+    """정렬된 소문자 이름 배열로 접두사 검색을 하는 플레이어 이름 색인.
+
+    접속 중인 플레이어와 최근 확인된 플레이어(최대 PLAYER_INDEX_RECENT_LIMIT명)를
+    보관하며, 접두사 검색은 이분 탐색이라 콘솔을 거치지 않고 즉시 응답한다.
+    `list` 결과와 콘솔의 접속/퇴장 줄, 플레이어 정보 조회 결과로 갱신된다.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[str] = []
+        self._names: Dict[str, str] = {}
+        self._online: Set[str] = set()
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def online_count(self) -> int:
+        return len(self._online)
+
+    def is_online(self, player: str) -> bool:
+        return normalize_player_name(player) in self._online
+
+    def mark_online(self, player: str) -> None:
+        """접속한 플레이어 추가."""
+        key = self._touch(player)
+        if key:
+            self._online.add(key)
+
+    def mark_offline(self, player: str) -> None:
+        """퇴장한 플레이어를 최근 확인 목록으로 이동."""
+        key = self._touch(player)
+        if key:
+            self._online.discard(key)
+            self._evict()
+
+    def mark_seen(self, player: str) -> None:
+        """조회 등으로 확인된 플레이어 추가 (접속 상태는 바꾸지 않음)."""
+        if self._touch(player):
+            self._evict()
+
+    def replace_online(self, players: Iterable[str]) -> None:
+        """`list` 결과로 접속 중인 플레이어 목록 전체 교체."""
+        online: Set[str] = set()
+        for player in players:
+            key = self._touch(player)
+            if key:
+                online.add(key)
+        self._online = online
+        self._evict()
+
+    def complete(self, prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> List[str]:
+        """접두사로 시작하는 이름 목록 (접속 중인 플레이어 우선, 이름순)."""
+        key = normalize_player_name(prefix)
+        start = bisect.bisect_left(self._keys, key)
+        online: List[str] = []
+        offline: List[str] = []
+
+        for index in range(start, len(self._keys)):
+            candidate = self._keys[index]
+            if not candidate.startswith(key):
+                break
+            if candidate in self._online:
+                online.append(self._names[candidate])
+                if len(online) >= limit:
+                    break
+            elif len(offline) < limit:
+                offline.append(self._names[candidate])
+
+        return (online + offline)[:limit]
+
+    def feed_line(self, line: str) -> None:
+        """콘솔 줄의 접속/퇴장 기록 반영 (ConsoleListener 줄 처리기)."""
+        cleaned = CONSOLE_TIMESTAMP_PATTERN.sub('', line).strip()
+        match = JOIN_LINE_PATTERN.match(cleaned)
+        if match:
+            self.mark_online(match.group(1))
+            return
+        match = LEAVE_LINE_PATTERN.match(cleaned)
+        if match:
+            self.mark_offline(match.group(1))
+
+    def _touch(self, player: str) -> str:
+        """이름을 색인에 넣고 최근 확인 시각 갱신, 정규화된 키 반환."""
+        name = player.strip()
+        key = normalize_player_name(name)
+        if not key:
+            return ""
+
+        if key not in self._names:
+            bisect.insort(self._keys, key)
+        self._names[key] = name
+        self._recent[key] = time.monotonic()
+        self._recent.move_to_end(key)
+        return key
+
+    def _evict(self) -> None:
+        """최근 확인 목록이 한도를 넘으면 오래된 오프라인 플레이어부터 제거."""
+        excess = len(self._recent) - len(self._online) - PLAYER_INDEX_RECENT_LIMIT
+        if excess <= 0:
+            return
+
+        for key in list(self._recent):
+            if excess <= 0:
+                break
+            if key in self._online:
+                continue
+            del self._recent[key]
+            del self._names[key]
+            del self._keys[bisect.bisect_left(self._keys, key)]
+            excess -= 1
@@ -0,0 +1,354 @@
+"""플레이어 정보 조회."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from discord.ext import commands
+
+from .base import CommandResult, Singleton
+from .command_bridge import CONSOLE_SEND_FAILED, collect_console_lines
+from .latency import ConsoleLatencyTracker
+from .models import PlayerInfo
+from .player_cache import PlayerInfoCache, normalize_player_name
+from .player_index import PlayerNameIndex
+from .player_registry import PlayerRegistry
+from utils.constants import PLAYER_INFO_DEADLINE, PLAYER_INFO_MAX_ATTEMPTS
+from utils.utils import CONSOLE_TIMESTAMP_PATTERN, is_console_separator, parse_player_info
+
+logger = logging.getLogger(__name__)
+
+_UUID_LINE_PATTERN = re.compile(
+    r'\bUUID:\s*(?:[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}|[a-f0-9]{32})\b',
+    re.IGNORECASE
+)
+_IP_LINE_PATTERN = re.compile(r'\bIp:\s*\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', re.IGNORECASE)
+_HEADER_FIELD_PATTERN = re.compile(r'\b(?:Prefix|Display name):', re.IGNORECASE)
+
+PlayerInfoResult = CommandResult[Optional[PlayerInfo]]
+
+# 정규화된 플레이어명 -> 진행 중인 콘솔 조회
+_inflight: Dict[str, "asyncio.Task[PlayerInfoResult]"] = {}
+
+
+def _has_identity(info: Optional[PlayerInfo]) -> bool:
+    return info is not None and info.has_identity
+
+
+class PlayerInfoExtractor:
+    """콘솔 줄을 지켜보다가 대상 플레이어의 UUID와 IP 줄이 모두 나오면 즉시 완료하는 추출기.
+
+    `cmi info` 첫 줄부터 수집을 시작하며, UUID와 IP를 모두 찾기 전에 블록이 끝나면 그때까지의
+    줄로 완료한다. 완료된 뒤에도 같은 메시지의 남은 줄(PlayTime 등)은 블록이 끝날 때까지 받는다.
+
+    첫 줄의 이름이 입력한 이름과 대소문자를 무시하고 같거나 한쪽이 다른 쪽을 포함하면
+    (콘솔이 대소문자를 고친 이름이나 앞부분만 입력한 이름의 전체 이름으로 응답한 경우) 블록
+    시작 직후이거나 Prefix/Display name 필드가 있는 줄을 첫 줄로 본다. 이름이 전혀 다르면
+    Prefix/Display name 필드가 있는 줄만 첫 줄로 보고 그대로 완료한다 (이름 불일치는
+    parse_player_info가 경고).
+    """
+
+    def __init__(self, player: str) -> None:
+        self.player = player
+        self._player_key = player.lower()
+        self._lines: List[str] = []
+        self._after_separator = False
+        self._closed = False
+        self._has_uuid = False
+        self._has_ip = False
+
+    @property
+    def started(self) -> bool:
+        return bool(self._lines)
+
+    def feed(self, line: str) -> bool:
+        """줄 하나를 반영하고 수집이 끝났는지 반환."""
+        if self._closed:
+            return True
+        cleaned = CONSOLE_TIMESTAMP_PATTERN.sub('', line).strip()
+
+        if is_console_separator(cleaned):
+            if self._lines:
+                self._closed = True
+                return True
+            self._after_separator = True
+            return False
+
+        if not cleaned:
+            return False
+
+        if not self._lines:
+            has_header_field = _HEADER_FIELD_PATTERN.search(cleaned) is not None
+            is_header = has_header_field or (self._after_separator and self._names_related(cleaned))
+            self._after_separator = False
+            if not is_header:
+                return False
+
+        self._lines.append(cleaned)
+        self._has_uuid = self._has_uuid or _UUID_LINE_PATTERN.search(cleaned) is not None
+        self._has_ip = self._has_ip or _IP_LINE_PATTERN.search(cleaned) is not None
+        return self._has_uuid and self._has_ip
+
+    def _names_related(self, line: str) -> bool:
+        """줄의 첫 단어가 입력한 이름과 대소문자를 무시하고 같거나 한쪽이 다른 쪽을 포함하는지."""
+        name = line.split(None, 1)[0].lower()
+        return self._player_key in name or name in self._player_key
+
+    def result(self) -> Optional[PlayerInfo]:
+        """수집된 줄을 파싱한 플레이어 정보 (수집 전이면 None)."""
+        if not self._lines:
+            return None
+        return parse_player_info('\n'.join(self._lines), self.player)
+
+
+async def query_player_info(
+    bot: commands.Bot,
+    player: str,
+    executor: str,
+    timeout: Optional[float] = None,
+    refresh: bool = False
+) -> PlayerInfoResult:
+    """`cmi info`를 전송하고 UUID와 IP가 확인되는 즉시 파싱된 플레이어 정보 반환.
+
+    캐시에 유효한 정보가 있으면 콘솔을 거치지 않고 반환하며, refresh가 True이면
+    캐시를 무시하고 다시 조회한다. 같은 플레이어의 조회가 이미 진행 중이면 새 명령어를
+    보내지 않고 그 결과를 함께 받는다 (대기 시간은 먼저 시작한 조회의 것을 따른다).
+    """
+    if not refresh:
+        cached = PlayerInfoCache().get(player)
+        if cached is not None:
+            logger.debug("플레이어 정보 캐시 사용: %s", player, extra={"player": player})
+            return CommandResult.success_with(cached)
+
+    key = normalize_player_name(player)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_player_info(bot, player, executor, timeout))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _release_inflight(key, done))
+    else:
+        logger.debug("진행 중인 플레이어 정보 조회에 합류: %s", player, extra={"player": player})
+
+    # 한 호출자가 취소되어도 같은 조회를 기다리는 다른 호출자에게 영향이 없도록 shield
+    return await asyncio.shield(task)
+
+
+async def _fetch_player_info(
+    bot: commands.Bot,
+    player: str,
+    executor: str,
+    timeout: Optional[float]
+) -> PlayerInfoResult:
+    """콘솔 조회 후 UUID나 IP가 확인된 결과를 캐시, 플레이어 기록, 이름 색인에 저장."""
+    result = await collect_console_lines(
+        bot, f"cmi info {player}", executor, PlayerInfoExtractor(player), timeout
+    )
+    if _has_identity(result.data):
+        PlayerInfoCache().put(player, result.data)
+        PlayerRegistry().record(result.data)
+        if result.data.is_online:
+            PlayerNameIndex().mark_online(result.data.username)
+        else:
+            PlayerNameIndex().mark_seen(result.data.username)
+    return result
+
+
+def _release_inflight(key: str, task: "asyncio.Task[PlayerInfoResult]") -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+
+
+@dataclass
+class LookupAttempt:
+    """플레이어 정보 조회 시도 하나의 결과."""
+
+    number: int
+    started_at: float
+    elapsed: Optional[float] = None
+    outcome: str = "pending"
+
+    def __str__(self) -> str:
+        elapsed = "-" if self.elapsed is None else f"{self.elapsed:.2f}s"
+        return f"{self.number}={elapsed}({self.outcome})"
+
+
+@dataclass
+class PlayerLookup:
+    """PlayerInfoService 조회 결과.
+
+    source는 정보의 출처(cache, registry, console, fallback)이며, fallback이면 info에는
+    플레이어명만 있다.
+    """
+
+    info: PlayerInfo
+    source: str
+    elapsed: float
+    attempts: List[LookupAttempt] = field(default_factory=list)
+
+    @property
+    def found(self) -> bool:
+        return self.source != "fallback"
+
+
+class PlayerInfoService(metaclass=Singleton):
+    """차단/로그 업로드 명령어가 공유하는 플레이어 정보 수집기.
+
+    첫 조회가 관측된 p95 응답 시간 안에 끝나지 않으면 실패를 기다리지 않고 두 번째
+    조회를 보내 먼저 도착한 결과를 사용하며, 전체 소요 시간은 PLAYER_INFO_DEADLINE을
+    넘지 않는다. 조회가 모두 실패하면 UUID/IP가 없는 기본값을 반환한다.
+    """
+
+    def __init__(
+        self,
+        deadline: float = PLAYER_INFO_DEADLINE,
+        max_attempts: int = PLAYER_INFO_MAX_ATTEMPTS
+    ) -> None:
+        self.deadline = deadline
+        self.max_attempts = max(1, max_attempts)
+
+    async def lookup(
+        self,
+        bot: commands.Bot,
+        player: str,
+        executor: str,
+        refresh: bool = False,
+        use_registry: bool = False
+    ) -> PlayerLookup:
+        """플레이어 정보 수집.
+
+        Args:
+            bot: 봇 인스턴스
+            player: 플레이어명
+            executor: 실행자 멘션
+            refresh: 캐시와 기록을 무시하고 콘솔에서 조회
+            use_registry: UUID가 기록된 플레이어는 콘솔 없이 기록된 정보 사용
+        """
+        started_at = time.monotonic()
+
+        if not refresh:
+            cached = PlayerInfoCache().get(player)
+            if cached is not None:
+                return self._finish(player, cached, "cache", started_at, [])
+
+            if use_registry:
+                known = PlayerRegistry().latest(player)
+                if known and known.uuid:
+                    info = PlayerInfo(known.username, known.uuid, known.ip)
+                    return self._finish(player, info, "registry", started_at, [])
+
+        attempts: List[LookupAttempt] = []
+        info = await self._query_hedged(bot, player, executor, refresh, started_at, attempts)
+        if info is None:
+            return self._finish(player, PlayerInfo(player), "fallback", started_at, attempts)
+        return self._finish(player, info, "console", started_at, attempts)
+
+    async def _query_hedged(
+        self,
+        bot: commands.Bot,
+        player: str,
+        executor: str,
+        refresh: bool,
+        started_at: float,
+        attempts: List[LookupAttempt]
+    ) -> Optional[PlayerInfo]:
+        """전체 상한 안에서 조회를 보내고, 느리거나 실패하면 추가 조회를 보낸다."""
+        latency = ConsoleLatencyTracker()
+        pending: Dict[asyncio.Task, LookupAttempt] = {}
+
+        def launch() -> None:
+            now = time.monotonic()
+            remaining = max(0.0, self.deadline - (now - started_at))
+            attempt = LookupAttempt(number=len(attempts) + 1, started_at=now)
+            if attempt.number == 1:
+                # 첫 조회는 같은 플레이어를 조회 중인 다른 명령어와 공유
+                coro = query_player_info(bot, player, executor, remaining, refresh=refresh)
+            else:
+                coro = _fetch_player_info(bot, player, executor, remaining)
+            attempts.append(attempt)
+            pending[asyncio.ensure_future(coro)] = attempt
+
+        launch()
+        try:
+            while pending:
+                now = time.monotonic()
+                remaining = self.deadline - (now - started_at)
+                if remaining <= 0:
+                    break
+
+                can_hedge = len(attempts) < self.max_attempts
+                wait_time = remaining
+                if can_hedge:
+                    hedge_at = attempts[-1].started_at + latency.hedge_delay()
+                    wait_time = max(0.0, min(remaining, hedge_at - now))
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=wait_time, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    attempt = pending.pop(task)
+                    attempt.elapsed = time.monotonic() - attempt.started_at
+                    info = self._attempt_result(task, attempt)
+                    if info is not None:
+                        return info
+
+                if can_hedge and (not done or not pending):
+                    launch()
+
+            return None
+        finally:
+            # 다른 시도가 먼저 성공했으면 cancelled, 전체 상한에 걸렸으면 timeout
+            expired = time.monotonic() - started_at >= self.deadline
+            for task, attempt in pending.items():
+                task.cancel()
+                attempt.elapsed = time.monotonic() - attempt.started_at
+                attempt.outcome = "timeout" if expired else "cancelled"
+
+    @staticmethod
+    def _attempt_result(task: asyncio.Task, attempt: LookupAttempt) -> Optional[PlayerInfo]:
+        """완료된 시도의 결과 (UUID나 IP가 없으면 None)."""
+        try:
+            result = task.result()
+        except Exception as e:
+            logger.error("플레이어 정보 조회 오류 (시도 %d): %s", attempt.number, e)
+            attempt.outcome = "error"
+            return None
+
+        if result.error_message == CONSOLE_SEND_FAILED:
+            attempt.outcome = "send_failed"
+            return None
+        if not _has_identity(result.data):
+            attempt.outcome = "empty"
+            return None
+
+        attempt.outcome = "ok"
+        return result.data
+
+    @staticmethod
+    def _finish(
+        player: str,
+        info: PlayerInfo,
+        source: str,
+        started_at: float,
+        attempts: List[LookupAttempt]
+    ) -> PlayerLookup:
+        lookup = PlayerLookup(info, source, time.monotonic() - started_at, attempts)
+        level = logging.WARNING if source == "fallback" else logging.INFO
+        if logger.isEnabledFor(level):
+            attempt_log = [str(attempt) for attempt in attempts]
+            logger.log(
+                level,
+                "플레이어 정보 수집: %s | 출처: %s | UUID: %s | IP: %s | 소요: %.2fs | 시도: %s",
+                player, source, info.uuid_display[:8], info.ip_display, lookup.elapsed,
+                " ".join(attempt_log) or "-",
+                extra={
+                    "player": player,
+                    "source": source,
+                    "latency": round(lookup.elapsed, 3),
+                    "attempts": attempt_log,
+                }
+            )
+        return lookup
@@ -0,0 +1,115 @@
+"""플레이어 이름/UUID/IP 기록 저장소."""
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .base import Singleton
+from .models import PlayerInfo
+from .player_cache import normalize_player_name
+from utils.constants import PLAYER_REGISTRY_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS player_sightings (
+    name_key TEXT NOT NULL,
+    username TEXT NOT NULL,
+    uuid TEXT NOT NULL DEFAULT '',
+    ip TEXT NOT NULL DEFAULT '',
+    status TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    seen_count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (name_key, uuid, ip)
+);
+CREATE INDEX IF NOT EXISTS idx_player_sightings_last_seen
+    ON player_sightings (name_key, last_seen);
+CREATE INDEX IF NOT EXISTS idx_player_sightings_uuid
+    ON player_sightings (uuid);
+"""
+
+
+class PlayerRegistry(metaclass=Singleton):
+    """`cmi info`로 확인된 이름/UUID/마스킹된 IP 조합을 시각과 함께 보관하는 SQLite 저장소.
+
+    같은 조합은 한 행으로 합쳐 처음/마지막 확인 시각과 횟수만 갱신한다.
+    WAL 모드를 사용하므로 조회가 기록을 막지 않는다.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path or PLAYER_REGISTRY_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def record(self, info: PlayerInfo, seen_at: Optional[float] = None) -> None:
+        """파싱된 플레이어 정보 기록 (UUID와 IP가 모두 없으면 무시)."""
+        if not info.username or not info.has_identity:
+            return
+
+        seen_at = time.time() if seen_at is None else seen_at
+        try:
+            with self._conn:
+                self._conn.execute(
+                    """
+                    INSERT INTO player_sightings
+                        (name_key, username, uuid, ip, status, first_seen, last_seen)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (name_key, uuid, ip) DO UPDATE SET
+                        username = excluded.username,
+                        status = excluded.status,
+                        last_seen = MAX(last_seen, excluded.last_seen),
+                        seen_count = seen_count + 1
+                    """,
+                    (
+                        normalize_player_name(info.username), info.username, info.uuid or "",
+                        info.ip or "", info.status, seen_at, seen_at
+                    )
+                )
+        except sqlite3.Error as e:
+            logger.error(f"플레이어 기록 저장 실패: {e}")
+
+    def history(self, player: str) -> List[Dict[str, Any]]:
+        """플레이어의 모든 이름/UUID/IP 기록 (최근 확인 순)."""
+        try:
+            rows = self._conn.execute(
+                """
+                SELECT username, uuid, ip, status, first_seen, last_seen, seen_count
+                FROM player_sightings
+                WHERE name_key = ?
+                ORDER BY last_seen DESC
+                """,
+                (normalize_player_name(player),)
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"플레이어 기록 조회 실패: {e}")
+            return []
+        return [dict(row) for row in rows]
+
+    def latest(self, player: str) -> Optional[PlayerInfo]:
+        """가장 최근에 확인된 플레이어 정보.
+
+        최근 기록에 UUID나 IP가 비어 있으면 그 이전 기록에서 채운다.
+        last_seen은 마지막 확인 시각(UNIX 시간)이다.
+        """
+        rows = self.history(player)
+        if not rows:
+            return None
+
+        latest = rows[0]
+        return PlayerInfo(
+            latest["username"],
+            uuid=next((row["uuid"] for row in rows if row["uuid"]), None),
+            ip=next((row["ip"] for row in rows if row["ip"]), None),
+            status=latest["status"],
+            last_seen=latest["last_seen"],
+        )
+
+    def close(self) -> None:
+        self._conn.close()
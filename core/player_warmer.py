@@ -0,0 +1,150 @@
+"""콘솔 접속 기록으로 플레이어 정보 캐시 미리 채우기."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Set
+
+from discord.ext import commands
+
+from .models import STATUS_ONLINE, PlayerInfo
+from .player_cache import PlayerInfoCache, normalize_player_name
+from .player_index import JOIN_LINE_PATTERN
+from .player_info import query_player_info
+from .player_registry import PlayerRegistry
+from utils.constants import PLAYER_WARM_INTERVAL, PLAYER_WARM_QUEUE_SIZE, PLAYER_WARM_TRACKED
+from utils.utils import CONSOLE_TIMESTAMP_PATTERN
+
+logger = logging.getLogger(__name__)
+
+WARM_EXECUTOR = "자동 조회"
+
+_NAME = r'([^\s\[\]<>:]+)'
+_UUID_PATTERN = re.compile(
+    rf'^UUID of player {_NAME} is ([a-f0-9]{{8}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{4}}-[a-f0-9]{{12}})',
+    re.IGNORECASE
+)
+_LOGIN_PATTERN = re.compile(rf'^{_NAME}\[/(\d{{1,3}}(?:\.\d{{1,3}}){{3}}):\d+\] logged in')
+
+
+def mask_ip(ip: str) -> Optional[str]:
+    """`parse_player_info`와 같은 형식으로 마지막 옥텟을 가린 IP (유효하지 않으면 None)."""
+    parts = ip.split('.')
+    if len(parts) != 4 or not all(part.isdigit() and 0 <= int(part) <= 255 for part in parts):
+        return None
+    return f"{'.'.join(parts[:3])}.*"
+
+
+@dataclass
+class _Sighting:
+    username: str
+    uuid: Optional[str] = None
+    ip: Optional[str] = None
+
+
+class PlayerJoinIngester:
+    """콘솔 채널의 접속 기록을 읽어 플레이어 정보 캐시를 미리 채우는 수집기.
+
+    접속 과정의 `UUID of player ... is ...`와 `...[/IP:port] logged in` 줄로 UUID와 IP가
+    모두 확인되면 콘솔 조회 없이 캐시에 넣고, 그렇지 않은 플레이어는 `joined the game`
+    줄을 본 뒤 대기열에 넣어 PLAYER_WARM_INTERVAL 간격으로 `cmi info`를 조회한다.
+    대기열이 가득 차면 새 접속은 건너뛴다.
+    """
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self._sightings: "OrderedDict[str, _Sighting]" = OrderedDict()
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=PLAYER_WARM_QUEUE_SIZE)
+        self._queued: Set[str] = set()
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """대기열 처리 작업 시작."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """대기열 처리 작업 종료."""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    def feed_line(self, line: str) -> None:
+        """콘솔 줄 하나 처리 (ConsoleListener 줄 처리기)."""
+        cleaned = CONSOLE_TIMESTAMP_PATTERN.sub('', line).strip()
+        if not cleaned:
+            return
+
+        match = _UUID_PATTERN.match(cleaned)
+        if match:
+            self._sighting(match.group(1)).uuid = match.group(2)
+            self._store_if_complete(match.group(1))
+            return
+
+        match = _LOGIN_PATTERN.match(cleaned)
+        if match:
+            self._sighting(match.group(1)).ip = mask_ip(match.group(2))
+            self._store_if_complete(match.group(1))
+            return
+
+        match = JOIN_LINE_PATTERN.match(cleaned)
+        if match:
+            self._on_join(match.group(1))
+
+    def _sighting(self, player: str) -> _Sighting:
+        key = normalize_player_name(player)
+        sighting = self._sightings.get(key)
+        if sighting is None:
+            sighting = self._sightings[key] = _Sighting(player)
+            while len(self._sightings) > PLAYER_WARM_TRACKED:
+                self._sightings.popitem(last=False)
+        else:
+            self._sightings.move_to_end(key)
+        return sighting
+
+    def _store_if_complete(self, player: str) -> bool:
+        """접속 기록으로 UUID와 IP가 모두 확인되면 캐시와 기록에 저장."""
+        sighting = self._sightings.get(normalize_player_name(player))
+        if sighting is None or not (sighting.uuid and sighting.ip):
+            return False
+
+        info = PlayerInfo(sighting.username, sighting.uuid, sighting.ip, STATUS_ONLINE)
+        PlayerInfoCache().put(sighting.username, info)
+        PlayerRegistry().record(info)
+        del self._sightings[normalize_player_name(player)]
+        logger.debug("접속 기록으로 플레이어 정보 캐시: %s", sighting.username, extra={"player": sighting.username})
+        return True
+
+    def _on_join(self, player: str) -> None:
+        """접속 기록만으로 정보가 부족하면 콘솔 조회 대기열에 추가."""
+        key = normalize_player_name(player)
+        self._sightings.pop(key, None)
+        if key in self._queued or PlayerInfoCache().get(player) is not None:
+            return
+
+        try:
+            self._queue.put_nowait(player)
+            self._queued.add(key)
+        except asyncio.QueueFull:
+            logger.debug("플레이어 정보 미리 조회 대기열 가득 참, 건너뜀: %s", player, extra={"player": player})
+
+    async def _run(self) -> None:
+        """대기열의 플레이어를 일정 간격으로 조회."""
+        while True:
+            player = await self._queue.get()
+            self._queued.discard(normalize_player_name(player))
+            if PlayerInfoCache().get(player) is not None:
+                continue
+
+            try:
+                await query_player_info(self.bot, player, WARM_EXECUTOR)
+            except Exception as e:
+                logger.error("플레이어 정보 미리 조회 오류: %s | %s", player, e, extra={"player": player})
+
+            await asyncio.sleep(PLAYER_WARM_INTERVAL)
@@ -11,7 +11,11 @@ from utils.extension_loader import ExtensionLoader
 from utils.constants import DEFAULT_ACTIVITY_NAME
 from utils.graceful_shutdown import setup_graceful_shutdown, register_shutdown_callback
 from utils.logging import configure_logging
+from core.ban_log_sync import BanLogSync
 from core.config import get_config
+from core.console import ConsoleListener
+from core.player_index import PlayerNameIndex
+from core.player_warmer import PlayerJoinIngester
 
 load_dotenv()
 configure_logging()
@@ -31,6 +35,11 @@ class HiRestSecureBot(discord.Bot):
         self.extension_loader = ExtensionLoader(self)
         self._initialized = False
         self._auto_save_task: asyncio.Task | None = None
+        self.console_listener = ConsoleListener(self.config.ILUNAR_CONSOLE_CHANNEL_ID)
+        self.join_ingester = PlayerJoinIngester(self)
+        self.ban_log_sync = BanLogSync(self)
+        self.console_listener.add_line_handler(self.join_ingester.feed_line)
+        self.console_listener.add_line_handler(PlayerNameIndex().feed_line)
     
     async def on_ready(self) -> None:
         """봇 준비 완료"""
@@ -57,6 +66,8 @@ class HiRestSecureBot(discord.Bot):
                 logger.error(f"명령어 로드 실패: {ext_name}\n{error}")
         
         await self.sync_commands()
+        self.join_ingester.start()
+        self.ban_log_sync.start()
         
         try:
             await self.change_presence(
@@ -66,6 +77,24 @@ class HiRestSecureBot(discord.Bot):
         except Exception as e:
             logger.error(f"상태 변경 오류: {e}")
     
+    async def on_message(self, message: discord.Message) -> None:
+        """콘솔 채널 메시지를 응답 대기열에, 차단 로그 메시지를 색인에 전달"""
+        self.console_listener.feed(message)
+        self.ban_log_sync.on_message(message)
+    
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent) -> None:
+        """수정된 콘솔 메시지를 버퍼에, 수정된 차단 로그를 색인에 반영"""
+        self.console_listener.update(payload)
+        await self.ban_log_sync.on_raw_message_edit(payload)
+    
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """삭제된 차단 로그를 색인에서 제거"""
+        self.ban_log_sync.on_raw_message_delete(payload)
+    
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """일괄 삭제된 차단 로그를 색인에서 제거"""
+        self.ban_log_sync.on_raw_bulk_message_delete(payload)
+    
     async def on_application_command_error(
         self,
         context: discord.ApplicationContext,
@@ -105,6 +134,8 @@ class HiRestSecureBot(discord.Bot):
             except asyncio.CancelledError:
                 pass
         
+        await self.join_ingester.stop()
+        await self.ban_log_sync.stop()
         await super().close()
 
 
@@ -2,67 +2,64 @@
 import asyncio
 import logging
 import re
-from typing import Dict, Optional
+from typing import List, Set
 
 import discord
 
-from core.command_bridge import send_console_command
-from core.config import get_config
-from utils.utils import (
-    create_embed, 
-    CommandLogger, 
-    ConsoleResponseHandler,
-    parse_player_info
-)
+from core.base import CommandResult
+from core.command_bridge import CONSOLE_SEND_FAILED
+from core.models import STATUS_OFFLINE, STATUS_ONLINE, PlayerInfo
+from core.player_cache import PlayerInfoCache
+from core.player_info import query_player_info
+from core.player_registry import PlayerRegistry
+from utils.utils import create_embed, CommandLogger
+from utils.constants import player_name_autocomplete
 from utils.decorators import check_staff_permission
-from utils.constants import CONSOLE_RESPONSE_DELAY
 
 logger = logging.getLogger(__name__)
+MAX_INFO_PLAYERS = 10
+PAGE_VIEW_TIMEOUT = 300
+REFRESH_PENDING_NOTE = "최신 정보 확인 중..."
+REFRESH_FAILED_NOTE = "⚠️ 최신 정보 갱신 실패"
+
+# 백그라운드 갱신 작업 참조 유지 (완료 전 가비지 컬렉션 방지)
+_refresh_tasks: Set[asyncio.Task] = set()
 
 
 async def execute_info_action(
     player: str, 
     bot, 
-    ctx: discord.ApplicationContext
-) -> Dict[str, str]:
+    ctx: discord.ApplicationContext,
+    refresh: bool = False
+) -> CommandResult[PlayerInfo]:
     """플레이어 정보 조회 실행."""
-    config = get_config()
-    
     try:
-        if not await send_console_command(
-            bot, f"cmi info {player}", ctx.user.mention, silent=True
-        ):
-            return {"error": "콘솔 명령어 전송 실패"}
-        
-        response_handler = ConsoleResponseHandler(
-            bot, config.ILUNAR_CONSOLE_CHANNEL_ID
-        )
-        console_response = await response_handler.wait_for_response(
+        response = await query_player_info(
+            bot, 
+            player, 
             ctx.user.mention, 
-            timeout=CONSOLE_RESPONSE_DELAY + 2.0,
-            keywords=["Display name:", player]
+            refresh=refresh
         )
+        if response.error_message == CONSOLE_SEND_FAILED:
+            return CommandResult.failure(CONSOLE_SEND_FAILED)
         
-        if console_response:
-            player_info = parse_player_info(console_response, player)
-            if player_info:
-                return player_info
+        if response.data:
+            return CommandResult.success_with(response.data)
         
-        return {
-            "error": (
-                f"플레이어 '{player}'의 정보를 찾을 수 없습니다.\n"
-                f"닉네임을 정확히 입력했는지 확인해주세요."
-            )
-        }
+        return CommandResult.failure(
+            f"플레이어 '{player}'의 정보를 찾을 수 없습니다.\n"
+            f"닉네임을 정확히 입력했는지 확인해주세요."
+        )
         
     except Exception as e:
         logger.error(f"플레이어 정보 조회 오류: {e}")
-        return {"error": str(e)}
+        return CommandResult.failure(str(e))
 
 
 async def handle_info_command(
     ctx: discord.ApplicationContext, 
-    player: str
+    player: str,
+    refresh: bool = False
 ) -> None:
     command_logger = CommandLogger()
     
@@ -75,6 +72,23 @@ async def handle_info_command(
         )
         return
     
+    players = _parse_player_names(player)
+    if not players or len(players) > MAX_INFO_PLAYERS:
+        embed = create_embed(
+            title="❌ 입력 오류",
+            description=f"플레이어 이름을 1~{MAX_INFO_PLAYERS}개 입력해주세요. (쉼표 또는 공백으로 구분)",
+            color=0xE74C3C,
+            ctx=ctx,
+            success=False
+        )
+        await ctx.respond(embed=embed, ephemeral=True)
+        return
+    
+    if len(players) > 1:
+        await _handle_multi_info(ctx, players, refresh, command_logger)
+        return
+    player = players[0]
+    
     processing_embed = create_embed(
         title="⏳ 정보 조회 중...",
         description=f"**`{player}`**님의 정보를 조회하고 있습니다...",
@@ -84,42 +98,162 @@ async def handle_info_command(
     await ctx.defer(ephemeral=False)
     await ctx.edit(embed=processing_embed)
     
-    info_data = await execute_info_action(player, ctx.bot, ctx)
-    success = "error" not in info_data
+    if not refresh and PlayerInfoCache().get(player) is None:
+        known = PlayerRegistry().latest(player)
+        if known and known.status == STATUS_OFFLINE:
+            await command_logger.log_command_usage(
+                ctx, 
+                "info", 
+                {"player": player, "source": "registry", "success": True}, 
+                success=True
+            )
+            await ctx.edit(embed=_create_result_embed(CommandResult.success_with(known), player, ctx))
+            task = asyncio.create_task(_refresh_in_background(ctx, player, known))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+            return
+    
+    result = await execute_info_action(player, ctx.bot, ctx, refresh)
     
     await command_logger.log_command_usage(
         ctx, 
         "info", 
-        {"player": player, "success": success}, 
-        success=success
+        {"player": player, "refresh": refresh, "success": result.success}, 
+        success=result.success
     )
     
-    result_embed = _create_result_embed(
-        info_data, player, ctx, success
-    )
+    result_embed = _create_result_embed(result, player, ctx)
     await ctx.edit(embed=result_embed)
 
 
+def _parse_player_names(raw: str) -> List[str]:
+    """쉼표/공백으로 구분된 플레이어 이름 목록 (대소문자 무시 중복 제거, 입력 순서 유지)."""
+    names: List[str] = []
+    seen: Set[str] = set()
+    for name in re.split(r'[,\s]+', raw):
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            names.append(name)
+    return names
+
+
+async def _handle_multi_info(
+    ctx: discord.ApplicationContext, 
+    players: List[str], 
+    refresh: bool, 
+    command_logger: CommandLogger
+) -> None:
+    """여러 플레이어를 한 번에 조회하여 페이지 임베드로 표시.
+
+    모든 `cmi info` 요청을 먼저 등록하고 연달아 전송하므로 응답은 플레이어별로
+    나뉘어 수집되며, 전체 소요 시간은 조회 한 번과 비슷하다.
+    """
+    processing_embed = create_embed(
+        title="⏳ 정보 조회 중...",
+        description=f"**{len(players)}명**의 정보를 조회하고 있습니다...\n" + ", ".join(f"`{p}`" for p in players),
+        color=0xF39C12,
+        ctx=ctx
+    )
+    await ctx.defer(ephemeral=False)
+    await ctx.edit(embed=processing_embed)
+    
+    results = await asyncio.gather(
+        *(execute_info_action(player, ctx.bot, ctx, refresh) for player in players)
+    )
+    
+    pages: List[discord.Embed] = []
+    succeeded = 0
+    for index, (player, result) in enumerate(zip(players, results)):
+        succeeded += result.success
+        embed = _create_result_embed(result, player, ctx)
+        embed.set_footer(text=f"{index + 1}/{len(players)}")
+        pages.append(embed)
+    
+    await command_logger.log_command_usage(
+        ctx, 
+        "info", 
+        {"players": players, "refresh": refresh, "succeeded": succeeded}, 
+        success=succeeded > 0
+    )
+    
+    await ctx.edit(embed=pages[0], view=InfoPageView(pages))
+
+
+class InfoPageView(discord.ui.View):
+    """여러 플레이어 조회 결과의 페이지 이동 버튼."""
+    
+    def __init__(self, pages: List[discord.Embed]) -> None:
+        super().__init__(timeout=PAGE_VIEW_TIMEOUT)
+        self.pages = pages
+        self.index = 0
+        self._update_buttons()
+    
+    def _update_buttons(self) -> None:
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index == len(self.pages) - 1
+    
+    async def _show(self, interaction: discord.Interaction, index: int) -> None:
+        self.index = max(0, min(index, len(self.pages) - 1))
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.pages[self.index], view=self)
+    
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        await self._show(interaction, self.index - 1)
+    
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, button: discord.ui.Button, interaction: discord.Interaction) -> None:
+        await self._show(interaction, self.index + 1)
+
+
+async def _refresh_in_background(
+    ctx: discord.ApplicationContext, 
+    player: str,
+    known: PlayerInfo
+) -> None:
+    """기록으로 응답한 뒤 콘솔에서 최신 정보를 받아 임베드 갱신.
+    
+    갱신에 실패하면 기록을 다시 표시하되 확인 중 표시를 실패 안내로 바꾼다.
+    """
+    try:
+        result = await execute_info_action(player, ctx.bot, ctx, refresh=True)
+        if result:
+            await ctx.edit(embed=_create_result_embed(result, player, ctx))
+            return
+        logger.warning(f"플레이어 정보 갱신 실패: {player} | {result.error_message}")
+    except Exception as e:
+        logger.error(f"플레이어 정보 갱신 오류: {e}")
+    
+    try:
+        stale_embed = _create_result_embed(
+            CommandResult.success_with(known), player, ctx, last_seen_note=REFRESH_FAILED_NOTE
+        )
+        await ctx.edit(embed=stale_embed)
+    except Exception as e:
+        logger.error(f"플레이어 정보 갱신 실패 표시 오류: {e}")
+
+
 def _create_result_embed(
-    info_data: Dict[str, str], 
+    result: CommandResult[PlayerInfo], 
     player: str, 
-    ctx: discord.ApplicationContext, 
-    success: bool
+    ctx: discord.ApplicationContext,
+    last_seen_note: str = REFRESH_PENDING_NOTE
 ) -> discord.Embed:
-    if not success:
+    if not result:
         return create_embed(
             title="정보 조회 실패",
             description=(
                 f"**`{player}`**님의 정보 조회 중 오류가 발생했습니다.\n\n"
-                f"**오류**: {info_data['error']}"
+                f"**오류**: {result.error_message}"
             ),
             color=0xE74C3C,
             ctx=ctx,
             success=False
         )
     
-    username = info_data['username']
-    display_name = info_data.get('display_name')
+    info = result.data
+    username = info.username
+    display_name = info.display_name
     
     player_name = (
         f"`{username}` ({display_name})" 
@@ -137,28 +271,41 @@ def _create_result_embed(
     
     embed.add_field(name="🎮 닉네임", value=player_name, inline=False)
     
-    if info_data.get('uuid'):
+    if info.uuid:
         embed.add_field(
             name="🆔 UUID", 
-            value=f"`{info_data['uuid']}`", 
+            value=f"`{info.uuid}`", 
             inline=False
         )
     
-    if info_data.get('ip'):
+    if info.ip:
         embed.add_field(
             name="🌐 IP 주소", 
-            value=f"`{info_data['ip']}`", 
+            value=f"`{info.ip}`", 
             inline=False
         )
     
-    status = info_data.get('status', '알 수 없음')
-    status_emoji = {"온라인": "🟢", "오프라인": "🔴"}.get(status, "⚪")
+    status_emoji = {STATUS_ONLINE: "🟢", STATUS_OFFLINE: "🔴"}.get(info.status, "⚪")
     embed.add_field(
         name="📊 온라인 상태", 
-        value=f"{status_emoji} `{status}`", 
+        value=f"{status_emoji} `{info.status_display}`", 
         inline=False
     )
     
+    if info.playtime:
+        embed.add_field(
+            name="⏱️ 플레이 시간", 
+            value=f"`{info.playtime}`", 
+            inline=False
+        )
+    
+    if info.last_seen:
+        embed.add_field(
+            name="🕒 마지막 확인", 
+            value=f"<t:{int(info.last_seen)}:R> 기록 ({last_seen_note})", 
+            inline=False
+        )
+    
     return embed
 
 
@@ -166,8 +313,9 @@ def setup(bot) -> None:
     """명령어 등록."""
     
     @bot.slash_command(name="info", description="플레이어의 정보를 조회합니다.")
-        async def info_func(
+    async def info_func(
         ctx: discord.ApplicationContext, 
-        player: str
+        player: str = discord.Option(str, description="조회할 플레이어 이름 (여러 명은 쉼표 또는 공백으로 구분)", autocomplete=player_name_autocomplete),
+        refresh: bool = discord.Option(bool, description="캐시를 무시하고 콘솔에서 다시 조회", default=False)
     ) -> None:
-        await handle_info_command(ctx, player)
\ No newline at end of file
+        await handle_info_command(ctx, player, refresh)
\ No newline at end of file
@@ -7,7 +7,7 @@ import discord
 from core.command_bridge import send_ilunar_command
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
-from utils.constants import kick_reason_autocomplete, COMMAND_DELAY
+from utils.constants import kick_reason_autocomplete, player_name_autocomplete, COMMAND_DELAY
 
 DEFAULT_REASON = "사유 없음"
 
@@ -108,10 +108,9 @@ def setup(bot) -> None:
     """명령어 등록."""
     
     @bot.slash_command(name="kick", description="플레이어를 킥합니다.")
-        # autocomplete: reason=kick_reason_autocomplete
     async def kick_func(
         ctx: discord.ApplicationContext, 
-        player: str, 
-        reason: str = DEFAULT_REASON
+        player: str = discord.Option(str, description="킥할 플레이어 이름", autocomplete=player_name_autocomplete), 
+        reason: str = discord.Option(str, description="킥 사유", default=DEFAULT_REASON, autocomplete=kick_reason_autocomplete)
     ) -> None:
         await handle_kick_command(ctx, player, reason)
\ No newline at end of file
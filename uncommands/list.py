@@ -1,22 +1,17 @@
 """온라인 플레이어 목록 명령어."""
 import asyncio
 import logging
-from typing import Dict, Any, List
 import discord
 
+from core.base import CommandResult
+from core.models import OnlineSnapshot
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
-from utils.constants import PROCESSING_DELAY
 
 logger = logging.getLogger(__name__)
 
 MAX_EMBED_TITLE_LENGTH = 256
 
-RANK_DISPLAY_ORDER = [
-    "special", "default", "premium", "lite", "ultra", 
-    "booster", "youtuber", "mod", "admin", "owner"
-]
-
 RANK_EMOJIS = {
     "default": "😀", 
     "lite": "💎",
@@ -31,49 +26,38 @@ RANK_EMOJIS = {
 }
 
 
-async def execute_list_action(bot, ctx: discord.ApplicationContext) -> Dict[str, Any]:
+async def execute_list_action(bot, ctx: discord.ApplicationContext) -> CommandResult[OnlineSnapshot]:
     """온라인 플레이어 목록 조회 실행."""
-    from core.command_bridge import send_console_command
-    from core.config import get_config
-    from utils.utils import ConsoleResponseHandler
+    from core.command_bridge import CONSOLE_SEND_FAILED, request_console_response
+    from core.player_index import PlayerNameIndex
+    from utils.utils import ConsoleResponseParser
     
     try:
-        config = get_config()
-        
-        # 콘솔 명령어 전송
-        list_success = await send_console_command(
+        # 콘솔 명령어 전송 및 응답 대기
+        response = await request_console_response(
             bot, "list", ctx.user.mention
         )
         
-        if not list_success:
-            return {"error": "콘솔 명령어 전송 실패"}
-        
-        # 콘솔 응답 대기 및 파싱
-        response_handler = ConsoleResponseHandler(bot, config.ILUNAR_CONSOLE_CHANNEL_ID)
-        console_response = await response_handler.wait_for_response(
-            ctx.user.mention, 
-            timeout=PROCESSING_DELAY,
-            keywords=["Players online"]
-        )
+        if response.error_message == CONSOLE_SEND_FAILED:
+            return CommandResult.failure(CONSOLE_SEND_FAILED)
         
+        console_response = response.data
         if console_response:
-            player_data = response_handler.parser.parse_player_list(console_response)
-            return player_data
+            snapshot = ConsoleResponseParser.parse_player_list(console_response)
+            if snapshot.available:
+                PlayerNameIndex().replace_online(snapshot.all_players())
+            return CommandResult.success_with(snapshot)
         else:
             logger.warning("콘솔 응답 없음, 기본값 사용")
-            return _get_fallback_player_data()
+            return CommandResult.success_with(_get_fallback_snapshot())
         
     except Exception as e:
         logger.error(f"플레이어 목록 조회 오류: {e}")
-        return {"error": str(e)}
+        return CommandResult.failure(str(e))
 
 
-def _get_fallback_player_data() -> Dict[str, Any]:
-    return {
-        "total_players": 0,
-        "max_players": 999,
-        "message": "현재 온라인 플레이어 정보를 가져올 수 없습니다."
-    }
+def _get_fallback_snapshot() -> OnlineSnapshot:
+    return OnlineSnapshot.unavailable("현재 온라인 플레이어 정보를 가져올 수 없습니다.")
 
 
 def _create_permission_error_embed(ctx: discord.ApplicationContext) -> discord.Embed:
@@ -113,71 +97,69 @@ def _create_processing_embed(ctx: discord.ApplicationContext) -> discord.Embed:
     )
 
 
-def _create_result_embed(ctx: discord.ApplicationContext, list_data: Dict[str, Any]) -> discord.Embed:
+def _create_result_embed(ctx: discord.ApplicationContext, result: CommandResult[OnlineSnapshot]) -> discord.Embed:
     """
     목록 조회 결과 임베드를 생성합니다.
     
     Args:
         ctx: Discord 상호작용 객체
-        list_data: 플레이어 목록 데이터
+        result: 플레이어 목록 조회 결과
         
     Returns:
         discord.Embed: 결과 임베드
     """
-    if "error" in list_data:
+    if not result:
         return create_embed(
             title="❌ 목록 조회 실패",
-            description=f"플레이어 목록 조회 중 오류가 발생했습니다.\n\n**오류**: {list_data['error']}",
+            description=f"플레이어 목록 조회 중 오류가 발생했습니다.\n\n**오류**: {result.error_message}",
             color=0xE74C3C,
             ctx=ctx,
             success=False
         )
     
+    snapshot = result.data
+    
     # 메시지가 있는 경우 (응답이 없거나 파싱 실패)
-    if "message" in list_data:
+    if not snapshot.available:
         return create_embed(
             title="📋 온라인 플레이어 목록",
-            description=list_data["message"],
+            description=snapshot.message,
             color=0x95A5A6,
             ctx=ctx,
             success=True
         )
     
     # 성공 임베드 생성
-    total_players = list_data.get("total_players", 0)
-    max_players = list_data.get("max_players", 999)
-    
     result_embed = create_embed(
         title="📋 온라인 플레이어 목록",
-        description=f"현재 **{total_players}/{max_players}명**이 온라인입니다.",
+        description=f"현재 **{snapshot.total_players}/{snapshot.max_players}명**이 온라인입니다.",
         color=0x00FF00,
         ctx=ctx,
         success=True
     )
     
     # 등급별 플레이어 표시
-    _add_player_fields(result_embed, list_data)
+    _add_player_fields(result_embed, snapshot)
     
     return result_embed
 
 
-def _add_player_fields(embed: discord.Embed, list_data: Dict[str, Any]) -> None:
+def _add_player_fields(embed: discord.Embed, snapshot: OnlineSnapshot) -> None:
     """
     임베드에 등급별 플레이어 필드를 추가합니다.
     
     Args:
         embed: 임베드 객체
-        list_data: 플레이어 목록 데이터
+        snapshot: 플레이어 목록
     """
-    for rank in RANK_DISPLAY_ORDER:
-        if rank in list_data and list_data[rank]:
-            players_text = ", ".join([f"`{player}`" for player in list_data[rank]])
-            
-            embed.add_field(
-                name=f"{rank} ({len(list_data[rank])}명)",
-                value=players_text,
-                inline=False
-            )
+    for rank, players in snapshot.iter_ranks():
+        players_text = ", ".join([f"`{player}`" for player in players])
+        
+        embed.add_field(
+            name=f"{rank} ({len(players)}명)",
+            value=players_text,
+            inline=False
+        )
 
 
 async def handle_list_command(ctx: discord.ApplicationContext) -> None:
@@ -202,15 +184,15 @@ async def handle_list_command(ctx: discord.ApplicationContext) -> None:
     await ctx.edit(embed=processing_embed)
     
     # 목록 조회 실행
-    list_data = await execute_list_action(ctx.bot, ctx)
+    result = await execute_list_action(ctx.bot, ctx)
     
     # 결과 임베드 생성 및 전송
-    result_embed = _create_result_embed(ctx, list_data)
+    result_embed = _create_result_embed(ctx, result)
     await ctx.edit(embed=result_embed)
     
     # 성공 로깅
     await command_logger.log_command_usage(
-        ctx, "list", list_data, success="error" not in list_data
+        ctx, "list", result.data.to_dict() if result else {"error": result.error_message}, success=result.success
     )
 
 
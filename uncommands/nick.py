@@ -7,7 +7,7 @@ import discord
 
 from utils.utils import create_embed, CommandLogger
 from utils.decorators import check_staff_permission
-from utils.constants import PROCESSING_DELAY
+from utils.constants import PROCESSING_DELAY, player_name_autocomplete
 
 logger = logging.getLogger(__name__)
 
@@ -196,10 +196,10 @@ def setup(bot):
     """명령어 등록."""
     
     @bot.slash_command(name="nick", description="플레이어의 닉네임을 변경합니다.")
-    @app_commands.describe(
-        player="닉네임을 변경할 플레이어 이름",
-        code="새로 설정할 닉네임 코드 (띄어쓰기 불가)"
-    )
-    async def nick_func(ctx: discord.ApplicationContext, player: str, code: str):
+    async def nick_func(
+        ctx: discord.ApplicationContext,
+        player: str = discord.Option(str, description="닉네임을 변경할 플레이어 이름", autocomplete=player_name_autocomplete),
+        code: str = discord.Option(str, description="새로 설정할 닉네임 코드 (띄어쓰기 불가)")
+    ):
         """플레이어의 닉네임 변경."""
         await handle_nick_command(ctx, player, code)
\ No newline at end of file
@@ -6,6 +6,8 @@ import discord
 
 # 경로
 DATA_DIR = Path(__file__).parent.parent / "data"
+PLAYER_REGISTRY_PATH = DATA_DIR / "players.db"
+BAN_LOG_STORE_PATH = DATA_DIR / "ban_logs.db"
 
 # 색상 (0xRRGGBB 형식)
 COLORS = {
@@ -32,6 +34,46 @@ PROCESSING_DELAY: int = 1
 INFO_DELAY: int = 3
 CONSOLE_RESPONSE_DELAY: int = 5
 
+# 콘솔 응답 시간 기반 대기 (관측된 지연 시간 백분위수로 계산, 표본이 부족하면 기본값 사용)
+CONSOLE_LATENCY_WINDOW: int = 256
+CONSOLE_LATENCY_MIN_SAMPLES: int = 10
+CONSOLE_DEADLINE_PERCENTILE: float = 0.99
+CONSOLE_DEADLINE_FACTOR: float = 1.5
+CONSOLE_DEADLINE_MIN: float = 1.0
+CONSOLE_DEADLINE_MAX: float = 15.0
+
+# 플레이어 정보 조회 (첫 조회가 p95보다 느리면 두 번째 조회를 보내고, 전체 상한을 넘기지 않음)
+CONSOLE_HEDGE_PERCENTILE: float = 0.95
+PLAYER_INFO_DEADLINE: float = 8.0
+PLAYER_INFO_MAX_ATTEMPTS: int = 2
+
+# 접속 기록 기반 플레이어 정보 미리 조회 (콘솔 부하 제한)
+PLAYER_WARM_INTERVAL: float = 3.0
+PLAYER_WARM_QUEUE_SIZE: int = 20
+PLAYER_WARM_TRACKED: int = 256
+
+# 플레이어 이름 자동완성 색인 (접속 중이 아닌 최근 확인된 플레이어 보관 수, 자동완성 결과 수)
+PLAYER_INDEX_RECENT_LIMIT: int = 1000
+AUTOCOMPLETE_LIMIT: int = 25
+
+# 차단 로그 채널 동기화 (동기화 위치가 없으면 최근 메시지만 색인, 따라잡기 중 저장 단위,
+# 따라잡기 실패 시 재시도 횟수와 첫 대기 시간(초, 재시도마다 두 배))
+BAN_LOG_SEED_LIMIT: int = 1000
+BAN_LOG_SYNC_BATCH: int = 100
+BAN_LOG_SYNC_MAX_RETRIES: int = 5
+BAN_LOG_SYNC_RETRY_DELAY: float = 2.0
+
+# 차단 로그 전체 기록 백필 (페이지 사이 대기로 다른 명령어의 API 호출 여유 확보)
+BAN_LOG_BACKFILL_PAGE_SIZE: int = 100
+BAN_LOG_BACKFILL_PAGE_DELAY: float = 1.0
+BAN_LOG_BACKFILL_REPORT_PAGES: int = 10
+BAN_LOG_BACKFILL_MAX_RETRIES: int = 5
+
+# 메시지 삭제 (일괄 삭제는 14일 이내 메시지를 한 번에 최대 100개까지만 지원)
+BULK_DELETE_BATCH_SIZE: int = 100
+BULK_DELETE_MAX_AGE_DAYS: int = 14
+SINGLE_DELETE_CONCURRENCY: int = 5
+
 TEMPBAN_DURATION_OPTIONS: List[str] = [
     "30m", "1h", "2h", "3h", "6h", "12h",
     "1d", "2d", "3d", "6d", "7d", "9d", "15d", "45d", "영구"
@@ -122,8 +164,29 @@ mute_duration_autocomplete = _create_autocomplete(MUTE_DURATION_OPTIONS)
 mute_reason_autocomplete = _create_autocomplete(MUTE_REASON_OPTIONS)
 kick_reason_autocomplete = _create_autocomplete(KICK_REASON_OPTIONS)
 
+
+async def player_name_autocomplete(ctx: discord.AutocompleteContext) -> List[str]:
+    """접속 중/최근 확인된 플레이어 이름 자동완성 (쉼표/공백으로 구분된 마지막 이름을 완성)."""
+    from core.player_index import PlayerNameIndex
+
+    value = ctx.value or ""
+    cut = max(value.rfind(","), value.rfind(" ")) + 1
+    head, prefix = value[:cut], value[cut:]
+    return [head + name for name in PlayerNameIndex().complete(prefix)]
+
+async def banned_player_autocomplete(ctx: discord.AutocompleteContext) -> List[str]:
+    """차단 로그가 있는 플레이어 이름 자동완성 (대소문자 무시, 접두사/오타/숫자 치환 포함)."""
+    from core.ban_log_store import BanLogStore
+
+    value = (ctx.value or "").strip()
+    if not value:
+        return []
+    return [match.username for match in BanLogStore().find_names(value, AUTOCOMPLETE_LIMIT)]
+
 __all__ = [
     "DATA_DIR",
+    "PLAYER_REGISTRY_PATH",
+    "BAN_LOG_STORE_PATH",
     "COLORS",
     "DEFAULT_ACTIVITY_NAME",
     "AUTO_SAVE_INTERVAL",
@@ -132,6 +195,31 @@ __all__ = [
     "PROCESSING_DELAY",
     "INFO_DELAY",
     "CONSOLE_RESPONSE_DELAY",
+    "CONSOLE_LATENCY_WINDOW",
+    "CONSOLE_LATENCY_MIN_SAMPLES",
+    "CONSOLE_DEADLINE_PERCENTILE",
+    "CONSOLE_DEADLINE_FACTOR",
+    "CONSOLE_DEADLINE_MIN",
+    "CONSOLE_DEADLINE_MAX",
+    "CONSOLE_HEDGE_PERCENTILE",
+    "PLAYER_INFO_DEADLINE",
+    "PLAYER_INFO_MAX_ATTEMPTS",
+    "PLAYER_WARM_INTERVAL",
+    "PLAYER_WARM_QUEUE_SIZE",
+    "PLAYER_WARM_TRACKED",
+    "PLAYER_INDEX_RECENT_LIMIT",
+    "AUTOCOMPLETE_LIMIT",
+    "BAN_LOG_SEED_LIMIT",
+    "BAN_LOG_SYNC_BATCH",
+    "BAN_LOG_SYNC_MAX_RETRIES",
+    "BAN_LOG_SYNC_RETRY_DELAY",
+    "BAN_LOG_BACKFILL_PAGE_SIZE",
+    "BAN_LOG_BACKFILL_PAGE_DELAY",
+    "BAN_LOG_BACKFILL_REPORT_PAGES",
+    "BAN_LOG_BACKFILL_MAX_RETRIES",
+    "BULK_DELETE_BATCH_SIZE",
+    "BULK_DELETE_MAX_AGE_DAYS",
+    "SINGLE_DELETE_CONCURRENCY",
     "TEMPBAN_DURATION_OPTIONS",
     "TEMPBAN_REASON_OPTIONS",
     "BAN_REASON_OPTIONS",
@@ -144,4 +232,6 @@ __all__ = [
     "mute_duration_autocomplete",
     "mute_reason_autocomplete",
     "kick_reason_autocomplete",
+    "player_name_autocomplete",
+    "banned_player_autocomplete",
 ]
@@ -1,8 +1,16 @@
 """로깅 설정"""
 from __future__ import annotations
+import atexit
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
-__all__ = ["configure_logging"]
+__all__ = ["configure_logging", "shutdown_logging", "JsonFormatter"]
 
 _SUPPRESS_LOGGERS = (
     "discord",
@@ -11,11 +19,120 @@ _SUPPRESS_LOGGERS = (
     "discord.http",
 )
 
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+# LogRecord 기본 속성 (이 밖의 속성은 extra로 전달된 구조화 필드)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_exc_formatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 출력.
+
+    `logger.info("...", extra={"command": ..., "player": ..., "latency": ...})`처럼
+    전달된 필드는 최상위 키로 함께 기록된다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """메시지만 확정하고 출력 형식 변환은 리스너 스레드로 미루는 핸들러.
+
+    `msg % args`와 예외 포맷은 호출한 스레드에서 바로 해 두므로, args 객체가 이후에
+    바뀌거나 다른 스레드에서 읽혀도 로그에는 호출 시점의 값이 남는다. 기본 QueueHandler와
+    달리 핸들러의 포맷(JSON 직렬화 등)은 하지 않고 레코드를 그대로 넘긴다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _resolve_level(level: Optional[int]) -> int:
+    if level is not None:
+        return level
+    resolved = logging.getLevelName(os.getenv("LOG_LEVEL", "INFO").upper())
+    return resolved if isinstance(resolved, int) else logging.INFO
+
+
+def configure_logging(
+    level: Optional[int] = None,
+    fmt: Optional[str] = None,
+    log_file: Optional[str] = None
+) -> None:
+    """로깅 설정: 애플리케이션은 LOG_LEVEL(기본 INFO), Discord는 WARNING 레벨.
+
+    로그 호출은 메시지를 확정해 큐에 넣기만 하고, JSON 변환과 출력은 별도 리스너 스레드가 처리하므로
+    느린 디스크나 터미널이 이벤트 루프를 막지 않는다.
+
+    Args:
+        level: 로그 레벨 (생략 시 LOG_LEVEL 환경 변수)
+        fmt: "json" 또는 "text" (생략 시 LOG_FORMAT 환경 변수, 기본 json)
+        log_file: 로그 파일 경로 (생략 시 LOG_FILE 환경 변수, 없으면 파일 기록 안 함)
+    """
+    global _listener
+
+    root = logging.getLogger()
+    if not root.handlers:
+        fmt = (fmt or os.getenv("LOG_FORMAT", "json")).lower()
+        log_file = log_file or os.getenv("LOG_FILE")
+
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(
+            JsonFormatter() if fmt == "json" else logging.Formatter("%(message)s")
+        )
+        handlers: List[logging.Handler] = [console_handler]
+
+        if log_file:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=LOG_FILE_MAX_BYTES,
+                backupCount=LOG_FILE_BACKUP_COUNT,
+                encoding="utf-8"
+            )
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        root.addHandler(_LazyQueueHandler(log_queue))
+        root.setLevel(_resolve_level(level))
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
 
-def configure_logging(level: int = logging.INFO) -> None:
-    """로깅 설정: 애플리케이션은 INFO, Discord는 WARNING 레벨"""
-    if not logging.getLogger().handlers:
-        logging.basicConfig(level=level, format="%(message)s")
-    
     for logger_name in _SUPPRESS_LOGGERS:
         logging.getLogger(logger_name).setLevel(logging.WARNING)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드 종료."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -4,11 +4,16 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import discord
 
+from core.latency import ConsoleLatencyTracker
+from core.models import STATUS_OFFLINE, STATUS_ONLINE, OnlineSnapshot, PlayerInfo, rank_key
+
 EMBED_SUCCESS = 0x27AE60
 EMBED_ERROR = 0xE74C3C
 EMBED_INFO = 0x0099FF
@@ -16,6 +21,28 @@ EMBED_PROCESSING = 0xF39C12
 
 logger = logging.getLogger(__name__)
 
+# 콘솔 파싱 패턴 (모듈 로드 시 한 번만 컴파일)
+CONSOLE_TIMESTAMP_PATTERN = re.compile(r'\[.*?\s+\d+:\d+:\d+\s+INFO\s*\]\s*')
+_UUID_VALUE_PATTERN = re.compile(
+    r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})\b|([a-f0-9]{32})\b',
+    re.IGNORECASE
+)
+_IPV4_VALUE_PATTERN = re.compile(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b')
+# parse_player_info가 값 형식을 확인하는 `cmi info` 필드 (소문자 필드명)
+_FIELD_VALUE_PATTERNS = {'uuid': _UUID_VALUE_PATTERN, 'ip': _IPV4_VALUE_PATTERN}
+# 한 줄에 여러 필드가 있어도 모두 찾도록 줄 안의 모든 필드 이름 위치를 찾음
+# ("Old UUID:", "(UUID:"처럼 앞에 다른 문자가 붙은 필드 포함, 단어 중간은 제외)
+_INFO_LABEL_PATTERN = re.compile(r'\b(UUID|Ip|PlayTime):', re.IGNORECASE)
+_INFO_LABELS = ('uuid', 'ip', 'playtime')
+_INFO_LABEL_MARKS = tuple(f"{name}:" for name in _INFO_LABELS)
+_INFO_FIELD_PATTERNS = {
+    'uuid': re.compile(r'UUID:\s*([a-f0-9-]+)', re.IGNORECASE),
+    'ip': re.compile(r'IP:\s*([\d.]+)', re.IGNORECASE),
+    'group': re.compile(r'Group:\s*(\w+)', re.IGNORECASE),
+    'playtime': re.compile(r'PlayTime:\s*(.+)', re.IGNORECASE),
+}
+_LIST_ONLINE_PATTERN = re.compile(r'Players online (\d+)/(\d+)')
+
 
 def create_embed(
     title: str,
@@ -88,16 +115,9 @@ class ConsoleResponseParser:
             플레이어 정보 또는 None
         """
         try:
-            patterns = {
-                'uuid': r'UUID:\s*([a-f0-9-]+)',
-                'ip': r'IP:\s*([\d.]+)',
-                'group': r'Group:\s*(\w+)',
-                'playtime': r'PlayTime:\s*(.+)'
-            }
-            
             info: Dict[str, str] = {}
-            for key, pattern in patterns.items():
-                match = re.search(pattern, console_output, re.IGNORECASE)
+            for key, pattern in _INFO_FIELD_PATTERNS.items():
+                match = pattern.search(console_output)
                 if match:
                     info[key] = match.group(1).strip() if key == 'playtime' else match.group(1)
             
@@ -107,49 +127,178 @@ class ConsoleResponseParser:
             return None
     
     @staticmethod
-    def parse_player_list(console_output: str) -> Dict[str, Any]:
+    def parse_player_list(console_output: str) -> OnlineSnapshot:
         """콘솔 출력에서 플레이어 목록 파싱.
         
         Args:
             console_output: 파싱할 콘솔 출력
             
         Returns:
-            플레이어 목록 정보
+            플레이어 목록 (파싱에 실패하면 message가 있는 OnlineSnapshot)
         """
         try:
-            data: Dict[str, Any] = {
-                "total_players": 0, "max_players": 999,
-                "special": [], "default": [], "premium": [], "lite": [],
-                "ultra": [], "booster": [], "youtuber": [], "mod": [],
-                "admin": [], "owner": []
-            }
+            total_players, max_players = 0, 999
+            ranks: Dict[str, List[str]] = {}
             
             for line in console_output.split('\n'):
-                clean_line = re.sub(r'\[.*?\s+\d+:\d+:\d+\s+INFO\s*\]\s*', '', line).strip()
+                clean_line = (CONSOLE_TIMESTAMP_PATTERN.sub('', line) if '[' in line else line).strip()
                 
                 if not clean_line or "========================" in clean_line:
                     continue
                 
                 if "Players online" in clean_line:
-                    match = re.search(r'Players online (\d+)/(\d+)', clean_line)
+                    match = _LIST_ONLINE_PATTERN.search(clean_line)
                     if match:
-                        data['total_players'] = int(match.group(1))
-                        data['max_players'] = int(match.group(2))
+                        total_players = int(match.group(1))
+                        max_players = int(match.group(2))
                     continue
                 
-                rank_match = re.match(r'^(\w+):\s*(.+)$', clean_line)
-                if rank_match:
-                    rank = rank_match.group(1).lower()
-                    players_str = rank_match.group(2).strip()
-                    
-                    if rank in data and players_str:
-                        players = [p.strip() for p in players_str.split(',') if p.strip()]
-                        data[rank].extend(players)
+                # "rank: a, b" 형식 (정규식 ^(\w+):\s*(.+)$ 와 같은 조건을 문자열 연산으로 확인)
+                rank, sep, players_str = clean_line.partition(':')
+                key = rank_key(rank) if sep else None
+                if key:
+                    players = [p.strip() for p in players_str.split(',') if p.strip()]
+                    if players:
+                        ranks.setdefault(key, []).extend(players)
             
-            return data
+            return OnlineSnapshot(total_players, max_players, ranks)
         except Exception as e:
             logger.error(f"목록 파싱 오류: {e}")
-            return {"total_players": 0, "max_players": 999, "message": f"파싱 오류: {e}"}
+            return OnlineSnapshot.unavailable(f"파싱 오류: {e}")
+
+
+CONSOLE_SEPARATORS = ("========================", "--------------------------------------------------")
+
+
+def is_console_separator(line: str) -> bool:
+    """콘솔 블록 구분선 여부."""
+    return any(sep in line for sep in CONSOLE_SEPARATORS)
+
+
+@dataclass(frozen=True)
+class AssembledBlock:
+    """조립이 끝난 콘솔 블록."""
+    
+    key: Tuple[int, int]
+    lines: Tuple[str, ...]
+    
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+
+class ConsoleBlockAssembler:
+    """콘솔 메시지를 도착하는 대로 받아 완성된 블록을 한 번씩 내보내는 증분 조립기.
+    
+    열린 블록 하나만 상태로 유지하므로 메시지당 비용은 채널에 쌓인 메시지 수와
+    무관하다. 한 블록이 여러 메시지로 나뉘어 순서가 뒤바뀌어 도착하면 메시지 ID
+    순으로 다시 정렬하고, 이미 지나간 구간의 늦은 메시지는 구분선 짝이 어긋나지
+    않도록 버린다.
+    """
+    
+    def __init__(self) -> None:
+        self._open_key: Optional[Tuple[int, int]] = None
+        self._fragments: List[Tuple[int, List[str]]] = []
+        self._last_id = 0
+    
+    @property
+    def in_block(self) -> bool:
+        """블록이 열려 있는지 여부."""
+        return self._open_key is not None
+    
+    def feed(self, message_id: int, lines: Iterable[str]) -> List[AssembledBlock]:
+        """메시지 한 개의 줄을 반영하고 이번에 완성된 블록 반환.
+        
+        Args:
+            message_id: 메시지 ID (생성 순서대로 증가)
+            lines: 메시지 줄 목록
+            
+        Returns:
+            새로 완성된 블록 목록
+        """
+        if message_id < self._last_id:
+            self._feed_late(message_id, list(lines))
+            return []
+        self._last_id = message_id
+        
+        completed: List[AssembledBlock] = []
+        current: Optional[List[str]] = None
+        
+        for index, line in enumerate(lines):
+            if is_console_separator(line):
+                if self._open_key is not None:
+                    block = self._close()
+                    if block:
+                        completed.append(block)
+                else:
+                    self._open_key = (message_id, index)
+                    self._fragments = []
+                current = None
+            elif self._open_key is not None:
+                if current is None:
+                    current = []
+                    self._fragments.append((message_id, current))
+                current.append(line)
+        
+        return completed
+    
+    def _feed_late(self, message_id: int, lines: List[str]) -> None:
+        """순서가 늦게 도착한 메시지를 열린 블록의 제자리에 삽입."""
+        if (
+            self._open_key is None
+            or message_id < self._open_key[0]
+            or any(is_console_separator(line) for line in lines)
+        ):
+            logger.debug("순서가 지난 콘솔 메시지 무시: %s", message_id)
+            return
+        
+        position = len(self._fragments)
+        while position > 0 and self._fragments[position - 1][0] > message_id:
+            position -= 1
+        self._fragments.insert(position, (message_id, lines))
+    
+    def _close(self) -> Optional[AssembledBlock]:
+        key = self._open_key
+        lines = tuple(line for _, fragment in self._fragments for line in fragment)
+        self._open_key = None
+        self._fragments = []
+        return AssembledBlock(key, lines) if lines else None
+
+
+def extract_console_blocks(contents: Iterable[str]) -> List[str]:
+    """메시지 본문에서 구분선으로 감싸진 콘솔 블록 추출.
+    
+    Args:
+        contents: 시간순으로 정렬된 메시지 본문 목록
+        
+    Returns:
+        콘솔 블록 목록
+    """
+    assembler = ConsoleBlockAssembler()
+    blocks: List[str] = []
+    
+    for message_id, content in enumerate(contents, start=1):
+        blocks.extend(block.text for block in assembler.feed(message_id, content.split('\n')))
+    
+    return blocks
+
+
+def block_matches(block: str, keywords: Optional[List[str]]) -> bool:
+    """블록에 키워드 중 하나라도 포함되는지 확인 (키워드가 없으면 항상 일치)."""
+    if not keywords:
+        return True
+    lowered = block.lower()
+    return any(keyword.lower() in lowered for keyword in keywords)
+
+
+def find_matching_block(blocks: List[str], keywords: Optional[List[str]]) -> Optional[str]:
+    """키워드에 맞는 가장 최근 블록 찾기 (없으면 마지막 블록)."""
+    if keywords:
+        for block in reversed(blocks):
+            if block_matches(block, keywords):
+                return block
+    
+    return blocks[-1] if blocks else None
 
 
 class ConsoleResponseHandler:
@@ -172,11 +321,15 @@ class ConsoleResponseHandler:
         timeout: float = 5.0,
         keywords: Optional[List[str]] = None
     ) -> Optional[str]:
-        """콘솔 채널에서 응답 대기.
+        """콘솔 채널 기록을 조회하여 응답 대기 (콘솔 리스너가 없을 때 사용).
+        
+        관측된 일반 응답 시간(p50)만큼 기다린 뒤 기록을 조회하고, 키워드에 맞는 블록이
+        없으면 같은 간격으로 다시 조회한다. 대기 상한(p99 기반)과 timeout 중 짧은 쪽에
+        이르면 그때까지의 마지막 블록을 반환한다.
         
         Args:
             mention: 언급 (미사용)
-            timeout: 타임아웃 (초)
+            timeout: 최대 대기 시간 (초)
             keywords: 검색 키워드
             
         Returns:
@@ -188,16 +341,21 @@ class ConsoleResponseHandler:
                 logger.error(f"콘솔 채널 없음: {self.console_channel_id}")
                 return None
             
-            await asyncio.sleep(2.0)
-            
-            messages = [msg async for msg in channel.history(limit=50)]
-            messages.reverse()
-            blocks = self._extract_console_blocks(messages)
-            
-            if blocks:
-                return self._find_matching_block(blocks, keywords)
+            latency = ConsoleLatencyTracker()
+            give_up_at = time.monotonic() + min(timeout, latency.deadline())
+            interval = latency.expected()
             
-            return None
+            while True:
+                await asyncio.sleep(max(0.0, min(interval, give_up_at - time.monotonic())))
+                
+                messages = [msg async for msg in channel.history(limit=50)]
+                messages.reverse()
+                blocks = self._extract_console_blocks(messages)
+                
+                if blocks and (not keywords or any(block_matches(block, keywords) for block in blocks)):
+                    return self._find_matching_block(blocks, keywords)
+                if time.monotonic() >= give_up_at:
+                    return self._find_matching_block(blocks, keywords) if blocks else None
         except Exception as e:
             logger.error(f"콘솔 응답 대기 오류: {e}")
             return None
@@ -211,22 +369,7 @@ class ConsoleResponseHandler:
         Returns:
             콘솔 블록 목록
         """
-        blocks: List[str] = []
-        lines: List[str] = []
-        in_block = False
-        separators = ["========================", "--------------------------------------------------"]
-        
-        for msg in messages:
-            for line in msg.content.split('\n'):
-                if any(sep in line for sep in separators):
-                    if in_block and lines:
-                        blocks.append('\n'.join(lines))
-                    lines = []
-                    in_block = not in_block
-                elif in_block:
-                    lines.append(line)
-        
-        return blocks
+        return extract_console_blocks(msg.content for msg in messages)
     
     def _find_matching_block(
         self,
@@ -242,17 +385,35 @@ class ConsoleResponseHandler:
         Returns:
             일치하는 블록 또는 None
         """
-        if keywords:
-            for block in reversed(blocks):
-                if any(keyword.lower() in block.lower() for keyword in keywords):
-                    return block
-        
-        return blocks[-1] if blocks else None
+        return find_matching_block(blocks, keywords)
 
 
-def parse_player_info(console_output: str, player: str) -> Optional[Dict[str, str]]:
+def _split_info_fields(line: str) -> List[Tuple[str, str]]:
+    """줄 안의 모든 (소문자 필드명, 값) 쌍 (값은 다음 필드 이름 앞까지)."""
+    labels = list(_INFO_LABEL_PATTERN.finditer(line))
+    return [
+        (label.group(1).lower(), line[label.end():labels[index + 1].start() if index + 1 < len(labels) else len(line)])
+        for index, label in enumerate(labels)
+    ]
+
+
+def _take_field_value(found: Dict[str, str], field_name: str, match: re.Match) -> None:
+    """형식이 맞는 필드 값 기록 (uuid/uuid_compact/ip 각각 처음 나온 값만 사용)."""
+    if field_name == 'ip':
+        found.setdefault('ip', match.group(1))
+    elif match.group(1):
+        found.setdefault('uuid', match.group(1))
+    else:
+        found.setdefault('uuid_compact', match.group(2))
+
+
+def parse_player_info(console_output: str, player: str) -> Optional[PlayerInfo]:
     """콘솔 출력에서 플레이어 정보 파싱.
     
+    줄마다 타임스탬프를 떼고 `필드: 값`의 필드명으로 분기하므로 전체 텍스트를 다시 훑지
+    않는다. 한 줄에 필드가 여러 개이거나 "(UUID:"처럼 필드명 앞에 다른 문자가 붙은 줄만
+    정규식으로 필드(UUID/Ip/PlayTime)를 모두 찾는다.
+    
     Args:
         console_output: 파싱할 콘솔 출력
         player: 플레이어명
@@ -261,144 +422,126 @@ def parse_player_info(console_output: str, player: str) -> Optional[Dict[str, st
         플레이어 정보 또는 None
     """
     try:
-        logger.debug(f"원본 콘솔 출력 (첫 500자):\n{console_output[:500]}")
-        
-        # 원본 텍스트를 줄 단위로 분리 (정리 전)
-        raw_lines = console_output.split('\n')
-        
-        # 타임스탬프만 제거하고 원본 유지
-        cleaned_lines = []
-        for line in raw_lines:
-            # 타임스탬프 패턴 제거: [일 10:57:46 INFO]
-            cleaned = re.sub(r'\[.*?\s+\d+:\d+:\d+\s+INFO\s*\]\s*', '', line)
-            if cleaned.strip() and not re.match(r'^[-=]{10,}$', cleaned.strip()):
-                cleaned_lines.append(cleaned)
-        
-        # 전체 텍스트 재구성
-        full_text = '\n'.join(cleaned_lines)
-        logger.debug(f"정리된 출력 (첫 500자):\n{full_text[:500]}")
-        
-        # === 플레이어 이름 추출 ===
-        username = None
-        display_name = None
-        
-        # 패턴 1: "닉네임 Prefix: Suffix: Offline for:" 형식
-        # 첫 번째 단어가 플레이어 이름
-        first_line = cleaned_lines[0] if cleaned_lines else ""
-        if first_line:
-            # Prefix: 앞의 첫 단어 추출
-            words = first_line.split()
-            if words:
-                username = words[0]
-                logger.debug(f"첫 줄에서 이름 추출: {username}")
-        
-        # 패턴 2: "username Prefix: x Suffix: y" 형식에서 추출
-        if not username:
-            name_match = re.search(r'^(\S+)\s+Prefix:', full_text, re.MULTILINE)
-            if name_match:
-                username = name_match.group(1)
-                logger.debug(f"Prefix 패턴에서 이름 추출: {username}")
-        
-        # 패턴 3: 전통적인 Display name 패턴
-        if not username:
-            name_match = re.search(r'(\S+)\s+Display name:\s*(\S+)', full_text)
-            if name_match:
-                username = name_match.group(1)
-                display_name = name_match.group(2)
-                logger.debug(f"Display name 패턴에서 추출: {username}, {display_name}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("원본 콘솔 출력 (첫 500자):\n%s", console_output[:500])
+        
+        cleaned_lines: List[str] = []
+        found: Dict[str, str] = {}
+        playtime = None
+        pending: Optional[str] = None
+        online = False
+        offline = False
+        
+        for line in console_output.split('\n'):
+            # 타임스탬프만 제거하고 원본 유지 (빈 줄과 구분선 제외)
+            cleaned = CONSOLE_TIMESTAMP_PATTERN.sub('', line) if '[' in line else line
+            stripped = cleaned.strip()
+            if not stripped or (len(stripped) >= 10 and not stripped.strip('-=')):
+                continue
+            cleaned_lines.append(cleaned)
+            
+            if not online:
+                online = "Online for:" in cleaned or "CanFly" in cleaned
+                offline = offline or "Offline for:" in cleaned
+            
+            if pending is not None:
+                # 값 없이 끝난 "UUID:" 다음 줄이 값인 출력 (값 뒤의 다른 필드도 계속 읽음)
+                match = _FIELD_VALUE_PATTERNS[pending].match(stripped)
+                if match:
+                    _take_field_value(found, pending, match)
+                pending = None
+            
+            label, colon, rest = cleaned.partition(':')
+            if not colon:
+                continue
+            word = label.rsplit(None, 1)[-1] if label and not label[-1].isspace() else ''
+            if ':' not in rest and (not word or word.isalnum()):
+                # 필드가 하나뿐인 대부분의 줄은 정규식 없이 마지막 단어로 분기
+                field_name = word.lower()
+                if field_name not in _INFO_LABELS:
+                    continue
+                fields: Iterable[Tuple[str, str]] = ((field_name, rest),)
+            else:
+                lowered = cleaned.lower()
+                if not any(mark in lowered for mark in _INFO_LABEL_MARKS):
+                    continue
+                fields = _split_info_fields(cleaned)
+            
+            for field_name, value in fields:
+                value = value.strip()
+                pending = None
+                if field_name == 'playtime':
+                    if playtime is None and value:
+                        playtime = value
+                elif field_name in _FIELD_VALUE_PATTERNS:
+                    if not value:
+                        # 줄 끝의 "UUID:"는 다음 줄이 값 (다음 필드가 같은 줄에 있으면 취소됨)
+                        pending = field_name
+                        continue
+                    match = _FIELD_VALUE_PATTERNS[field_name].match(value)
+                    if match:
+                        _take_field_value(found, field_name, match)
         
-        if not username:
-            logger.warning(f"플레이어 이름 추출 실패. 첫 줄: {first_line[:100]}")
+        # 첫 번째 줄("닉네임 Prefix: Suffix: Offline for:" 형식)의 첫 단어가 플레이어 이름
+        if not cleaned_lines:
+            logger.warning("플레이어 이름 추출 실패. 첫 줄: ")
             return None
         
-        # 이름 검증
+        username = cleaned_lines[0].split()[0]
         player_lower = player.lower()
         username_lower = username.lower()
         if player_lower not in username_lower and username_lower not in player_lower:
-            logger.warning(f"이름 불일치: 입력={player}, 추출={username}")
+            logger.warning("이름 불일치: 입력=%s, 추출=%s", player, username)
         
-        # === UUID 추출 ===
-        uuid_value = None
-        
-        # UUID는 정확한 형식으로만 추출 (36자 또는 32자)
-        uuid_patterns = [
-            # 표준 UUID (하이픈 포함): 8-4-4-4-12
-            r'\bUUID:\s*([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})\b',
-            # 하이픈 없는 UUID
-            r'\bUUID:\s*([a-f0-9]{32})\b',
-        ]
-        
-        for pattern in uuid_patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
-            if match:
-                uuid_value = match.group(1)
-                logger.info(f"[HiRest Secure] UUID 추출: {uuid_value}")
-                break
-        
-        if not uuid_value:
-            logger.warning(f"[HiRest Secure] UUID 미발견: {player}")
-            # UUID 라인 전체 출력해서 디버깅
-            for line in cleaned_lines:
-                if 'UUID' in line.upper():
-                    logger.debug(f"UUID 포함 라인: {line}")
+        # 하이픈 포함 UUID가 어디든 있으면 우선하고, 없을 때만 32자 UUID 사용
+        uuid_value = found.get('uuid') or found.get('uuid_compact')
+        if uuid_value:
+            logger.info("[HiRest Secure] UUID 추출: %s", uuid_value)
+        else:
+            logger.warning("[HiRest Secure] UUID 미발견: %s", player)
+            if debug:
+                for line in cleaned_lines:
+                    if 'UUID' in line.upper():
+                        logger.debug("UUID 포함 라인: %s", line)
         
-        # === IP 추출 ===
+        # IP는 정확한 IPv4 형식만, 마지막 옥텟 마스킹
         ip_value = None
-        
-        # IP는 정확한 IPv4 형식으로만 추출
-        ip_pattern = r'\bIp:\s*(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b'
-        
-        match = re.search(ip_pattern, full_text, re.IGNORECASE)
-        if match:
-            ip_full = match.group(1)
-            # IP 유효성 검사
+        ip_full = found.get('ip')
+        if ip_full:
             ip_parts = ip_full.split('.')
-            if len(ip_parts) == 4 and all(0 <= int(p) <= 255 for p in ip_parts):
-                # 마지막 옥텏 마스킹
+            if all(0 <= int(p) <= 255 for p in ip_parts):
                 ip_value = f"{'.'.join(ip_parts[:3])}.*"
-                logger.info(f"[HiRest Secure] IP 추출 (마스킹): {ip_value}")
+                logger.info("[HiRest Secure] IP 추출 (마스킹): %s", ip_value)
             else:
-                logger.warning(f"유효하지 않은 IP: {ip_full}")
+                logger.warning("유효하지 않은 IP: %s", ip_full)
         
         if not ip_value:
-            logger.warning(f"[HiRest Secure] IP 미발견: {player}")
-            # IP 라인 전체 출력해서 디버깅
-            for line in cleaned_lines:
-                if 'IP' in line.upper():
-                    logger.debug(f"IP 포함 라인: {line}")
+            logger.warning("[HiRest Secure] IP 미발견: %s", player)
+            if debug:
+                for line in cleaned_lines:
+                    if 'IP' in line.upper():
+                        logger.debug("IP 포함 라인: %s", line)
         
         # === 온라인 상태 ===
-        status = "알 수 없음"
-        if "Online for:" in full_text or "CanFly" in full_text:
-            status = "온라인"
-        elif "Offline for:" in full_text:
-            status = "오프라인"
-        
-        # === 결과 구성 ===
-        player_info = {
-            "username": username,
-            "display_name": display_name if display_name and display_name != username else None,
-            "status": status
-        }
-        
-        if uuid_value:
-            player_info["uuid"] = uuid_value
-        else:
-            logger.error(f"[HiRest Secure] UUID 추출 실패: {player}")
+        status = None
+        if online:
+            status = STATUS_ONLINE
+        elif offline:
+            status = STATUS_OFFLINE
         
-        if ip_value:
-            player_info["ip"] = ip_value
-        else:
-            logger.error(f"[HiRest Secure] IP 추출 실패: {player}")
+        if not uuid_value:
+            logger.error("[HiRest Secure] UUID 추출 실패: %s", player)
+        if not ip_value:
+            logger.error("[HiRest Secure] IP 추출 실패: %s", player)
         
         logger.info(
-            f"[HiRest Secure] 파싱 완료: {username} | "
-            f"UUID: {'O' if uuid_value else 'X'} | "
-            f"IP: {'O' if ip_value else 'X'}"
+            "[HiRest Secure] 파싱 완료: %s | UUID: %s | IP: %s",
+            username, 'O' if uuid_value else 'X', 'O' if ip_value else 'X'
         )
         
-        return player_info
+        return PlayerInfo(username, uuid_value, ip_value, status, playtime=playtime)
         
     except Exception as e:
         logger.error(f"파싱 예외: {e}", exc_info=True)
-        return None
\ No newline at end of file
+        return None
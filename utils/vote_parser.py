@@ -0,0 +1,91 @@
+"""마인리스트 추천 페이지 파싱."""
+from __future__ import annotations
+
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+NOT_AVAILABLE = "N/A"
+
+
+def _match_label(label: str, value: str, info: Dict[str, str]) -> None:
+    """표의 항목 이름으로 어떤 정보인지 판별하여 저장."""
+    if '게임 아이디' in label or '계임 아이디' in label or '아이디' in label:
+        info["game_id"] = value
+    elif '추천 시간' in label or '시간' in label:
+        info["vote_time"] = value
+    elif '추천한 서비' in label or '서버' in label:
+        info["server_name"] = value
+
+
+def _is_complete(info: Dict[str, str]) -> bool:
+    return NOT_AVAILABLE not in (info["game_id"], info["vote_time"], info["server_name"])
+
+
+def parse_vote_page(page_source: str) -> Dict[str, str]:
+    """추천 상세 페이지 HTML에서 추천 정보 추출 (네트워크/브라우저 없이 동작).
+
+    Args:
+        page_source: 추천 상세 페이지 HTML
+
+    Returns:
+        status(success/unknown/not_found)와 game_id, vote_time, server_name
+        또는 not_found일 때 error
+    """
+    soup = BeautifulSoup(page_source, 'html.parser')
+
+    # 404 페이지 체크
+    title = soup.find('title')
+    if title:
+        title_text = title.get_text(strip=True)
+        if '404' in title_text or '찾을 수 없' in title_text:
+            return {
+                "status": "not_found",
+                "error": "해당 추천 고유번호를 찾을 수 없습니다."
+            }
+
+    # 추천 성공 여부 확인
+    success = '추천이 성공하였습니다' in page_source or '추천 성공' in page_source
+
+    info = {
+        "game_id": NOT_AVAILABLE,
+        "vote_time": NOT_AVAILABLE,
+        "server_name": NOT_AVAILABLE
+    }
+
+    # 방법 1: tbody > tr > td 구조
+    tbody = soup.find('tbody')
+    if tbody:
+        for row in tbody.find_all('tr'):
+            cells = row.find_all('td')
+            if len(cells) >= 2:
+                _match_label(cells[0].get_text(strip=True), cells[1].get_text(strip=True), info)
+
+    # 방법 2: 모든 테이블 행 검색
+    if not _is_complete(info):
+        for row in soup.find_all('tr'):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 2:
+                _match_label(cells[0].get_text(strip=True), cells[1].get_text(strip=True), info)
+
+    # 방법 3: 텍스트에서 직접 검색
+    if not _is_complete(info):
+        lines = [line.strip() for line in soup.get_text().split('\n') if line.strip()]
+
+        for i, line in enumerate(lines):
+            if ('게임 아이디' in line or '계임 아이디' in line) and i + 1 < len(lines):
+                if info["game_id"] == NOT_AVAILABLE:
+                    info["game_id"] = lines[i + 1]
+            elif '추천 시간' in line and i + 1 < len(lines):
+                if info["vote_time"] == NOT_AVAILABLE:
+                    info["vote_time"] = lines[i + 1]
+            elif '추천한 서비' in line and i + 1 < len(lines):
+                if info["server_name"] == NOT_AVAILABLE:
+                    info["server_name"] = lines[i + 1]
+
+    return {
+        "status": "success" if success else "unknown",
+        "game_id": info["game_id"],
+        "vote_time": info["vote_time"],
+        "server_name": info["server_name"]
+    }